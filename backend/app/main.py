@@ -1,19 +1,83 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Depends,Form
-from pydantic import BaseModel
-from typing import List
+from fastapi import FastAPI, BackgroundTasks, HTTPException, UploadFile, File, Depends, Form, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from app.services.jwt_dependency import get_current_user
+from app.services.jwt_dependency import get_current_user, get_admin_user, is_recruiter
 from fastapi.middleware.cors import CORSMiddleware
-import shutil
+import asyncio
 import os
-
-from app.services.recommendation_engine import recommend_careers
-from app.services.resume_parser.resume_service import process_resume
+import json
+import time
+from contextlib import asynccontextmanager
+
+from app.services.recommendation_engine import (
+    recommend_careers,
+    recommend_careers_batch,
+    DEFAULT_TOP_K,
+    MAX_TOP_K,
+    DEFAULT_BATCH_CHUNK,
+    MAX_BATCH_PROFILES
+)
+from app.services.recommendation_cache import recommendation_cache
+from app.services.career_transition import (
+    DEFAULT_MAX_HOPS,
+    DEFAULT_LIMIT as DEFAULT_TRANSITION_LIMIT
+)
+from app.services.catalog_snapshot import (
+    CatalogPathRejected,
+    get_snapshot,
+    pin_snapshot,
+    snapshot_holder,
+    start_catalog_watcher
+)
+from app.services.resume_parser.resume_service import process_resume_async
+from app.services.resume_parser.pdf_backends import PdfBackendName
+from app.services.resume_parser.parse_cache import parse_cache
+from app.services.resume_parser import timing
+from app.services.resume_parser.timing import timing_metrics
+from app.services.resume_jobs import (
+    TERMINAL_STATES,
+    get_job,
+    job_to_dict,
+    job_worker,
+    submit_job
+)
+from app.services.job_matching import (
+    DEFAULT_TOP_K as DEFAULT_MATCH_TOP_K,
+    MAX_TOP_K as MAX_MATCH_TOP_K,
+    JobMatchMatrix,
+    MatchTooLarge,
+    check_match_size
+)
+from app.services.candidate_store import (
+    DEFAULT_PAGE_SIZE as DEFAULT_CANDIDATE_PAGE_SIZE,
+    MAX_PAGE_SIZE as MAX_CANDIDATE_PAGE_SIZE,
+    CandidateQuery,
+    InvalidCursor,
+    save_candidate,
+    search_candidates
+)
+from app.services.resume_parser.uploads import (
+    SpooledUpload,
+    UploadTooLarge,
+    check_content_length,
+    receive_upload
+)
+from app.services.resume_parser.parse_pool import (
+    RETRY_AFTER_SECONDS,
+    ParseFailed,
+    ParseTimeout,
+    PoolBusy,
+    parse_pool
+)
 
 # Database
 from app.database import engine, SessionLocal, Base
-from app.models import RecommendationHistory, User
+from app.models import RecommendationHistory, ResumeJob, User
 from app.services.auth_service import hash_password, verify_password, create_access_token
 
 
@@ -44,6 +108,43 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def add_catalog_version(request, call_next):
+    # The header names the snapshot the handler used, not whatever is
+    # published by the time the response goes out
+    with pin_snapshot() as snapshot:
+        response = await call_next(request)
+
+    response.headers["X-Catalog-Version"] = snapshot.version
+    return response
+
+
+@app.middleware("http")
+async def add_server_timing(request, call_next):
+    # Resume pipeline stages run under this request's timer
+    with timing.collect() as timer:
+        response = await call_next(request)
+
+    if timer is not None and timer.stages:
+        response.headers["Server-Timing"] = timer.server_timing()
+        timing_metrics.record(timer)
+
+    return response
+
+
+@app.middleware("http")
+async def reject_oversized_uploads(request, call_next):
+    # Form parsing spools the whole body before any handler runs, so
+    # oversized uploads are turned away on their declared length instead
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        try:
+            check_content_length(request.headers.get("content-length"))
+        except UploadTooLarge as error:
+            return JSONResponse(status_code=413, content={"detail": str(error)})
+
+    return await call_next(request)
+
+
 # ----------------------------
 # Create Tables
 # ----------------------------
@@ -51,10 +152,81 @@ Base.metadata.create_all(bind=engine)
 
 
 # ----------------------------
-# Upload Folder
+# Catalog Watcher
 # ----------------------------
-UPLOAD_FOLDER = "uploaded_resumes"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+@app.on_event("startup")
+def start_catalog_reload_watcher():
+    # Built before serving, not by the first request on the event loop
+    snapshot_holder.get()
+    start_catalog_watcher()
+
+
+@app.on_event("shutdown")
+def stop_catalog_reload_watcher():
+    snapshot_holder.stop_watching()
+
+
+# ----------------------------
+# Resume Parser Pool
+# ----------------------------
+@app.on_event("startup")
+def start_parse_pool():
+    # Workers load spaCy now instead of on the first upload
+    parse_pool.start()
+
+
+@app.on_event("shutdown")
+def stop_parse_pool():
+    parse_pool.close()
+
+
+# ----------------------------
+# Resume Job Worker
+# ----------------------------
+@app.on_event("startup")
+def start_resume_job_worker():
+    job_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_resume_job_worker():
+    job_worker.stop()
+
+
+# ----------------------------
+# Upload Handling
+# ----------------------------
+@asynccontextmanager
+async def read_resume_upload(file: UploadFile):
+    try:
+        async with receive_upload(file) as upload:
+            if upload.size == 0:
+                raise HTTPException(status_code=400, detail="Empty upload")
+            yield upload
+    except UploadTooLarge as error:
+        raise HTTPException(status_code=413, detail=str(error))
+
+
+async def parse_upload(upload: SpooledUpload, job_skills: Optional[List[str]], pdf_backend: Optional[str]) -> dict:
+
+    try:
+        # Parsing runs on parse_pool; no threadpool thread waits for it
+        return await process_resume_async(
+            upload.source,
+            job_skills,
+            pdf_backend,
+            upload.digest
+        )
+    except PoolBusy as error:
+        raise HTTPException(
+            status_code=503,
+            detail=str(error),
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+        )
+    except ParseTimeout as error:
+        raise HTTPException(status_code=504, detail=str(error))
+    except ParseFailed as error:
+        raise HTTPException(status_code=422, detail=f"Could not parse resume: {error}")
 
 
 # ----------------------------
@@ -66,15 +238,59 @@ class UserInput(BaseModel):
     interests: List[str]
     career_mode: str
     risk_preference: str
+
+class BatchRecommendRequest(BaseModel):
+    profiles: List[UserInput] = Field(..., max_length=MAX_BATCH_PROFILES)
+    top_k: int = Field(DEFAULT_TOP_K, ge=1, le=MAX_TOP_K)
+    chunk_size: int = Field(DEFAULT_BATCH_CHUNK, ge=1, le=1024)
+    # "skip": no history rows, "bulk": one bulk insert per chunk
+    history: Literal["skip", "bulk"] = "skip"
+
+class CatalogReloadRequest(BaseModel):
+    # Defaults to CAREER_CATALOG_PATH
+    path: Optional[str] = None
+
 class TransitionRequest(BaseModel):
     current_career: str
     skills: List[str]
+    max_hops: int = Field(DEFAULT_MAX_HOPS, ge=1, le=6)
+    limit: int = Field(DEFAULT_TRANSITION_LIMIT, ge=1, le=50)
+
+class SkillSet(BaseModel):
+    id: str
+    skills: List[str]
+
+class JobMatchRequest(BaseModel):
+    candidates: List[SkillSet]
+    jobs: List[SkillSet]
+    top_k: int = Field(DEFAULT_MATCH_TOP_K, ge=1, le=MAX_MATCH_TOP_K)
 
 class AuthRequest(BaseModel):
     email: str
     password: str
 
 
+# ----------------------------
+# History Records
+# ----------------------------
+
+def build_history_record(user_id: int, user_input: dict, result: dict) -> RecommendationHistory:
+    primary = result["primary_recommendation"] or {}
+    backup = result["backup_recommendation"] or {}
+
+    return RecommendationHistory(
+        user_id=user_id,
+        skills=", ".join(user_input["skills"]),
+        interests=", ".join(user_input["interests"]),
+        career_mode=user_input["career_mode"],
+        risk_preference=user_input["risk_preference"],
+        primary_career=primary.get("career"),
+        backup_career=backup.get("career"),
+        primary_score=primary.get("match_score"),
+        backup_score=backup.get("match_score"),
+    )
+
+
 # ----------------------------
 # Health Check
 # ----------------------------
@@ -137,17 +353,16 @@ def login(user: AuthRequest):
 @app.post("/upload-resume")
 async def upload_resume(
     file: UploadFile = File(...),
-    job_skills: str = Form("")
+    job_skills: str = Form(""),
+    pdf_backend: Optional[PdfBackendName] = Form(None)
 ):
 
-    file_path = os.path.join("uploaded_resumes", file.filename)
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
     skills_list = [s.strip() for s in job_skills.split(",")] if job_skills else []
 
-    parsed_data = process_resume(file_path, skills_list)
+    # Anonymous uploads are parsed only; candidates come from signed-in
+    # uploads, resume jobs and bulk ingest
+    async with read_resume_upload(file) as upload:
+        parsed_data = await parse_upload(upload, skills_list, pdf_backend)
 
     return parsed_data
 
@@ -160,20 +375,22 @@ async def upload_resume(
 # ----------------------------
 @app.post("/upload-and-recommend")
 async def upload_and_recommend(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     career_mode: str = "growth",
     risk_preference: str = "medium",
+    top_k: int = Query(DEFAULT_TOP_K, ge=1, le=MAX_TOP_K),
+    pdf_backend: Optional[PdfBackendName] = None,
     current_user: User = Depends(get_current_user)
 ):
 
-    # 1️⃣ Save file
-    file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # 1️⃣ Receive file, 2️⃣ Parse resume
+    async with read_resume_upload(file) as upload:
+        parsed_data = await parse_upload(upload, None, pdf_backend)
 
-    # 2️⃣ Parse resume
-    parsed_data = process_resume(file_path)
+    # Stored after the response goes out, so a database error there does
+    # not fail a parse that already succeeded
+    background_tasks.add_task(save_candidate, parsed_data, upload.digest, current_user.id)
 
     # 3️⃣ Prepare recommendation input
     user_input = {
@@ -184,22 +401,12 @@ async def upload_and_recommend(
     }
 
     # 4️⃣ Generate recommendation
-    result = recommend_careers(user_input)
+    result = recommend_careers(user_input, top_k=top_k)
 
     # 5️⃣ Save to database
     db = SessionLocal()
     try:
-        new_record = RecommendationHistory(
-            user_id=current_user.id,
-            skills=", ".join(parsed_data.get("skills", [])),
-            interests="",
-            career_mode=career_mode,
-            risk_preference=risk_preference,
-            primary_career=result["primary_recommendation"]["career"],
-            backup_career=result["backup_recommendation"]["career"],
-            primary_score=result["primary_recommendation"]["match_score"],
-            backup_score=result["backup_recommendation"]["match_score"],
-        )
+        new_record = build_history_record(current_user.id, user_input, result)
 
         db.add(new_record)
         db.commit()
@@ -214,31 +421,209 @@ async def upload_and_recommend(
     }
 
 
+# ----------------------------
+# Resume Jobs
+# ----------------------------
+# Seconds between job state checks on an open event stream
+JOB_EVENT_POLL_SECONDS = 0.5
+
+# An event stream closes after this long even if the job has not
+# finished; clients reconnect or poll /jobs/{job_id}
+JOB_EVENT_TIMEOUT_SECONDS = float(os.getenv("RESUME_JOB_EVENT_TIMEOUT", "300"))
+
+
+@app.post("/jobs/resume", status_code=202)
+async def submit_resume_job(
+    file: UploadFile = File(...),
+    job_skills: str = Form(""),
+    pdf_backend: Optional[PdfBackendName] = Form(None),
+    current_user: User = Depends(get_current_user)
+):
+
+    skills_list = [s.strip() for s in job_skills.split(",")] if job_skills else []
+
+    async with read_resume_upload(file) as upload:
+        content = await run_in_threadpool(upload.getvalue)
+
+        job, coalesced = await run_in_threadpool(
+            submit_job,
+            content,
+            upload.digest,
+            skills_list,
+            pdf_backend,
+            current_user.id
+        )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "coalesced": coalesced
+    }
+
+
+def find_job(job_id: str, user_id: int) -> ResumeJob:
+    job = get_job(job_id)
+
+    # Other users' jobs look the same as missing ones
+    if job is None or job.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
+
+
+@app.get("/jobs/{job_id}")
+def get_resume_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    return job_to_dict(find_job(job_id, current_user.id))
+
+
+@app.get("/jobs/{job_id}/events")
+async def resume_job_events(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Server-Sent Events: a "status" event on every state change, ending
+    with the finished job, or with a "timeout" event once
+    JOB_EVENT_TIMEOUT_SECONDS have passed.
+    """
+
+    job = await run_in_threadpool(find_job, job_id, current_user.id)
+
+    async def events():
+        current = job
+        last_status = None
+        deadline = time.monotonic() + JOB_EVENT_TIMEOUT_SECONDS
+
+        while True:
+            if current.status != last_status:
+                last_status = current.status
+                payload = json.dumps(jsonable_encoder(job_to_dict(current)))
+                yield f"event: status\ndata: {payload}\n\n"
+
+            if current.status in TERMINAL_STATES:
+                return
+
+            if time.monotonic() >= deadline:
+                payload = json.dumps(jsonable_encoder(job_to_dict(current)))
+                yield f"event: timeout\ndata: {payload}\n\n"
+                return
+
+            await asyncio.sleep(JOB_EVENT_POLL_SECONDS)
+            current = await run_in_threadpool(find_job, job_id, current_user.id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+# ----------------------------
+# Candidate Search
+# ----------------------------
+def split_skills(value: str) -> List[str]:
+    return [s.strip() for s in value.split(",")] if value else []
+
+
+@app.get("/candidates/search")
+def candidate_search(
+    all: str = Query("", description="Comma-separated skills a candidate must have"),
+    any: str = Query("", description="Comma-separated skills; at least one required"),
+    none: str = Query("", description="Comma-separated skills a candidate must not have"),
+    rank: str = Query("", description="Comma-separated skills to rank by (most matched first)"),
+    limit: int = Query(DEFAULT_CANDIDATE_PAGE_SIZE, ge=1, le=MAX_CANDIDATE_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Recruiters and admins search every candidate, with contact details.
+    Everyone else searches the resumes they uploaded, without them.
+    """
+
+    query = CandidateQuery.parse(split_skills(all), split_skills(any), split_skills(none), split_skills(rank))
+    recruiter = is_recruiter(current_user)
+
+    try:
+        return search_candidates(
+            query,
+            owner=None if recruiter else current_user.id,
+            limit=limit,
+            cursor=cursor,
+            include_contact=recruiter
+        )
+    except InvalidCursor as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+
+# ----------------------------
+# Job Matching (Many to Many)
+# ----------------------------
+def ranked(ids: List[str], indexes, scores) -> List[dict]:
+    return [
+        {"id": ids[index], "match_score": int(score)}
+        for index, score in zip(indexes.tolist(), scores.tolist())
+    ]
+
+
+@app.post("/match/jobs")
+def match_jobs(
+    request: JobMatchRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Scores every candidate against every job (match_score, as in
+    job_match) and ranks both ways. Requests over the size caps in
+    job_matching get 413. A plain def, so the scoring runs on the
+    threadpool rather than the event loop.
+    """
+
+    try:
+        check_match_size(len(request.candidates), len(request.jobs))
+    except MatchTooLarge as error:
+        raise HTTPException(status_code=413, detail=str(error))
+
+    matrix = JobMatchMatrix(
+        [candidate.skills for candidate in request.candidates],
+        [job.skills for job in request.jobs]
+    )
+
+    candidate_ids = [candidate.id for candidate in request.candidates]
+    job_ids = [job.id for job in request.jobs]
+
+    top_job_indexes, top_job_scores = matrix.top_jobs(request.top_k)
+    top_candidate_indexes, top_candidate_scores = matrix.top_candidates(request.top_k)
+
+    return {
+        "candidates": [
+            {"id": candidate_id, "top_jobs": ranked(job_ids, top_job_indexes[row], top_job_scores[row])}
+            for row, candidate_id in enumerate(candidate_ids)
+        ],
+        "jobs": [
+            {"id": job_id, "top_candidates": ranked(candidate_ids, top_candidate_indexes[row], top_candidate_scores[row])}
+            for row, job_id in enumerate(job_ids)
+        ]
+    }
+
+
 # ----------------------------
 # Recommend (Manual Form)
 # ----------------------------
 @app.post("/recommend")
 def recommend(
     user: UserInput,
+    top_k: int = Query(DEFAULT_TOP_K, ge=1, le=MAX_TOP_K),
     current_user: User = Depends(get_current_user)
 ):
 
 
-    result = recommend_careers(user.dict())
+    result = recommend_careers(user.dict(), top_k=top_k)
     db = SessionLocal()
 
     try:
-        new_record = RecommendationHistory(
-            user_id=current_user.id,
-            skills=", ".join(user.skills),
-            interests=", ".join(user.interests),
-            career_mode=user.career_mode,
-            risk_preference=user.risk_preference,
-            primary_career=result["primary_recommendation"]["career"],
-            backup_career=result["backup_recommendation"]["career"],
-            primary_score=result["primary_recommendation"]["match_score"],
-            backup_score=result["backup_recommendation"]["match_score"],
-        )
+        new_record = build_history_record(current_user.id, user.dict(), result)
 
         db.add(new_record)
         db.commit()
@@ -249,6 +634,114 @@ def recommend(
     return result
 
 
+# ----------------------------
+# Recommend (Batch)
+# ----------------------------
+@app.post("/recommend/batch")
+def recommend_batch(
+    batch: BatchRecommendRequest,
+    current_user: User = Depends(get_current_user)
+):
+
+    user_inputs = [profile.dict() for profile in batch.profiles]
+    user_id = current_user.id
+
+    def stream_results():
+        db = SessionLocal() if batch.history == "bulk" else None
+        pending = []
+
+        try:
+            results = recommend_careers_batch(
+                user_inputs,
+                top_k=batch.top_k,
+                chunk_size=batch.chunk_size
+            )
+
+            for index, result in enumerate(results):
+                if db is not None:
+                    pending.append(
+                        build_history_record(user_id, user_inputs[index], result)
+                    )
+
+                    if len(pending) >= batch.chunk_size:
+                        db.add_all(pending)
+                        db.commit()
+                        pending = []
+
+                yield json.dumps({"index": index, **result}) + "\n"
+
+            if db is not None and pending:
+                db.add_all(pending)
+                db.commit()
+
+        finally:
+            if db is not None:
+                db.close()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+# ----------------------------
+# Recommendation Cache Stats
+# ----------------------------
+@app.get("/recommend/cache-stats")
+def recommend_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    return recommendation_cache.stats()
+
+
+@app.get("/resume/cache-stats")
+def resume_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    return parse_cache.stats()
+
+
+@app.get("/resume/timing-stats")
+def resume_timing_stats(
+    current_user: User = Depends(get_current_user)
+):
+    # Stage latency histograms by page and text-length bucket
+    return timing_metrics.stats()
+
+
+@app.get("/resume/pool-stats")
+def resume_pool_stats(
+    current_user: User = Depends(get_current_user)
+):
+    return parse_pool.stats()
+
+
+# ----------------------------
+# Catalog Admin
+# ----------------------------
+@app.get("/admin/catalog")
+def catalog_status(
+    current_user: User = Depends(get_admin_user)
+):
+    return snapshot_holder.status()
+
+
+@app.post("/admin/catalog/reload", status_code=202)
+def reload_catalog(
+    request: CatalogReloadRequest = None,
+    current_user: User = Depends(get_admin_user)
+):
+
+    # Builds the new snapshot in the background; serving is never blocked.
+    # The other workers pick the request up on their next watcher poll.
+    try:
+        started = snapshot_holder.broadcast_reload(request.path if request else None)
+    except CatalogPathRejected as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+    return {
+        "reload_started": started,
+        **snapshot_holder.status()
+    }
+
+
 # ----------------------------
 # History
 # ----------------------------
@@ -294,44 +787,20 @@ def get_recommendation_history(
 @app.post("/career-transition")
 def career_transition(data: TransitionRequest):
 
-    transition_map = {
-        "mechanical engineer": [
-            "Robotics Engineer",
-            "Data Analyst",
-            "ML Engineer"
-        ],
-
-        "civil engineer": [
-            "Data Analyst",
-            "Project Manager"
-        ],
-
-        "accountant": [
-            "Financial Analyst",
-            "Data Analyst"
-        ],
-
-        "teacher": [
-            "Instructional Designer",
-            "Data Analyst"
-        ],
-
-        "software developer": [
-            "ML Engineer",
-            "Data Scientist"
-        ]
-    }
-
-    career = data.current_career.lower()
+    snapshot = get_snapshot()
 
-    results = transition_map.get(
-        career,
-        ["Data Analyst", "Product Manager"]
+    paths = snapshot.transitions.transitions(
+        data.current_career,
+        data.skills,
+        max_hops=data.max_hops,
+        limit=data.limit
     )
 
     return {
         "current_career": data.current_career,
-        "recommended_transitions": results
+        "recommended_transitions": [path["career"] for path in paths],
+        "transition_paths": paths,
+        "catalog_version": snapshot.version
     }
 # ----------------------------
 # Delete History
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Float, Text, DateTime
 from sqlalchemy.sql import func
 from app.database import Base
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -38,6 +38,83 @@ class RecommendationHistory(Base):
     user = relationship("User", back_populates="recommendations")
 
 
+class ResumeJob(Base):
+    __tablename__ = "resume_jobs"
 
-    
+    id = Column(String(32), primary_key=True)
 
+    # queued -> running -> done | failed
+    status = Column(String, index=True, default="queued")
+
+    # Identical submissions share a job
+    dedupe_key = Column(String, index=True)
+    content_hash = Column(String(64))
+    pdf_backend = Column(String)
+    job_skills = Column(Text)
+
+    # Uploaded PDF, dropped once the job finishes
+    content = Column(LargeBinary)
+
+    result = Column(Text)
+    error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    # Refreshed while a worker is running the job
+    heartbeat_at = Column(DateTime)
+
+    user_id = Column(Integer, ForeignKey("users.id"))
+
+
+class Candidate(Base):
+    __tablename__ = "candidates"
+
+    # Keyset pagination walks candidates in id order
+    id = Column(Integer, primary_key=True)
+
+    # One row per distinct resume file and owner
+    content_hash = Column(String(64), index=True)
+
+    name = Column(String)
+    email = Column(String, index=True)
+    phone = Column(String)
+    resume_score = Column(Float)
+
+    # Full parse_resume_file result as JSON
+    profile = Column(Text)
+    parser_version = Column(String)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    # Uploader; None for bulk-ingested resumes
+    user_id = Column(Integer, ForeignKey("users.id"))
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "content_hash", name="uq_candidates_owner_content"),
+        # One user's candidates in id order
+        Index("ix_candidates_owner", "user_id", "id"),
+    )
+
+
+class CandidateSkill(Base):
+    """
+    Inverted skill index: the primary key orders each skill's posting
+    list by candidate id, the second index looks up a candidate's skills
+    and the third orders one owner's posting lists.
+    """
+
+    __tablename__ = "candidate_skills"
+
+    skill = Column(String, primary_key=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), primary_key=True)
+
+    # Copy of the candidate's user_id
+    user_id = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_candidate_skills_candidate", "candidate_id", "skill"),
+        Index("ix_candidate_skills_owner", "user_id", "skill", "candidate_id"),
+    )
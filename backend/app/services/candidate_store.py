@@ -0,0 +1,410 @@
+# candidate_store.py
+
+import heapq
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Candidate, CandidateSkill
+from app.services.resume_parser.parse_cache import PARSER_VERSION
+from app.services.skill_canonicalizer import canonical_skills
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Candidate ids fetched per posting-list page
+POSTINGS_BATCH = 512
+
+# Candidates whose skills are checked per query
+VERIFY_BATCH = 256
+
+# Skill frequencies only pick the cheapest posting list, so counting
+# stops here; anything this common is "common"
+FREQUENCY_CAP = 5000
+
+# Fields of a parse result that describe the request, not the resume
+REQUEST_FIELDS = ("job_match", "source", "content_hash")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# ----------------------------
+# Storage
+# ----------------------------
+
+def upsert_candidate(db: Session, result: Dict, digest: str, user_id: Optional[int] = None) -> int:
+    """
+    Stores one parsed resume keyed by (user_id, content hash). A re-parse
+    of the same file by the same user updates the row in place and keeps
+    its id; another user uploading it gets a row of their own.
+    """
+
+    profile = {key: value for key, value in result.items() if key not in REQUEST_FIELDS}
+    skills = canonical_skills(profile.get("skills") or [])
+
+    candidate = db.query(Candidate).filter(
+        Candidate.content_hash == digest,
+        Candidate.user_id == user_id
+    ).first()
+
+    if candidate is None:
+        candidate = Candidate(content_hash=digest, user_id=user_id)
+        db.add(candidate)
+        db.flush()
+    else:
+        db.query(CandidateSkill).filter(
+            CandidateSkill.candidate_id == candidate.id
+        ).delete(synchronize_session=False)
+
+    candidate.name = profile.get("name")
+    candidate.email = profile.get("email")
+    candidate.phone = profile.get("phone")
+    candidate.resume_score = profile.get("resume_score")
+    candidate.profile = json.dumps(profile)
+    candidate.parser_version = PARSER_VERSION
+    candidate.updated_at = datetime.utcnow()
+
+    db.add_all([
+        CandidateSkill(skill=skill, candidate_id=candidate.id, user_id=user_id)
+        for skill in skills
+    ])
+
+    return candidate.id
+
+
+def save_candidates(items: Iterable[Tuple[Dict, str]], user_id: Optional[int] = None) -> List[int]:
+    """
+    Stores (result, content hash) pairs in one transaction.
+    """
+
+    items = list(items)
+    db = SessionLocal()
+
+    try:
+        for attempt in range(2):
+            try:
+                ids = [upsert_candidate(db, result, digest, user_id) for result, digest in items]
+                db.commit()
+                return ids
+            except IntegrityError:
+                # Another writer inserted the same resume first; it is an
+                # update now
+                db.rollback()
+                if attempt:
+                    raise
+    finally:
+        db.close()
+
+
+def save_candidate(result: Dict, digest: str, user_id: Optional[int] = None) -> int:
+    return save_candidates([(result, digest)], user_id)[0]
+
+
+# ----------------------------
+# Queries
+# ----------------------------
+
+class CandidateQuery(NamedTuple):
+    """
+    Boolean filters (all / any / none) and an optional ranking: with
+    rank skills, results are ordered by how many of them a candidate
+    has, then by id. Ranking only orders; candidates with none of the
+    rank skills still match, last.
+    """
+
+    all: List[str]
+    any: List[str]
+    none: List[str]
+    rank: List[str]
+
+    @classmethod
+    def parse(cls, all: List[str], any: List[str], none: List[str], rank: List[str]) -> "CandidateQuery":
+        return cls(canonical_skills(all), canonical_skills(any), canonical_skills(none), canonical_skills(rank))
+
+    def skills(self) -> List[str]:
+        return sorted(set(self.all) | set(self.any) | set(self.none) | set(self.rank))
+
+    def matches(self, skills: Set[str]) -> bool:
+        return (
+            all(skill in skills for skill in self.all)
+            and (not self.any or any(skill in skills for skill in self.any))
+            and not any(skill in skills for skill in self.none)
+        )
+
+    def rank_score(self, skills: Set[str]) -> int:
+        return sum(skill in skills for skill in self.rank)
+
+
+def parse_cursor(cursor: Optional[str], ranked: bool) -> Tuple[Optional[int], int]:
+    # "<id>" for boolean queries, "<level>:<id>" for ranked ones
+    if not cursor:
+        return None, 0
+
+    try:
+        if ranked:
+            level, after = cursor.split(":")
+            return int(level), int(after)
+        return None, int(cursor)
+    except ValueError:
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+
+
+def make_cursor(level: Optional[int], after: int) -> str:
+    return str(after) if level is None else f"{level}:{after}"
+
+
+# ----------------------------
+# Posting Lists
+# ----------------------------
+
+# owner scopes a query to one user's candidates; None searches them all
+
+def postings(db: Session, skill: str, after: int, owner: Optional[int] = None) -> Iterator[int]:
+    # Candidate ids with skill, ascending, read a page at a time
+    while True:
+        query = db.query(CandidateSkill.candidate_id).filter(
+            CandidateSkill.skill == skill,
+            CandidateSkill.candidate_id > after
+        )
+        if owner is not None:
+            query = query.filter(CandidateSkill.user_id == owner)
+
+        ids = [row[0] for row in query.order_by(CandidateSkill.candidate_id).limit(POSTINGS_BATCH)]
+
+        yield from ids
+
+        if len(ids) < POSTINGS_BATCH:
+            return
+        after = ids[-1]
+
+
+def all_candidates(db: Session, after: int, owner: Optional[int] = None) -> Iterator[int]:
+    while True:
+        query = db.query(Candidate.id).filter(Candidate.id > after)
+        if owner is not None:
+            query = query.filter(Candidate.user_id == owner)
+
+        ids = [row[0] for row in query.order_by(Candidate.id).limit(POSTINGS_BATCH)]
+
+        yield from ids
+
+        if len(ids) < POSTINGS_BATCH:
+            return
+        after = ids[-1]
+
+
+def union(streams: List[Iterator[int]]) -> Iterator[int]:
+    last = None
+
+    for candidate_id in heapq.merge(*streams):
+        if candidate_id != last:
+            last = candidate_id
+            yield candidate_id
+
+
+def skill_frequencies(db: Session, skills: List[str], owner: Optional[int] = None) -> Dict[str, int]:
+    frequencies = {}
+
+    for skill in skills:
+        query = db.query(CandidateSkill.candidate_id).filter(CandidateSkill.skill == skill)
+        if owner is not None:
+            query = query.filter(CandidateSkill.user_id == owner)
+
+        capped = query.limit(FREQUENCY_CAP).subquery()
+        frequencies[skill] = db.query(func.count()).select_from(capped).scalar()
+
+    return frequencies
+
+
+def skills_of(db: Session, candidate_ids: List[int], skills: List[str]) -> Dict[int, Set[str]]:
+    # Each candidate's skills, restricted to the ones the query mentions
+    found: Dict[int, Set[str]] = {candidate_id: set() for candidate_id in candidate_ids}
+
+    if skills:
+        rows = (
+            db.query(CandidateSkill.candidate_id, CandidateSkill.skill)
+            .filter(CandidateSkill.candidate_id.in_(candidate_ids), CandidateSkill.skill.in_(skills))
+        )
+        for candidate_id, skill in rows:
+            found[candidate_id].add(skill)
+
+    return found
+
+
+# ----------------------------
+# Search
+# ----------------------------
+
+class CandidateSearch:
+    """
+    Candidate search over the inverted skill index.
+
+    Every query walks one id-ordered stream that is a superset of its
+    results: the posting list of the rarest "all" skill, the union of the
+    "any" lists, or for ranked level m (candidates with exactly m rank
+    skills) the union of the (len(rank) - m + 1) rarest rank lists, since
+    such a candidate has at least one of them. Level 0 falls back to the
+    boolean stream. Streamed ids are checked in batches and the walk
+    stops as soon as the page is full. With an owner, every stream only
+    holds that user's candidates.
+    """
+
+    def __init__(self, db: Session, query: CandidateQuery, owner: Optional[int] = None):
+        self.db = db
+        self.query = query
+        self.owner = owner
+        self.skills = query.skills()
+        self.frequencies = skill_frequencies(db, self.skills, owner)
+
+    def rarest(self, skills: List[str]) -> List[str]:
+        return sorted(skills, key=lambda skill: (self.frequencies[skill], skill))
+
+    def driver(self, after: int, rank_skills: List[str] = None) -> Iterator[int]:
+        options = []
+
+        if self.query.all:
+            skill = self.rarest(self.query.all)[0]
+            options.append((self.frequencies[skill], [skill]))
+
+        if rank_skills:
+            options.append((sum(self.frequencies[skill] for skill in rank_skills), rank_skills))
+        elif self.query.any:
+            options.append((sum(self.frequencies[skill] for skill in self.query.any), self.query.any))
+
+        if not options:
+            return all_candidates(self.db, after, self.owner)
+
+        _, skills = min(options)
+        return union([postings(self.db, skill, after, self.owner) for skill in skills])
+
+    def collect(self, stream: Iterator[int], wanted: int, level: Optional[int]) -> List[Tuple[int, Optional[int]]]:
+        hits = []
+
+        while len(hits) < wanted:
+            batch = [candidate_id for _, candidate_id in zip(range(VERIFY_BATCH), stream)]
+            if not batch:
+                break
+
+            found = skills_of(self.db, batch, self.skills)
+
+            for candidate_id in batch:
+                skills = found[candidate_id]
+
+                if not self.query.matches(skills):
+                    continue
+                if level is not None and self.query.rank_score(skills) != level:
+                    continue
+
+                hits.append((candidate_id, level))
+                if len(hits) == wanted:
+                    break
+
+        return hits
+
+    def page(self, limit: int, cursor: Optional[str] = None) -> Tuple[List[Tuple[int, Optional[int]]], Optional[str]]:
+        """
+        Up to limit (candidate id, rank level) hits after cursor, and the
+        cursor of the next page (None on the last one).
+        """
+
+        ranked = bool(self.query.rank)
+        level, after = parse_cursor(cursor, ranked)
+
+        # One extra hit tells whether another page exists
+        wanted = limit + 1
+
+        if not ranked:
+            hits = self.collect(self.driver(after), wanted, None)
+        else:
+            hits = []
+            top = len(self.query.rank)
+            rarest = self.rarest(self.query.rank)
+
+            start_level = top if level is None else min(level, top)
+
+            for current in range(start_level, -1, -1):
+                start = after if current == level else 0
+                stream = self.driver(start, rarest[:top - current + 1] if current else None)
+
+                hits.extend(self.collect(stream, wanted - len(hits), current))
+                if len(hits) == wanted:
+                    break
+
+        if len(hits) <= limit:
+            return hits, None
+
+        hits = hits[:limit]
+        last_id, last_level = hits[-1]
+        return hits, make_cursor(last_level, last_id)
+
+
+def candidate_to_dict(
+    candidate: Candidate,
+    query: CandidateQuery,
+    level: Optional[int],
+    include_contact: bool = False
+) -> Dict:
+    profile = json.loads(candidate.profile or "{}")
+    skills = profile.get("skills", [])
+
+    result = {
+        "candidate_id": candidate.id,
+        "resume_score": candidate.resume_score,
+        "skills": skills,
+        "education": profile.get("education", []),
+        "experience": profile.get("experience", []),
+        "created_at": candidate.created_at,
+    }
+
+    # Name, email and phone only for callers allowed to contact candidates
+    if include_contact:
+        result.update(name=candidate.name, email=candidate.email, phone=candidate.phone)
+
+    if level is not None:
+        canonical = set(canonical_skills(skills))
+        result["rank_matches"] = level
+        result["matched_rank_skills"] = [skill for skill in query.rank if skill in canonical]
+
+    return result
+
+
+def search_candidates(
+    query: CandidateQuery,
+    owner: Optional[int],
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_contact: bool = False
+) -> Dict:
+    """
+    One page of candidates matching query among owner's candidates (every
+    candidate when owner is None).
+    """
+
+    db = SessionLocal()
+
+    try:
+        hits, next_cursor = CandidateSearch(db, query, owner).page(limit, cursor)
+
+        rows = {
+            candidate.id: candidate
+            for candidate in db.query(Candidate).filter(Candidate.id.in_([candidate_id for candidate_id, _ in hits]))
+        } if hits else {}
+
+        return {
+            "candidates": [
+                candidate_to_dict(rows[candidate_id], query, level, include_contact)
+                for candidate_id, level in hits
+                if candidate_id in rows
+            ],
+            "next_cursor": next_cursor,
+        }
+    finally:
+        db.close()
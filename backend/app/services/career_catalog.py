@@ -0,0 +1,836 @@
+# career_catalog.py
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import sys
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.career_database import CAREER_DATABASE
+from app.services.skill_canonicalizer import canonical_skill, skill_canonicalizer
+
+
+SNAPSHOT_FORMAT = 1
+MANIFEST_FILE = "manifest.json"
+
+# Earlier snapshot versions kept next to the current one, for workers
+# still loading them when a new one is swapped in
+SNAPSHOT_KEEP = 2
+
+# Points to a .json / .parquet file or a snapshot directory.
+# Unset means the built-in CAREER_DATABASE.
+CATALOG_PATH_ENV = "CAREER_CATALOG_PATH"
+
+NUMERIC_FIELDS = [
+    "growth_score",
+    "stability_score",
+    "market_demand",
+    "risk_level",
+    "average_salary_lpa",
+]
+
+TEXT_FIELDS = [
+    "name",
+    "category",
+    "future_scope",
+    "work_style",
+    "industry_trend",
+]
+
+TAG_FIELDS = {
+    # field -> vocabulary
+    "required_skills": "skills",
+    "related_interests": "interests",
+    "core_strengths": "strengths",
+}
+
+# Tag fields the scorer looks up by ID; their inverted postings are
+# stored in snapshots so workers never rebuild them
+POSTING_FIELDS = ["required_skills", "related_interests"]
+
+# Most similar careers kept per career, for the transition graph
+SKILL_NEIGHBORS = 10
+
+# Careers whose neighbors are computed at once
+NEIGHBOR_CHUNK = 512
+
+# Skills listed by more careers than this are common: they still count
+# towards similarity, but only propose NEIGHBOR_FALLBACK candidates each
+NEIGHBOR_POSTING_LIMIT = 1000
+
+# Careers with the fewest skills that a common skill's list proposes
+NEIGHBOR_FALLBACK = 128
+
+
+# ----------------------------
+# Interning
+# ----------------------------
+
+class Vocabulary:
+    """
+    Interns strings to dense integer IDs.
+    """
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, names: List[str] = None):
+        self.names = []
+        self.ids = {}
+
+        for name in names or []:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def intern(self, name: str) -> int:
+        value = self.ids.get(name)
+
+        if value is None:
+            value = len(self.names)
+            self.ids[name] = value
+            self.names.append(name)
+
+        return value
+
+    def get(self, name: str) -> Optional[int]:
+        return self.ids.get(name)
+
+    def name(self, value: int) -> str:
+        return self.names[value]
+
+
+class StringTable:
+    """
+    Many strings stored as one UTF-8 buffer plus offsets, decoded on access.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, values: List[str]) -> "StringTable":
+        encoded = [value.encode("utf-8") for value in values]
+
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(value) for value in encoded])
+
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        return cls(data, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[str]:
+        # One copy of the buffer instead of an array slice per string
+        buffer = self.data.tobytes()
+        offsets = self.offsets.tolist()
+
+        return [
+            buffer[start:end].decode("utf-8")
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+
+def pack_bitsets(indptr: np.ndarray, ids: np.ndarray, size: int) -> np.ndarray:
+    """
+    One row of little-endian uint64 words per career, bit i set for ID i.
+    """
+
+    rows = len(indptr) - 1
+    words = max(1, (size + 63) // 64)
+    bits = np.zeros((rows, words), dtype=np.uint64)
+
+    row_of_entry = np.repeat(np.arange(rows), np.diff(indptr))
+    ids = ids.astype(np.uint64)
+
+    np.bitwise_or.at(
+        bits,
+        (row_of_entry, (ids // 64).astype(np.int64)),
+        np.left_shift(np.uint64(1), ids % 64)
+    )
+
+    return bits
+
+
+def build_postings(indptr: np.ndarray, ids: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inverts career -> IDs CSR arrays into ID -> careers postings.
+    Each posting list is sorted and holds a career at most once.
+    """
+
+    careers_total = len(indptr) - 1
+    rows = np.repeat(np.arange(careers_total, dtype=np.int64), np.diff(indptr))
+
+    # (ID, career) pairs encoded as one integer: sorts by ID, then career
+    pairs = np.unique(ids.astype(np.int64) * max(careers_total, 1) + rows)
+    posting_ids = pairs // max(careers_total, 1)
+    careers = pairs % max(careers_total, 1)
+
+    posting_indptr = np.zeros(size + 1, dtype=np.int64)
+    posting_indptr[1:] = np.cumsum(np.bincount(posting_ids, minlength=size))
+
+    return posting_indptr, careers.astype(np.int64)
+
+
+def career_rows(indptr: np.ndarray, careers: np.ndarray, size: int) -> np.ndarray:
+    """
+    Postings transposed back to one row of distinct IDs per career,
+    padded with -1 to the longest row. Catalog rows keep duplicate IDs;
+    score_career counts a set.
+    """
+
+    lists = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+    order = np.argsort(careers, kind="stable")
+
+    counts = np.bincount(careers, minlength=size)
+    starts = np.cumsum(counts) - counts
+    columns = np.arange(len(careers)) - np.repeat(starts, counts)
+
+    rows = np.full((size, int(counts.max(initial=0))), -1, dtype=np.int32)
+    rows[careers[order], columns] = lists[order]
+
+    return rows
+
+
+# ----------------------------
+# Skill Neighbors
+# ----------------------------
+
+def common_bitsets(rows: np.ndarray, common: np.ndarray) -> np.ndarray:
+    """
+    Per career, a uint64 bitset of which common skills it requires.
+    """
+
+    common_ids = np.flatnonzero(common)
+    bit = np.full(len(common) + 1, -1, dtype=np.int64)
+    bit[common_ids] = np.arange(len(common_ids))
+
+    words = max(1, -(-len(common_ids) // 64))
+    bits = np.zeros((len(rows), words), dtype=np.uint64)
+
+    owners, columns = np.nonzero(bit[rows] >= 0)
+    positions = bit[rows[owners, columns]]
+    np.bitwise_or.at(
+        bits,
+        (owners, positions // 64),
+        np.left_shift(np.uint64(1), (positions % 64).astype(np.uint64))
+    )
+
+    return bits
+
+
+def build_skill_neighbors(
+    indptr: np.ndarray,
+    careers: np.ndarray,
+    sizes: np.ndarray,
+    count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (neighbors, similarity): each career's count most similar careers by
+    Jaccard overlap of required skills, best first, -1 / 0.0 padded.
+
+    Candidates come from the posting lists of a career's skills instead
+    of all pairs. Common skills only propose the smallest careers on
+    their lists, so a neighbor sharing nothing but common skills can be
+    missed; similarities of the neighbors found are exact.
+    """
+
+    total = len(sizes)
+    if total >= 1 << 27:
+        # Pair sort keys below hold a career index in 27 bits
+        raise ValueError(f"Too many careers for neighbor lists: {total}")
+
+    neighbors = np.full((total, count), -1, dtype=np.int64)
+    similarity = np.zeros((total, count), dtype=np.float64)
+
+    rows = career_rows(indptr, careers, total)
+    if count == 0 or rows.shape[1] == 0:
+        return neighbors, similarity
+
+    # Trailing entries are what the -1 row padding indexes
+    lengths = np.append(np.diff(indptr), 0)
+    common = lengths[:-1] > NEIGHBOR_POSTING_LIMIT
+    bits = common_bitsets(rows, common)
+
+    # Common lists propose only their head, so order them smallest career
+    # first: sharing the same skills, a smaller career is the more similar
+    lists = np.repeat(np.arange(len(lengths) - 1, dtype=np.int64), lengths[:-1])
+    by_size = np.lexsort((careers, sizes[careers], lists))
+    careers = np.where(common[lists], careers[by_size], careers)
+
+    spans_by_skill = np.where(common, np.minimum(lengths[:-1], NEIGHBOR_FALLBACK), lengths[:-1])
+    spans_by_skill = np.append(spans_by_skill, 0)
+    counted_by_skill = np.append(~common, False)
+
+    for start in range(0, total, NEIGHBOR_CHUNK):
+        chunk = rows[start:start + NEIGHBOR_CHUNK]
+
+        owners, columns = np.nonzero(chunk >= 0)
+        skills = chunk[owners, columns]
+        spans = spans_by_skill[skills]
+        counted = counted_by_skill[skills]
+
+        # Every (owner, other career) pair the lists propose
+        offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        pair_owners = np.repeat(owners, spans)
+        others = careers[np.repeat(indptr[skills], spans) + offsets]
+        weights = np.repeat(counted, spans)
+
+        # (owner, other, not counted) as one integer: a plain sort groups
+        # the pairs, and each group's zero low bits are its counted entries
+        keys = np.sort((pair_owners * total + others) << 1 | ~weights)
+        firsts = np.flatnonzero(np.append(True, keys[1:] >> 1 != keys[:-1] >> 1))
+        shared = np.add.reduceat(1 - (keys & 1), firsts).astype(np.float64)
+
+        pair_owners, others = (keys[firsts] >> 1) // total, (keys[firsts] >> 1) % total
+
+        # Overlap on common skills comes from the bitsets: those lists
+        # were cut short, so counting proposals would miss some of it
+        shared += np.bitwise_count(bits[start + pair_owners] & bits[others]).sum(axis=1)
+
+        union = sizes[start + pair_owners] + sizes[others] - shared
+        scores = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+        # Never link a career to itself
+        linked = (scores > 0) & (others != start + pair_owners)
+        pair_owners, others, scores = pair_owners[linked], others[linked], scores[linked]
+
+        # Each owner's pairs best first, ties to the lowest career index.
+        # Similarities are ratios of small integers, so 2**-20 steps keep
+        # distinct ones apart and equal ones equal
+        steps = np.rint((1.0 - scores) * (1 << 20)).astype(np.int64)
+        order = np.argsort(pair_owners << 48 | steps << 27 | others)
+        pair_owners, others, scores = pair_owners[order], others[order], scores[order]
+
+        group_sizes = np.bincount(pair_owners, minlength=len(chunk))
+        ranks = np.arange(len(pair_owners)) - np.repeat(np.cumsum(group_sizes) - group_sizes, group_sizes)
+        keep = ranks < count
+
+        neighbors[start + pair_owners[keep], ranks[keep]] = others[keep]
+        similarity[start + pair_owners[keep], ranks[keep]] = scores[keep]
+
+    return neighbors, similarity
+
+
+# ----------------------------
+# Career Records
+# ----------------------------
+
+class CareerRecord:
+    """
+    Read-only view of one catalog row.
+
+    Supports career["key"] and career.get("key") like the original dicts,
+    so the scoring and explanation code accepts either.
+    """
+
+    __slots__ = ("catalog", "id")
+
+    def __init__(self, catalog: "CareerCatalog", index: int):
+        self.catalog = catalog
+        self.id = index
+
+    def __repr__(self) -> str:
+        return f"CareerRecord({self.id}, {self.name!r})"
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: str, default=None):
+        catalog = self.catalog
+
+        if key in catalog.text:
+            return catalog.text[key][self.id]
+
+        if key in catalog.numbers:
+            value = catalog.numbers[key][self.id]
+            if math.isnan(value):
+                return default
+            return _number(value)
+
+        if key in TAG_FIELDS:
+            return catalog.tag_names(key, self.id)
+
+        if key == "learning_paths":
+            return self.learning_paths
+
+        return default
+
+    @property
+    def name(self) -> str:
+        return self.catalog.text["name"][self.id]
+
+    @property
+    def skill_ids(self) -> np.ndarray:
+        return self.catalog.tag_ids("required_skills", self.id)
+
+    @property
+    def interest_ids(self) -> np.ndarray:
+        return self.catalog.tag_ids("related_interests", self.id)
+
+    @property
+    def skill_mask(self) -> int:
+        return int.from_bytes(self.catalog.skill_bits[self.id].tobytes(), "little")
+
+    @property
+    def learning_paths(self) -> Dict[str, str]:
+        catalog = self.catalog
+        start, end = catalog.tags["required_skills"][0][self.id:self.id + 2]
+
+        paths = {}
+        for entry in range(start, end):
+            path = catalog.learning_paths[entry]
+            if path:
+                paths[catalog.vocabularies["skills"].name(
+                    int(catalog.tags["required_skills"][1][entry])
+                )] = path
+
+        return paths
+
+    def to_dict(self) -> Dict:
+        career = {}
+
+        for key in TEXT_FIELDS[:2]:
+            career[key] = self[key]
+        for key in TAG_FIELDS:
+            career[key] = self[key]
+        for key in NUMERIC_FIELDS:
+            if key in self:
+                career[key] = self[key]
+        for key in TEXT_FIELDS[2:]:
+            career[key] = self[key]
+
+        career["learning_paths"] = self.learning_paths
+        return career
+
+
+_MISSING = object()
+
+
+def _number(value: float):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+# ----------------------------
+# Career Catalog
+# ----------------------------
+
+class CareerCatalog:
+    """
+    Column-oriented career catalog.
+
+    Skills, interests and strengths are interned to integer IDs and stored
+    as CSR arrays (indptr, ids); required skills are also packed into
+    bitsets, and skills and interests are inverted into ID -> careers
+    postings. Every array can be written to a snapshot directory and
+    memory-mapped back, so workers share one copy through the page cache.
+    """
+
+    def __init__(
+        self,
+        vocabularies: Dict[str, Vocabulary],
+        text: Dict[str, StringTable],
+        numbers: Dict[str, np.ndarray],
+        tags: Dict[str, tuple],
+        learning_paths: StringTable,
+        skill_bits: np.ndarray,
+        version: str,
+        postings: Dict[str, tuple] = None,
+        neighbors: tuple = None
+    ):
+        self.vocabularies = vocabularies
+        self.text = text
+        self.numbers = numbers
+        self.tags = tags
+        self.learning_paths = learning_paths
+        self.skill_bits = skill_bits
+        self.version = version
+
+        self._postings = dict(postings or {})
+        self._neighbors = neighbors
+
+    def __len__(self) -> int:
+        return len(self.text["name"])
+
+    def __getitem__(self, index: int) -> CareerRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return CareerRecord(self, int(index))
+
+    def __iter__(self) -> Iterator[CareerRecord]:
+        for index in range(len(self)):
+            yield CareerRecord(self, index)
+
+    @property
+    def skills(self) -> Vocabulary:
+        return self.vocabularies["skills"]
+
+    @property
+    def interests(self) -> Vocabulary:
+        return self.vocabularies["interests"]
+
+    def tag_ids(self, field: str, index: int) -> np.ndarray:
+        indptr, ids = self.tags[field]
+        return ids[indptr[index]:indptr[index + 1]]
+
+    def tag_names(self, field: str, index: int) -> List[str]:
+        vocabulary = self.vocabularies[TAG_FIELDS[field]]
+        return [vocabulary.name(int(value)) for value in self.tag_ids(field, index)]
+
+    def tag_counts(self, field: str) -> np.ndarray:
+        return np.diff(self.tags[field][0])
+
+    def postings(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (indptr, careers) inverted postings of a tag field. Snapshots carry
+        them; catalogs built from records invert on first use.
+        """
+
+        postings = self._postings.get(field)
+
+        if postings is None:
+            vocabulary = self.vocabularies[TAG_FIELDS[field]]
+            postings = self._postings[field] = build_postings(*self.tags[field], len(vocabulary))
+
+        return postings
+
+    def skill_neighbors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (careers, similarity): per career, its SKILL_NEIGHBORS most
+        similar careers by required skills. Snapshots carry them; catalogs
+        built from records compute them on first use.
+        """
+
+        if self._neighbors is None:
+            indptr, careers = self.postings("required_skills")
+            count = min(SKILL_NEIGHBORS, max(len(self) - 1, 0))
+
+            self._neighbors = build_skill_neighbors(
+                indptr, careers, np.bincount(careers, minlength=len(self)), count
+            )
+
+        return self._neighbors
+
+    def find(self, name: str) -> Optional[CareerRecord]:
+        # Name lookups are rare, a linear scan keeps the catalog compact
+        target = name.strip().lower()
+        for record in self:
+            if record.name.lower() == target:
+                return record
+        return None
+
+    def to_dicts(self) -> List[Dict]:
+        return [record.to_dict() for record in self]
+
+    # ---------------- Building
+
+    @classmethod
+    def from_records(cls, careers: List[Dict], version: str = None) -> "CareerCatalog":
+        vocabularies = {name: Vocabulary() for name in TAG_FIELDS.values()}
+
+        text = {
+            field: StringTable.build([str(c.get(field, "")) for c in careers])
+            for field in TEXT_FIELDS
+        }
+
+        numbers = {
+            field: np.array(
+                [c.get(field, math.nan) for c in careers], dtype=np.float64
+            )
+            for field in NUMERIC_FIELDS
+        }
+
+        # Required skills use the same canonical names as user input and
+        # the resume parser. Duplicates are kept: score_career divides by
+        # the list length.
+        required_skills = [
+            [canonical_skill(skill) for skill in career.get("required_skills", [])]
+            for career in careers
+        ]
+
+        tags = {}
+        for field, vocabulary_name in TAG_FIELDS.items():
+            vocabulary = vocabularies[vocabulary_name]
+            indptr = np.zeros(len(careers) + 1, dtype=np.int64)
+            ids = []
+
+            for row, career in enumerate(careers):
+                if field == "required_skills":
+                    values = required_skills[row]
+                else:
+                    values = list(career.get(field, []))
+                ids.extend(vocabulary.intern(value) for value in values)
+                indptr[row + 1] = len(ids)
+
+            tags[field] = (indptr, np.array(ids, dtype=np.int32))
+
+        # One learning path slot per required-skill entry
+        learning_paths = StringTable.build([
+            canonical_paths(career.get("learning_paths", {})).get(skill, "")
+            for career, skills in zip(careers, required_skills)
+            for skill in skills
+        ])
+
+        skill_bits = pack_bitsets(*tags["required_skills"], len(vocabularies["skills"]))
+
+        if version is None:
+            version = catalog_version(careers)
+
+        return cls(vocabularies, text, numbers, tags, learning_paths, skill_bits, version)
+
+
+def canonical_paths(learning_paths: Dict[str, str]) -> Dict[str, str]:
+    return {canonical_skill(skill): path for skill, path in learning_paths.items()}
+
+
+def catalog_version(careers: List[Dict]) -> str:
+    # Alias table changes alter the compiled catalog, so they bump it too
+    payload = json.dumps(
+        [skill_canonicalizer.version, careers], sort_keys=True, default=str
+    ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+# ----------------------------
+# Loaders
+# ----------------------------
+
+def load_catalog_json(path: str) -> CareerCatalog:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+
+    # Either a bare list of careers or {"version": ..., "careers": [...]}
+    if isinstance(data, dict):
+        return CareerCatalog.from_records(data["careers"], version=data.get("version"))
+
+    return CareerCatalog.from_records(data)
+
+
+def load_catalog_parquet(path: str) -> CareerCatalog:
+    import pandas as pd
+
+    frame = pd.read_parquet(path)
+
+    careers = []
+    for row in frame.to_dict(orient="records"):
+        career = {}
+
+        for key, value in row.items():
+            if key in TAG_FIELDS:
+                value = [str(item) for item in value]
+            elif key == "learning_paths" and isinstance(value, str):
+                value = json.loads(value)
+            elif key == "learning_paths" and value is not None:
+                value = dict(value)
+            elif isinstance(value, float) and math.isnan(value):
+                continue
+            career[key] = value
+
+        careers.append(career)
+
+    return CareerCatalog.from_records(careers)
+
+
+def load_catalog(path: str) -> CareerCatalog:
+    if os.path.isdir(path):
+        return load_snapshot(path)
+
+    if path.endswith(".parquet"):
+        return load_catalog_parquet(path)
+
+    return load_catalog_json(path)
+
+
+# ----------------------------
+# Binary Snapshots
+# ----------------------------
+
+def _snapshot_arrays(catalog: CareerCatalog) -> Dict[str, np.ndarray]:
+    arrays = {"skill_bits": catalog.skill_bits}
+
+    for field, table in catalog.text.items():
+        arrays[f"text.{field}.data"] = table.data
+        arrays[f"text.{field}.offsets"] = table.offsets
+
+    for field, values in catalog.numbers.items():
+        arrays[f"number.{field}"] = values
+
+    for field, (indptr, ids) in catalog.tags.items():
+        arrays[f"tag.{field}.indptr"] = indptr
+        arrays[f"tag.{field}.ids"] = ids
+
+    arrays["learning_paths.data"] = catalog.learning_paths.data
+    arrays["learning_paths.offsets"] = catalog.learning_paths.offsets
+
+    for field in POSTING_FIELDS:
+        indptr, careers = catalog.postings(field)
+        arrays[f"postings.{field}.indptr"] = indptr
+        arrays[f"postings.{field}.careers"] = careers
+
+    arrays["neighbors.careers"], arrays["neighbors.similarity"] = catalog.skill_neighbors()
+
+    return arrays
+
+
+def snapshot_versions(directory: str) -> List[str]:
+    # Version directories written for directory, oldest first
+    parent, name = os.path.split(os.path.abspath(directory))
+    prefix = f"{name}.v-"
+
+    versions = [
+        os.path.join(parent, entry) for entry in os.listdir(parent)
+        if entry.startswith(prefix) and os.path.isdir(os.path.join(parent, entry))
+    ]
+    return sorted(versions, key=os.path.getmtime)
+
+
+def save_snapshot(catalog: CareerCatalog, directory: str) -> None:
+    """
+    Writes the catalog as raw .npy arrays plus a JSON manifest.
+
+    Every save goes to a fresh sibling directory (<directory>.v-<id>),
+    and directory is a symlink swapped to it atomically. Workers map the
+    arrays, so files of a published snapshot are never rewritten in
+    place; the SNAPSHOT_KEEP previous versions are kept.
+    """
+
+    directory = os.path.abspath(directory.rstrip(os.sep))
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+
+    version_dir = f"{directory}.v-{uuid.uuid4().hex[:12]}"
+    os.makedirs(version_dir)
+
+    arrays = _snapshot_arrays(catalog)
+    for key, values in arrays.items():
+        np.save(os.path.join(version_dir, f"{key}.npy"), np.ascontiguousarray(values))
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": catalog.version,
+        "careers": len(catalog),
+        "arrays": sorted(arrays),
+        "vocabularies": {
+            name: vocabulary.names
+            for name, vocabulary in catalog.vocabularies.items()
+        },
+    }
+
+    with open(os.path.join(version_dir, MANIFEST_FILE), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle)
+
+    if os.path.isdir(directory) and not os.path.islink(directory):
+        # A snapshot from before versioning: move it aside, once
+        os.replace(directory, f"{directory}.v-{uuid.uuid4().hex[:12]}")
+
+    link = f"{directory}.link-{uuid.uuid4().hex[:12]}"
+    os.symlink(os.path.basename(version_dir), link)
+    os.replace(link, directory)
+
+    for stale in snapshot_versions(directory)[:-(SNAPSHOT_KEEP + 1)]:
+        if stale != version_dir:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def load_snapshot(directory: str, mmap: bool = True) -> CareerCatalog:
+    # Resolved once, so every file comes from the same version even if
+    # the link is swapped while this runs
+    directory = os.path.realpath(directory)
+
+    with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported catalog snapshot format: {manifest.get('format')}")
+
+    mmap_mode = "r" if mmap else None
+
+    # Plain ndarray views over the mapping: same pages, without np.memmap's
+    # per-slice overhead on the scoring hot path
+    arrays = {
+        key: np.load(os.path.join(directory, f"{key}.npy"), mmap_mode=mmap_mode).view(np.ndarray)
+        for key in manifest["arrays"]
+    }
+
+    return CareerCatalog(
+        vocabularies={
+            name: Vocabulary(names)
+            for name, names in manifest["vocabularies"].items()
+        },
+        text={
+            field: StringTable(
+                arrays[f"text.{field}.data"], arrays[f"text.{field}.offsets"]
+            )
+            for field in TEXT_FIELDS
+        },
+        numbers={field: arrays[f"number.{field}"] for field in NUMERIC_FIELDS},
+        tags={
+            field: (arrays[f"tag.{field}.indptr"], arrays[f"tag.{field}.ids"])
+            for field in TAG_FIELDS
+        },
+        learning_paths=StringTable(
+            arrays["learning_paths.data"], arrays["learning_paths.offsets"]
+        ),
+        skill_bits=arrays["skill_bits"],
+        version=manifest["version"],
+        # Snapshots written before postings were stored invert on first use
+        postings={
+            field: (arrays[f"postings.{field}.indptr"], arrays[f"postings.{field}.careers"])
+            for field in POSTING_FIELDS
+            if f"postings.{field}.indptr" in arrays
+        },
+        neighbors=(
+            (arrays["neighbors.careers"], arrays["neighbors.similarity"])
+            if "neighbors.careers" in arrays else None
+        ),
+    )
+
+
+# ----------------------------
+# Default Catalog
+# ----------------------------
+
+def load_default_catalog(path: str = None) -> CareerCatalog:
+    path = path or os.getenv(CATALOG_PATH_ENV)
+
+    if path:
+        return load_catalog(path)
+
+    return CareerCatalog.from_records(CAREER_DATABASE)
+
+
+if __name__ == "__main__":
+    # python -m app.services.career_catalog <careers.json|.parquet> <snapshot_dir>
+    if len(sys.argv) != 3:
+        print("usage: python -m app.services.career_catalog <source> <snapshot_dir>")
+        sys.exit(1)
+
+    source_catalog = load_catalog(sys.argv[1])
+    save_snapshot(source_catalog, sys.argv[2])
+    print(f"Wrote {len(source_catalog)} careers (version {source_catalog.version}) to {sys.argv[2]}")
@@ -0,0 +1,324 @@
+# career_index.py
+
+import threading
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.services.career_catalog import career_rows
+from app.services.career_matrix import (
+    CareerMatrix,
+    INTEREST_WEIGHT,
+    RISK_TARGETS,
+    SKILL_WEIGHT,
+    risk_key,
+    round_scores
+)
+
+
+MODES = ["growth", "stability"]
+
+# Bounds are compared with rounded scores; this covers the rounding of
+# both the static part and the final total
+ROUNDING_MARGIN = 0.02
+
+
+def mode_key(career_mode: str) -> str:
+    # score_career treats every mode other than "growth" as "stability"
+    return "growth" if career_mode == "growth" else "stability"
+
+
+# ----------------------------
+# Postings
+# ----------------------------
+
+def ranked_postings(indptr: np.ndarray, careers: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """
+    Each posting list rewritten as the static ranks of its careers,
+    ascending: walking a list in order visits its careers from the
+    highest static score down.
+    """
+
+    lists = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+
+    # (list, rank) as one integer sorts within each list, lists stay in place
+    keys = np.sort(lists * len(rank) + rank[careers])
+
+    return (keys - lists * len(rank)).astype(np.int32)
+
+
+def max_gains(indptr: np.ndarray, careers: np.ndarray, counts: np.ndarray, weight: float) -> np.ndarray:
+    """
+    Per posting list, the most one match in it can add to a career's
+    score: weight / the shortest list length among its careers.
+    """
+
+    lists = len(indptr) - 1
+    shortest = np.full(lists, np.inf)
+
+    nonempty = np.flatnonzero(np.diff(indptr) > 0)
+    if len(nonempty):
+        shortest[nonempty] = np.minimum.reduceat(counts[careers], indptr[nonempty])
+
+    return weight / shortest
+
+
+def count_matches(rows: np.ndarray, careers: np.ndarray, flags: np.ndarray) -> np.ndarray:
+    # flags carries a trailing False that the -1 padding indexes
+    return flags[rows[careers]].sum(axis=1, dtype=np.float64)
+
+
+class Term(NamedTuple):
+    field: str
+    id: int
+    length: int
+    max_gain: float
+
+
+class TopK:
+    """
+    The k best (catalog index, rounded score) pairs seen so far, ties
+    broken by lowest index like select_top_k.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.indexes = np.empty(0, dtype=np.int64)
+        self.rounded = np.empty(0, dtype=np.float64)
+
+    @property
+    def threshold(self) -> float:
+        # Rounded score a career needs to still make the top K
+        return self.rounded[-1] if len(self.indexes) == self.k else -np.inf
+
+    def add(self, indexes: np.ndarray, rounded: np.ndarray) -> None:
+        indexes = np.concatenate([self.indexes, indexes])
+        rounded = np.concatenate([self.rounded, rounded])
+
+        best = np.lexsort((indexes, -rounded))[:self.k]
+        self.indexes, self.rounded = indexes[best], rounded[best]
+
+
+# ----------------------------
+# Inverted Career Index
+# ----------------------------
+
+class CareerIndex:
+    """
+    Skill/interest -> career postings plus precomputed static scores,
+    searched MaxScore style.
+
+    A career's score is its static part (growth/stability + market +
+    risk, fixed per (mode, risk) pair) plus what its matches add. The
+    user's posting lists are split in two:
+
+    - essential lists, the shortest ones, whose careers are all scored
+      exactly;
+    - the remaining long lists, walked in descending static order and
+      only as deep as static + the most those lists can add still
+      reaches the current K-th score. Everything below is skipped
+      unread.
+
+    Lists move from the second group to the first, shortest first, while
+    scoring them is cheaper than walking what is left. Careers in no list
+    score exactly their static part; the best of those are read straight
+    off the static order.
+
+    Rankings are identical to CareerMatrix.top_k. The first search with
+    a given (mode, risk) pair builds that pair's rank-ordered postings.
+    """
+
+    def __init__(self, matrix: CareerMatrix):
+        self.matrix = matrix
+
+        self.postings = {
+            "required_skills": matrix.skill_postings,
+            "related_interests": matrix.interest_postings,
+        }
+        self.rows = {
+            field: career_rows(*postings, len(matrix))
+            for field, postings in self.postings.items()
+        }
+        self.max_gains = {
+            "required_skills": max_gains(*matrix.skill_postings, matrix.skill_counts, SKILL_WEIGHT),
+            "related_interests": max_gains(*matrix.interest_postings, matrix.interest_counts, INTEREST_WEIGHT),
+        }
+
+        self.static_rounded = {}
+        self.static_order = {}
+        self.static_sorted = {}
+
+        for mode in MODES:
+            for risk in RISK_TARGETS:
+                # Same summation order as score_career, with zero matches
+                static = matrix.preference_scores(mode) + matrix.market_scores
+                static = static + matrix.risk_scores[risk]
+
+                rounded = round_scores(static)
+                order = np.argsort(-rounded, kind="stable")
+
+                self.static_rounded[(mode, risk)] = rounded
+                self.static_order[(mode, risk)] = order
+                # Negated, so searchsorted can find cutoffs in it
+                self.static_sorted[(mode, risk)] = -rounded[order]
+
+        # (mode, risk) -> field -> ranked postings; built on first use
+        self._ranked = {}
+        self._ranked_lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        return self.matrix.version
+
+    def ranked(self, key: Tuple[str, str]) -> Dict[str, np.ndarray]:
+        ranked = self._ranked.get(key)
+        if ranked is not None:
+            return ranked
+
+        with self._ranked_lock:
+            if key not in self._ranked:
+                rank = np.empty(len(self.matrix), dtype=np.int64)
+                rank[self.static_order[key]] = np.arange(len(self.matrix))
+
+                self._ranked[key] = {
+                    field: ranked_postings(*postings, rank)
+                    for field, postings in self.postings.items()
+                }
+
+            return self._ranked[key]
+
+    def rank_cutoff(self, key: Tuple[str, str], value: float) -> int:
+        # How many careers have a rounded static score of at least value
+        return int(np.searchsorted(self.static_sorted[key], -value, side="right"))
+
+    # ---------------- Scoring
+
+    def user_terms(self, user_input: Dict) -> Tuple[List[Term], Dict[str, np.ndarray]]:
+        matrix = self.matrix
+        terms = []
+        flags = {}
+
+        for field, values, vocabulary in (
+            ("required_skills", user_input["skills"], matrix.skill_index),
+            ("related_interests", user_input["interests"], matrix.interest_index),
+        ):
+            indptr = self.postings[field][0]
+            flags[field] = np.zeros(len(vocabulary) + 1, dtype=bool)
+
+            for term_id in matrix.encode(values, vocabulary):
+                flags[field][term_id] = True
+                terms.append(Term(
+                    field,
+                    term_id,
+                    int(indptr[term_id + 1] - indptr[term_id]),
+                    float(self.max_gains[field][term_id])
+                ))
+
+        return terms, flags
+
+    @staticmethod
+    def gain_cap(terms: List[Term]) -> float:
+        # A career's skill part never exceeds SKILL_WEIGHT, nor its interest part INTEREST_WEIGHT
+        skills = sum(term.max_gain for term in terms if term.field == "required_skills")
+        interests = sum(term.max_gain for term in terms if term.field == "related_interests")
+
+        return min(skills, SKILL_WEIGHT) + min(interests, INTEREST_WEIGHT)
+
+    def exact_scores(
+        self,
+        careers: np.ndarray,
+        key: Tuple[str, str],
+        skill_matches: np.ndarray,
+        interest_matches: np.ndarray
+    ) -> np.ndarray:
+        matrix = self.matrix
+
+        # Same summation order as score_career so totals match exactly
+        exact = (
+            skill_matches / matrix.skill_counts[careers] * SKILL_WEIGHT +
+            interest_matches / matrix.interest_counts[careers] * INTEREST_WEIGHT
+        )
+        exact = exact + matrix.preference_scores(key[0])[careers]
+        exact = exact + matrix.market_scores[careers]
+        exact = exact + matrix.risk_scores[key[1]][careers]
+
+        return exact
+
+    # ---------------- Search
+
+    def top_k(self, user_input: Dict, k: int) -> List[int]:
+        if k <= 0 or len(self.matrix) == 0:
+            return []
+
+        key = (mode_key(user_input["career_mode"]), risk_key(user_input["risk_preference"]))
+        order = self.static_order[key]
+
+        terms, flags = self.user_terms(user_input)
+
+        best = TopK(k)
+        seen = np.zeros(len(self.matrix), dtype=bool)
+
+        def score(careers: np.ndarray, skill_matches: np.ndarray, interest_matches: np.ndarray) -> None:
+            seen[careers] = True
+            exact = self.exact_scores(careers, key, skill_matches, interest_matches)
+
+            # Rounding moves a score by at most 0.005, so anything further
+            # below the threshold cannot make the top K; skip rounding it
+            keep = exact >= best.threshold - ROUNDING_MARGIN
+            best.add(careers[keep], round_scores(exact[keep]))
+
+        def score_rows(careers: np.ndarray) -> None:
+            # Callers pass distinct careers
+            careers = careers[~seen[careers]]
+            if len(careers):
+                score(
+                    careers,
+                    count_matches(self.rows["required_skills"], careers, flags["required_skills"]),
+                    count_matches(self.rows["related_interests"], careers, flags["related_interests"])
+                )
+
+        # The best static scores seed the threshold
+        score_rows(order[:k])
+
+        # ---------------- Essential lists, shortest first
+        remaining = sorted(terms, key=lambda term: term.length)
+        ranked = self.ranked(key) if remaining else None
+
+        def prefixes(terms: List[Term]) -> List[np.ndarray]:
+            # Per list, the static ranks of careers that could still reach the threshold
+            cutoff = self.rank_cutoff(key, best.threshold - self.gain_cap(terms) - ROUNDING_MARGIN)
+            walked = []
+
+            for term in terms:
+                indptr = self.postings[term.field][0]
+                ranks = ranked[term.field][indptr[term.id]:indptr[term.id + 1]]
+                walked.append(ranks[:np.searchsorted(ranks, cutoff)])
+
+            return walked
+
+        while remaining and sum(map(len, prefixes(remaining))) > remaining[0].length:
+            term = remaining.pop(0)
+            indptr, careers = self.postings[term.field]
+            score_rows(careers[indptr[term.id]:indptr[term.id + 1]])
+
+        # ---------------- Remaining lists, down to the threshold only
+        if remaining:
+            # All prefixes share one rank cutoff, so a career above it shows
+            # up in every remaining list it is in; unseen careers are in no
+            # essential list, so counting prefix entries is exact for them
+            counts = {
+                field: np.zeros(len(self.matrix), dtype=np.int64)
+                for field in self.postings
+            }
+            for term, ranks in zip(remaining, prefixes(remaining)):
+                counts[term.field][order[ranks]] += 1
+
+            skill_counts, interest_counts = counts["required_skills"], counts["related_interests"]
+
+            careers = np.flatnonzero((skill_counts + interest_counts > 0) & ~seen)
+            score(careers, skill_counts[careers].astype(np.float64), interest_counts[careers].astype(np.float64))
+
+        # ---------------- Careers in no list: their static part is exact
+        score_rows(order[:self.rank_cutoff(key, best.threshold)])
+
+        return best.indexes.tolist()
@@ -0,0 +1,284 @@
+# career_matrix.py
+
+import heapq
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.career_catalog import CareerCatalog
+
+
+# ----------------------------
+# Score Weights
+# ----------------------------
+# Same weights as score_career in recommendation_engine.py
+
+SKILL_WEIGHT = 35
+INTEREST_WEIGHT = 20
+PREFERENCE_WEIGHT = 2.5
+MARKET_WEIGHT = 2
+
+RISK_TARGETS = {"low": 2, "medium": 5, "high": 8}
+
+
+# ----------------------------
+# Helpers
+# ----------------------------
+
+def risk_key(risk_preference: str) -> str:
+    # score_career treats every unknown preference as "high"
+    return risk_preference if risk_preference in RISK_TARGETS else "high"
+
+
+def round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized round(x, 2) that agrees with Python's round().
+
+    np.round scales by 100 first, which can land on the other side of a
+    .5 tie than Python's correctly rounded result. Those few values are
+    re-rounded in Python.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, 2)
+
+    scaled = values * 100
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+
+    for index in zip(*np.nonzero(ambiguous)):
+        rounded[index] = round(float(values[index]), 2)
+
+    return rounded
+
+
+def same_type(score: float, source: float):
+    # int when the catalog value it came from is a whole number
+    return int(score) if float(source).is_integer() else score
+
+
+def select_top_k(rounded: np.ndarray, k: int) -> List[int]:
+    """
+    Indexes of the k highest scores, ties broken by lowest index
+    (the order a stable descending sort would give).
+    """
+
+    if k <= 0 or len(rounded) == 0:
+        return []
+
+    if k < len(rounded):
+        threshold = np.partition(rounded, len(rounded) - k)[len(rounded) - k]
+        candidates = np.flatnonzero(rounded >= threshold)
+    else:
+        candidates = np.arange(len(rounded))
+
+    return heapq.nlargest(
+        k,
+        candidates.tolist(),
+        key=lambda index: (rounded[index], -index)
+    )
+
+
+# ----------------------------
+# Compiled Career Matrix
+# ----------------------------
+
+class CareerMatrix:
+    """
+    Career catalog compiled for vectorized scoring: skill/interest ->
+    career postings and static score vectors, so a user or a batch of
+    users is scored against every career without a Python loop per career.
+
+    Match counts come from the catalog's skill and interest postings, which
+    a snapshot memory-maps as is; nothing of size careers x vocabulary is
+    ever built.
+
+    Totals are bit-for-bit identical to score_career.
+    """
+
+    def __init__(self, catalog: CareerCatalog):
+        self.catalog = catalog
+        self.careers = catalog
+
+        self.skill_index = catalog.skills.ids
+        self.interest_index = catalog.interests.ids
+
+        self.skill_postings = catalog.postings("required_skills")
+        self.interest_postings = catalog.postings("related_interests")
+
+        # score_career divides by the list length, duplicates included
+        self.skill_counts = catalog.tag_counts("required_skills").astype(np.float64)
+        self.interest_counts = catalog.tag_counts("related_interests").astype(np.float64)
+
+        self.growth_scores = catalog.numbers["growth_score"] * PREFERENCE_WEIGHT
+        self.stability_scores = catalog.numbers["stability_score"] * PREFERENCE_WEIGHT
+        self.market_scores = catalog.numbers["market_demand"] * MARKET_WEIGHT
+        self.risk_levels = np.asarray(catalog.numbers["risk_level"])
+
+        self.risk_scores = {
+            risk: 10 - np.abs(self.risk_levels - target)
+            for risk, target in RISK_TARGETS.items()
+        }
+
+    @classmethod
+    def from_careers(cls, careers: List[Dict]) -> "CareerMatrix":
+        return cls(CareerCatalog.from_records(careers))
+
+    @property
+    def version(self) -> str:
+        return self.catalog.version
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    # ---------------- Encoding
+
+    @staticmethod
+    def encode(values: List[str], vocabulary: Dict[str, int]) -> List[int]:
+        """
+        Sorted distinct IDs of the known values (set semantics).
+        Values outside the catalog vocabulary can never match and are dropped.
+        """
+
+        return sorted({vocabulary[value] for value in values if value in vocabulary})
+
+    def match_counts(self, postings: Tuple[np.ndarray, np.ndarray], ids: List[int]) -> np.ndarray:
+        """
+        For every career, how many of ids it lists: the postings of ids
+        concatenated and counted per career.
+        """
+
+        indptr, careers = postings
+
+        if not ids:
+            return np.zeros(len(self), dtype=np.float64)
+
+        hits = np.concatenate([careers[indptr[i]:indptr[i + 1]] for i in ids])
+        return np.bincount(hits, minlength=len(self)).astype(np.float64)
+
+    # ---------------- Scoring
+
+    def score_components(self, user_inputs: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Returns every score_career component as a (users x careers) array.
+        """
+
+        skill_matches = np.empty((len(user_inputs), len(self)), dtype=np.float64)
+        interest_matches = np.empty_like(skill_matches)
+
+        for row, user in enumerate(user_inputs):
+            skill_matches[row] = self.match_counts(
+                self.skill_postings, self.encode(user["skills"], self.skill_index)
+            )
+            interest_matches[row] = self.match_counts(
+                self.interest_postings, self.encode(user["interests"], self.interest_index)
+            )
+
+        skill_score = skill_matches / self.skill_counts * SKILL_WEIGHT
+        interest_score = interest_matches / self.interest_counts * INTEREST_WEIGHT
+
+        pref_score = np.empty_like(skill_score)
+        risk_score = np.empty_like(skill_score)
+
+        for row, user in enumerate(user_inputs):
+            pref_score[row] = self.preference_scores(user["career_mode"])
+            risk_score[row] = self.risk_scores[risk_key(user["risk_preference"])]
+
+        market_score = np.broadcast_to(self.market_scores, skill_score.shape)
+
+        # Same summation order as score_career so totals match exactly
+        total = skill_score + interest_score
+        total += pref_score
+        total += market_score
+        total += risk_score
+
+        return {
+            "skill_score": skill_score,
+            "interest_score": interest_score,
+            "growth_or_stability_score": pref_score,
+            "market_score": market_score,
+            "risk_alignment_score": risk_score,
+            "total_score": total,
+        }
+
+    def preference_scores(self, career_mode: str) -> np.ndarray:
+        if career_mode == "growth":
+            return self.growth_scores
+        return self.stability_scores
+
+    def score_batch(self, user_inputs: List[Dict]) -> np.ndarray:
+        return self.score_components(user_inputs)["total_score"]
+
+    def score(self, user_input: Dict) -> np.ndarray:
+        return self.score_batch([user_input])[0]
+
+    def rank(self, user_input: Dict) -> np.ndarray:
+        """
+        Career indexes ordered the way recommend_careers sorts them:
+        by rounded total score, descending, ties in catalog order.
+        """
+
+        rounded = round_scores(self.score(user_input))
+        return np.argsort(-rounded, kind="stable")
+
+    def top_k(self, user_input: Dict, k: int) -> List[int]:
+        """
+        The first k entries of rank(), without sorting the whole catalog.
+
+        np.partition finds the k-th best rounded score, and only careers at or
+        above it (ties included) go through the heap selection.
+        """
+
+        rounded = round_scores(self.score(user_input))
+        return select_top_k(rounded, k)
+
+    def breakdown(self, user_input: Dict, index: int) -> Dict:
+        """
+        score_career output for a single career, built from its catalog row.
+        """
+
+        catalog = self.catalog
+
+        # intersect1d counts each shared ID once, like the set intersection
+        skill_matches = float(len(np.intersect1d(
+            catalog.tag_ids("required_skills", index),
+            self.encode(user_input["skills"], self.skill_index)
+        )))
+        interest_matches = float(len(np.intersect1d(
+            catalog.tag_ids("related_interests", index),
+            self.encode(user_input["interests"], self.interest_index)
+        )))
+
+        skill_score = skill_matches / float(self.skill_counts[index]) * SKILL_WEIGHT
+        interest_score = (
+            interest_matches / float(self.interest_counts[index]) * INTEREST_WEIGHT
+        )
+        pref_score = float(self.preference_scores(user_input["career_mode"])[index])
+        market_score = float(self.market_scores[index])
+        risk_score = float(
+            self.risk_scores[risk_key(user_input["risk_preference"])][index]
+        )
+
+        # score_career keeps these ints for int catalog values (18, not 18.0)
+        market_score = same_type(market_score, catalog.numbers["market_demand"][index])
+        risk_score = same_type(risk_score, self.risk_levels[index])
+
+        total_score = (
+            skill_score +
+            interest_score +
+            pref_score +
+            market_score +
+            risk_score
+        )
+
+        return {
+            "skill_score": round(skill_score, 2),
+            "interest_score": round(interest_score, 2),
+            "mode_type": (
+                "growth" if user_input["career_mode"] == "growth" else "stability"
+            ),
+            "growth_or_stability_score": round(pref_score, 2),
+            "market_score": round(market_score, 2),
+            "risk_alignment_score": round(risk_score, 2),
+            "total_score": round(total_score, 2),
+        }
+
@@ -0,0 +1,275 @@
+# career_transition.py
+
+import heapq
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.career_catalog import SKILL_NEIGHBORS
+from app.services.career_matrix import CareerMatrix
+from app.services.skill_canonicalizer import canonical_skills
+
+
+DEFAULT_MAX_HOPS = 3
+DEFAULT_LIMIT = 5
+CACHE_SIZE = 4096
+
+# Added to a hop's cost at zero similarity, so cheap but unrelated
+# careers (few required skills, none shared) do not win by default
+DISSIMILARITY_COST = 2.0
+
+VIRTUAL_SOURCE = -1
+
+
+# ----------------------------
+# Seed Transitions
+# ----------------------------
+# Hand-picked moves from before the graph existed. A seeded target is
+# always a candidate from its source and its hop pays no dissimilarity
+# cost; it still costs the skills it needs. Names missing from the
+# catalog are ignored. ("ML Engineer" in the original list is the
+# catalog's "Machine Learning Engineer".)
+
+TRANSITION_SEEDS = {
+    "mechanical engineer": ["Robotics Engineer", "Data Analyst", "Machine Learning Engineer"],
+    "civil engineer": ["Data Analyst", "Project Manager"],
+    "accountant": ["Financial Analyst", "Data Analyst"],
+    "teacher": ["Instructional Designer", "Data Analyst"],
+    "software developer": ["Machine Learning Engineer", "Data Scientist"],
+}
+
+DEFAULT_SEEDS = ["Data Analyst", "Product Manager"]
+
+
+def mask_ids(mask: int) -> List[int]:
+    ids = []
+
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+
+    return ids
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def jaccard(left: int, right: int) -> float:
+    union = popcount(left | right)
+    return popcount(left & right) / union if union else 0.0
+
+
+# ----------------------------
+# Transition Graph
+# ----------------------------
+
+class TransitionGraph:
+    """
+    Career-to-career graph over the catalog.
+
+    Each career links to its most similar careers (Jaccard overlap of
+    required skills). A path accumulates skills: every career on it, the
+    source career and the user's own skills count as known. Moving to v
+    costs the number of v's skills not yet known, plus up to
+    DISSIMILARITY_COST the less v resembles the career it is reached
+    from. Paths are found with a hop-limited Dijkstra search.
+
+    The source also gets direct edges to the careers that are cheapest
+    for this user and to its TRANSITION_SEEDS, so careers outside the
+    catalog (or with no overlap) still get answers.
+
+    Neighbor lists come from the catalog (snapshots store them); query
+    results are cached per (source, user skill mask, seeds).
+    """
+
+    def __init__(self, matrix: CareerMatrix, neighbors: int = SKILL_NEIGHBORS):
+        self.matrix = matrix
+        self.catalog = matrix.catalog
+        self.neighbor_count = neighbors
+
+        # Distinct required skills per career
+        self.required_counts = np.bincount(matrix.skill_postings[1], minlength=len(self.catalog))
+        self._names = None
+
+        self._neighbors = None
+        self._similarity = None
+        self._lock = threading.Lock()
+
+        # Bitsets are unpacked per career on first use, not for the whole
+        # catalog up front
+        self.mask = lru_cache(maxsize=None)(self._mask)
+        self.search = lru_cache(maxsize=CACHE_SIZE)(self._search)
+
+    def _mask(self, career_id: int) -> int:
+        return self.catalog[career_id].skill_mask
+
+    # ---------------- Graph construction
+
+    def neighbors(self, career_id: int) -> List[Tuple[int, float]]:
+        if self._neighbors is None:
+            with self._lock:
+                if self._neighbors is None:
+                    # Stored in snapshots; built from the postings otherwise
+                    neighbors, similarity = self.catalog.skill_neighbors()
+                    self._similarity = similarity[:, :self.neighbor_count]
+                    self._neighbors = neighbors[:, :self.neighbor_count]
+
+        return [
+            (int(target), float(score))
+            for target, score in zip(self._neighbors[career_id], self._similarity[career_id])
+            if score > 0
+        ]
+
+    def direct_edges(self, known_mask: int, exclude: int) -> List[int]:
+        """
+        Careers with the fewest skills left to learn from the source.
+        """
+
+        known = mask_ids(known_mask)
+        missing = self.required_counts - self.matrix.match_counts(self.matrix.skill_postings, known)
+
+        if 0 <= exclude < len(missing):
+            missing[exclude] = np.inf
+
+        count = min(self.neighbor_count, len(missing))
+        if count == 0:
+            return []
+
+        best = np.argpartition(missing, count - 1)[:count]
+        return [int(target) for target in best if np.isfinite(missing[target])]
+
+    def seeds(self, career_name: str) -> Tuple[int, ...]:
+        names = TRANSITION_SEEDS.get(career_name.strip().lower(), DEFAULT_SEEDS)
+        targets = (self.resolve(name) for name in names)
+
+        return tuple(target for target in targets if target is not None)
+
+    # ---------------- Search
+
+    def resolve(self, career_name: str) -> Optional[int]:
+        if self._names is None:
+            # Decoded in one pass on the first lookup, not at snapshot build
+            self._names = {
+                name.lower(): career_id
+                for career_id, name in enumerate(self.catalog.text["name"].to_list())
+            }
+
+        return self._names.get(career_name.strip().lower())
+
+    def user_mask(self, skills: List[str]) -> int:
+        vocabulary = self.catalog.skills
+        mask = 0
+
+        for skill in canonical_skills(skills):
+            skill_id = vocabulary.get(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+
+        return mask
+
+    def hop(self, origin_mask: int, known: int, target: int, seeded: bool = False) -> Tuple[int, float]:
+        """
+        (skills needed, cost) of moving to target from a career with
+        origin_mask when known skills are already covered.
+        """
+
+        target_mask = self.mask(target)
+        needed = popcount(target_mask & ~known)
+
+        if seeded:
+            return needed, float(needed)
+
+        return needed, needed + DISSIMILARITY_COST * (1.0 - jaccard(origin_mask, target_mask))
+
+    def _search(self, source: int, user_mask: int, seeds: Tuple[int, ...], max_hops: int, limit: int) -> Tuple:
+        # Outside the catalog, the user's own skills stand in for the source
+        source_mask = self.mask(source) if source != VIRTUAL_SOURCE else user_mask
+
+        # (cost, hops, node, path, known skills, skills needed)
+        queue = [(0.0, 0, source, (), source_mask | user_mask, 0)]
+        fewest_hops = {}
+        reported = set()
+        settled = []
+
+        while queue and len(settled) < limit:
+            cost, hops, node, path, known, needed = heapq.heappop(queue)
+
+            # Entries pop in cost order, so the first one per node is its
+            # cheapest path
+            if node != source and node not in reported:
+                reported.add(node)
+                settled.append((needed, path))
+
+            # A cheaper visit with no more hops already expanded this node
+            if fewest_hops.get(node, max_hops + 1) <= hops or hops == max_hops:
+                continue
+            fewest_hops[node] = hops
+
+            if node == source:
+                targets = self.direct_edges(known, source) + list(seeds)
+                targets += [target for target, _ in self.neighbors(source)] if source != VIRTUAL_SOURCE else []
+                node_mask = source_mask
+            else:
+                targets = [target for target, _ in self.neighbors(node)]
+                node_mask = self.mask(node)
+
+            for target in dict.fromkeys(targets):
+                if target == source or target in path:
+                    continue
+
+                step_needed, step_cost = self.hop(node_mask, known, target, node == source and target in seeds)
+                heapq.heappush(queue, (
+                    cost + step_cost,
+                    hops + 1,
+                    target,
+                    path + (target,),
+                    known | self.mask(target),
+                    needed + step_needed
+                ))
+
+        return tuple(settled)
+
+    def transitions(
+        self,
+        current_career: str,
+        skills: List[str],
+        max_hops: int = DEFAULT_MAX_HOPS,
+        limit: int = DEFAULT_LIMIT
+    ) -> List[Dict]:
+
+        source = self.resolve(current_career)
+        if source is None:
+            source = VIRTUAL_SOURCE
+
+        user_mask = self.user_mask(skills)
+        seeds = self.seeds(current_career)
+        vocabulary = self.catalog.skills
+
+        results = []
+        for needed, path in self.search(source, user_mask, seeds, max_hops, limit):
+            hops = []
+            origin = source
+            known = user_mask | (0 if source == VIRTUAL_SOURCE else self.mask(source))
+
+            for target in path:
+                missing = self.mask(target) & ~known
+
+                hops.append({
+                    "from": current_career if origin == VIRTUAL_SOURCE else self.catalog[origin].name,
+                    "to": self.catalog[target].name,
+                    "skills_needed": [vocabulary.name(skill_id) for skill_id in mask_ids(missing)],
+                })
+                origin = target
+                known |= self.mask(target)
+
+            results.append({
+                "career": self.catalog[path[-1]].name,
+                "total_skills_needed": needed,
+                "hops": hops,
+            })
+
+        return results
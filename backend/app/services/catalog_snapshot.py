@@ -0,0 +1,362 @@
+# catalog_snapshot.py
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from app.services.career_catalog import (
+    CATALOG_PATH_ENV,
+    MANIFEST_FILE,
+    CareerCatalog,
+    load_default_catalog
+)
+from app.services.career_index import CareerIndex
+from app.services.career_matrix import CareerMatrix
+from app.services.career_transition import TransitionGraph
+from app.services.learning_plans import LearningPlanMemo
+
+
+# Seconds between checks of CAREER_CATALOG_PATH and the reload file;
+# 0 disables the watcher
+WATCH_INTERVAL_ENV = "CATALOG_WATCH_INTERVAL"
+DEFAULT_WATCH_INTERVAL = 5.0
+
+# Reload requests are broadcast to every worker through a file in this
+# app-owned directory (created private to the server's user)
+STATE_DIR_ENV = "CATALOG_STATE_DIR"
+DEFAULT_STATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "catalog_state"
+)
+RELOAD_FILE = "reload.json"
+
+# Catalogs a reload may name must live under this directory; defaults to
+# the directory of CAREER_CATALOG_PATH. Unset (and no catalog path)
+# allows only the default catalog.
+CATALOG_ROOT_ENV = "CAREER_CATALOG_ROOT"
+
+
+class CatalogPathRejected(ValueError):
+    pass
+
+
+def catalog_root() -> Optional[str]:
+    root = os.getenv(CATALOG_ROOT_ENV)
+    if root:
+        return os.path.realpath(root)
+
+    default_path = os.getenv(CATALOG_PATH_ENV)
+    return os.path.dirname(os.path.realpath(default_path)) if default_path else None
+
+
+def check_catalog_path(path: Optional[str]) -> Optional[str]:
+    """
+    path if a reload may load it; None (the default catalog) always may.
+    Raises CatalogPathRejected for anything outside catalog_root().
+    """
+
+    if not path:
+        return None
+
+    root = catalog_root()
+    resolved = os.path.realpath(path)
+
+    if root is None or os.path.commonpath([resolved, root]) != root:
+        raise CatalogPathRejected(f"Catalog path is outside the allowed catalog root: {path}")
+
+    return path
+
+
+# ----------------------------
+# Compiled Snapshot
+# ----------------------------
+
+class CatalogSnapshot:
+    """
+    Everything compiled from one catalog version: the catalog itself, the
+    scoring matrix, the inverted index, the learning plan memo and the
+    transition graph.
+
+    A snapshot is never modified after it is published. Requests grab the
+    current one once and use it until they finish, so a reload never
+    changes the data under an in-flight request.
+    """
+
+    def __init__(self, catalog: CareerCatalog, source: str = None):
+        self.catalog = catalog
+        self.source = source
+        self.matrix = CareerMatrix(catalog)
+        self.index = CareerIndex(self.matrix)
+        self.plans = LearningPlanMemo(catalog)
+        self.transitions = TransitionGraph(self.matrix)
+        self.loaded_at = time.time()
+
+    @property
+    def version(self) -> str:
+        return self.catalog.version
+
+    @classmethod
+    def build(cls, path: str = None) -> "CatalogSnapshot":
+        return cls(load_default_catalog(path), source=path or "builtin")
+
+
+def source_mtime(path: str) -> Optional[float]:
+    # Snapshot directories change when their manifest is replaced
+    if path and os.path.isdir(path):
+        path = os.path.join(path, MANIFEST_FILE)
+
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+# ----------------------------
+# Reload Broadcast
+# ----------------------------
+# Each worker process has its own holder, so the admin endpoint only
+# reaches the worker that served it. It also writes a reload request
+# here; every worker's watcher picks up requests it has not seen yet.
+
+def reload_file() -> str:
+    return os.path.join(os.getenv(STATE_DIR_ENV, DEFAULT_STATE_DIR), RELOAD_FILE)
+
+
+def trusted(handle) -> bool:
+    # Only requests this server's user wrote, in a file nobody else can edit
+    if not hasattr(os, "getuid"):
+        return True
+
+    info = os.fstat(handle.fileno())
+    return info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+def write_reload_request(path: Optional[str]) -> str:
+    request_id = uuid.uuid4().hex
+    target = reload_file()
+    os.makedirs(os.path.dirname(target), mode=0o700, exist_ok=True)
+
+    # Written aside and renamed so readers never see half a request
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump({"id": request_id, "path": path, "requested_at": time.time()}, handle)
+    os.replace(temp_path, target)
+
+    return request_id
+
+
+def read_reload_request() -> Optional[Dict]:
+    try:
+        with open(reload_file(), "r", encoding="utf-8") as handle:
+            if not trusted(handle):
+                return None
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+# ----------------------------
+# Snapshot Holder
+# ----------------------------
+
+class SnapshotHolder:
+    """
+    Owns the published snapshot and swaps in new ones.
+
+    Reloads build the next snapshot on a background thread and publish it
+    with a single reference assignment; readers never take the lock.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._init_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+        self.reloading = False
+        self.reloads = 0
+        self.last_error = None
+        self.watcher = None
+        self.stopping = threading.Event()
+
+        # The last broadcast names the catalog every worker serves; a
+        # worker started after it loads that catalog too
+        self.seen_request = None
+        self.source_path = os.getenv(CATALOG_PATH_ENV)
+
+        request = read_reload_request()
+        if request is not None:
+            self.seen_request = request["id"]
+            try:
+                self.source_path = check_catalog_path(request["path"]) or self.source_path
+            except CatalogPathRejected as error:
+                self.last_error = str(error)
+
+    def get(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._init_lock:
+            if self._snapshot is None:
+                self._snapshot = CatalogSnapshot.build(self.source_path)
+            return self._snapshot
+
+    def publish(self, snapshot: CatalogSnapshot) -> None:
+        self._snapshot = snapshot
+        self.reloads += 1
+
+    def reload(self, path: str = None, background: bool = True) -> bool:
+        """
+        Starts a rebuild from path (default: CAREER_CATALOG_PATH).
+        Returns False when another reload is already running. Raises
+        CatalogPathRejected for paths outside the catalog root.
+        """
+
+        path = check_catalog_path(path) or os.getenv(CATALOG_PATH_ENV)
+
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+
+        self.reloading = True
+
+        if background:
+            threading.Thread(
+                target=self._rebuild,
+                args=(path,),
+                name="catalog-reload",
+                daemon=True
+            ).start()
+        else:
+            self._rebuild(path)
+
+        return True
+
+    def broadcast_reload(self, path: str = None) -> bool:
+        """
+        Reloads this worker now and asks every other worker to follow
+        on its next watcher poll.
+        """
+
+        check_catalog_path(path)
+
+        self.seen_request = write_reload_request(path)
+        return self.reload(path)
+
+    def _rebuild(self, path: str) -> None:
+        try:
+            self.publish(CatalogSnapshot.build(path))
+            self.source_path = path
+            self.last_error = None
+        except Exception as error:
+            # Keep serving the old snapshot
+            self.last_error = f"{type(error).__name__}: {error}"
+        finally:
+            self.reloading = False
+            self._reload_lock.release()
+
+    def watch(self, interval: float) -> None:
+        """
+        Polls for broadcast reload requests and the mtime of the catalog
+        source in effect; reloads when either changes.
+        """
+
+        if self.watcher is not None:
+            return
+
+        def poll():
+            watched = self.source_path
+            last_seen = source_mtime(watched)
+
+            while not self.stopping.wait(interval):
+
+                # A busy reload is retried on the next poll
+                request = read_reload_request()
+                if request is not None and request["id"] != self.seen_request:
+                    try:
+                        started = self.reload(request["path"])
+                    except CatalogPathRejected as error:
+                        self.last_error = str(error)
+                        started = True
+
+                    if started:
+                        self.seen_request = request["id"]
+                    continue
+
+                # The source changes when a reload names another catalog
+                if self.source_path != watched:
+                    watched = self.source_path
+                    last_seen = source_mtime(watched)
+                    continue
+
+                current = source_mtime(watched)
+                if current is not None and current != last_seen:
+                    if self.reload(watched):
+                        last_seen = current
+
+        self.stopping.clear()
+        self.watcher = threading.Thread(target=poll, name="catalog-watch", daemon=True)
+        self.watcher.start()
+
+    def stop_watching(self) -> None:
+        if self.watcher is not None:
+            self.stopping.set()
+            self.watcher.join()
+            self.watcher = None
+
+    def status(self) -> Dict:
+        snapshot = self._snapshot
+
+        return {
+            "catalog_version": snapshot.version if snapshot else None,
+            "careers": len(snapshot.catalog) if snapshot else 0,
+            "source": snapshot.source if snapshot else None,
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+            "reloading": self.reloading,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+            "watching": self.watcher is not None,
+            "last_reload_request": self.seen_request,
+        }
+
+
+snapshot_holder = SnapshotHolder()
+
+
+# Set per request, so everything it computes and reports uses one snapshot
+_pinned: ContextVar[Optional[CatalogSnapshot]] = ContextVar("catalog_snapshot", default=None)
+
+
+def get_snapshot() -> CatalogSnapshot:
+    snapshot = _pinned.get()
+    if snapshot is not None:
+        return snapshot
+
+    return snapshot_holder.get()
+
+
+@contextmanager
+def pin_snapshot() -> Iterator[CatalogSnapshot]:
+    """
+    Makes the current snapshot the one get_snapshot() returns for the
+    enclosed code, even if a reload publishes another meanwhile.
+    """
+
+    snapshot = snapshot_holder.get()
+    token = _pinned.set(snapshot)
+
+    try:
+        yield snapshot
+    finally:
+        _pinned.reset(token)
+
+
+def start_catalog_watcher() -> None:
+    interval = float(os.getenv(WATCH_INTERVAL_ENV, str(DEFAULT_WATCH_INTERVAL)))
+
+    if interval > 0:
+        snapshot_holder.watch(interval)
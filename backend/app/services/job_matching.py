@@ -0,0 +1,238 @@
+# job_matching.py
+
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.career_catalog import Vocabulary
+from app.services.resume_parser.extractor import match_job_description
+from app.services.skill_canonicalizer import canonical_skill
+
+
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 100
+
+# Candidates scored per block; bounds the (candidates x jobs) count buffer
+DEFAULT_CHUNK_SIZE = 2048
+
+# Per-request caps: the work grows with candidates x jobs
+MAX_MATCH_CANDIDATES = int(os.getenv("JOB_MATCH_MAX_CANDIDATES", "10000"))
+MAX_MATCH_JOBS = int(os.getenv("JOB_MATCH_MAX_JOBS", "10000"))
+MAX_MATCH_PAIRS = int(os.getenv("JOB_MATCH_MAX_PAIRS", "10000000"))
+
+
+class MatchTooLarge(ValueError):
+    pass
+
+
+def check_match_size(candidates: int, jobs: int) -> None:
+    # Raises MatchTooLarge when a request exceeds the caps above
+    if candidates > MAX_MATCH_CANDIDATES:
+        raise MatchTooLarge(f"At most {MAX_MATCH_CANDIDATES} candidates per request, got {candidates}")
+
+    if jobs > MAX_MATCH_JOBS:
+        raise MatchTooLarge(f"At most {MAX_MATCH_JOBS} jobs per request, got {jobs}")
+
+    if candidates * jobs > MAX_MATCH_PAIRS:
+        raise MatchTooLarge(
+            f"At most {MAX_MATCH_PAIRS} candidate-job pairs per request, got {candidates * jobs}"
+        )
+
+
+# ----------------------------
+# Encoding
+# ----------------------------
+
+class SkillNormalizer:
+    """
+    canonical_skill memoized for one build; resumes repeat the same
+    few hundred surfaces many times over.
+    """
+
+    def __init__(self):
+        self.memo: Dict[str, str] = {}
+
+    def canonical_set(self, skills: List[str]) -> List[str]:
+        # Same normalization as match_job_description
+        canonical = set()
+
+        for skill in skills:
+            value = self.memo.get(skill)
+            if value is None:
+                value = self.memo[skill] = canonical_skill(skill)
+            canonical.add(value)
+
+        canonical.discard("")
+        return sorted(canonical)
+
+
+def encode_sparse(groups: List[List[str]], vocabulary: Vocabulary) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSR-style (indptr, ids) of each group's known skills. Skills no job
+    asks for can never match, so they are dropped here.
+    """
+
+    indptr = np.zeros(len(groups) + 1, dtype=np.int64)
+    ids = []
+
+    for row, skills in enumerate(groups):
+        known = [vocabulary.ids[skill] for skill in skills if skill in vocabulary]
+        ids.extend(known)
+        indptr[row + 1] = indptr[row] + len(known)
+
+    return indptr, np.asarray(ids, dtype=np.int64)
+
+
+# ----------------------------
+# Top-K Selection
+# ----------------------------
+
+def top_k_rows(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (indexes, scores) of the k highest scores in every row, best first,
+    ties broken by lowest column index like select_top_k.
+    """
+
+    rows, columns = scores.shape
+    k = min(k, columns)
+
+    if k <= 0 or rows == 0:
+        return np.zeros((rows, 0), dtype=np.int64), np.zeros((rows, 0), dtype=scores.dtype)
+
+    # One unique key per cell: higher score first, then lower column
+    keys = scores.astype(np.int64) * columns + (columns - 1 - np.arange(columns))
+
+    if k < columns:
+        top = np.argpartition(keys, columns - k, axis=1)[:, columns - k:]
+    else:
+        top = np.broadcast_to(np.arange(columns), (rows, columns)).copy()
+
+    order = np.argsort(-np.take_along_axis(keys, top, axis=1), axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+
+    return top, np.take_along_axis(scores, top, axis=1)
+
+
+# ----------------------------
+# Match Matrix
+# ----------------------------
+
+class JobMatchMatrix:
+    """
+    match_score of every candidate against every job, as one
+    (candidates x jobs) uint8 matrix.
+
+    Jobs are compiled into a (skills x jobs) incidence matrix over the
+    skills any job asks for. A candidate's match counts are the sum of
+    the incidence rows for its skills, so the work per candidate is its
+    skill count times the number of jobs, whatever the vocabulary size.
+
+    Scores are identical to match_job_description.
+    """
+
+    def __init__(
+        self,
+        candidate_skills: List[List[str]],
+        job_skills: List[List[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        normalizer = SkillNormalizer()
+        self.candidates = [normalizer.canonical_set(skills) for skills in candidate_skills]
+        self.jobs = [normalizer.canonical_set(skills) for skills in job_skills]
+        self.chunk_size = chunk_size
+
+        self.vocabulary = Vocabulary()
+        for skills in self.jobs:
+            for skill in skills:
+                self.vocabulary.intern(skill)
+
+        self.job_sizes = np.array([len(skills) for skills in self.jobs], dtype=np.float64)
+
+        job_indptr, job_ids = encode_sparse(self.jobs, self.vocabulary)
+        # The extra last row is all zeros; padded skill slots point at it
+        self.padding = len(self.vocabulary)
+        self.job_incidence = np.zeros((self.padding + 1, len(self.jobs)), dtype=np.uint8)
+        self.job_incidence[job_ids, np.repeat(np.arange(len(self.jobs)), np.diff(job_indptr))] = 1
+
+        self.candidate_indptr, self.candidate_ids = encode_sparse(self.candidates, self.vocabulary)
+        self.candidate_lengths = np.diff(self.candidate_indptr)
+
+        # Position -1 holds the padding row, for the slots past a candidate's skills
+        self.candidate_ids = np.append(self.candidate_ids, self.padding)
+
+        self.scores = self._score()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.candidates), len(self.jobs)
+
+    # ---------------- Scoring
+
+    def match_counts(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Matched skill counts for the given candidates against every job:
+        the sum of the incidence rows of each candidate's skills.
+        """
+
+        lengths = self.candidate_lengths[rows]
+        width = int(lengths.max()) if len(rows) else 0
+
+        # (candidates x width) skill IDs, short rows padded with the zero row
+        slots = np.arange(width) < lengths[:, None]
+        positions = np.where(slots, self.candidate_indptr[rows][:, None] + np.arange(width), -1)
+        padded = self.candidate_ids[positions]
+
+        # One pass per skill slot, each a contiguous row gather and add
+        counts = np.zeros((len(rows), len(self.jobs)), dtype=np.uint16)
+        for slot in range(width):
+            np.add(counts, self.job_incidence[padded[:, slot]], out=counts)
+
+        return counts
+
+    def _score(self) -> np.ndarray:
+        rows, columns = self.shape
+        scores = np.zeros((rows, columns), dtype=np.uint8)
+
+        # match_job_description scores an empty job 0
+        sizes = np.where(self.job_sizes > 0, self.job_sizes, 1.0)
+
+        # Blocks of similar skill counts keep padding to a minimum
+        order = np.argsort(self.candidate_lengths, kind="stable")
+
+        for start in range(0, rows, self.chunk_size):
+            block = order[start:start + self.chunk_size]
+            counts = self.match_counts(block)
+
+            # Same float ops as round((matched / job) * 100); rint rounds
+            # half to even like Python's round()
+            scores[block] = np.rint(counts / sizes * 100)
+
+        return scores
+
+    # ---------------- Ranking
+
+    def top_jobs(self, k: int = DEFAULT_TOP_K) -> Tuple[np.ndarray, np.ndarray]:
+        # (job indexes, scores), one row per candidate
+        return self._top_k(self.scores, k)
+
+    def top_candidates(self, k: int = DEFAULT_TOP_K) -> Tuple[np.ndarray, np.ndarray]:
+        # (candidate indexes, scores), one row per job
+        return self._top_k(self.scores.T, k)
+
+    def _top_k(self, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        indexes = np.zeros((scores.shape[0], min(k, scores.shape[1])), dtype=np.int64)
+        values = np.zeros(indexes.shape, dtype=scores.dtype)
+
+        # Row blocks keep the int64 key buffer in top_k_rows small
+        for start in range(0, scores.shape[0], self.chunk_size):
+            stop = min(start + self.chunk_size, scores.shape[0])
+            indexes[start:stop], values[start:stop] = top_k_rows(
+                np.ascontiguousarray(scores[start:stop]), k
+            )
+
+        return indexes, values
+
+    def details(self, candidate: int, job: int) -> Dict:
+        # Full match_job_description output for one pair
+        return match_job_description(self.candidates[candidate], self.jobs[job])
@@ -1,3 +1,5 @@
+import os
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
@@ -10,6 +12,21 @@ from app.services.auth_service import SECRET_KEY, ALGORITHM
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+# Comma separated emails allowed to call /admin endpoints
+ADMIN_EMAILS = {
+    email.strip().lower()
+    for email in os.getenv("ADMIN_EMAILS", "").split(",")
+    if email.strip()
+}
+
+# Comma separated emails allowed to search every candidate and see their
+# contact details; admins always can
+RECRUITER_EMAILS = {
+    email.strip().lower()
+    for email in os.getenv("RECRUITER_EMAILS", "").split(",")
+    if email.strip()
+}
+
 
 def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     credentials_exception = HTTPException(
@@ -36,3 +53,18 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         raise credentials_exception
 
     return user
+
+
+def is_admin(user: User) -> bool:
+    return user.email.lower() in ADMIN_EMAILS
+
+
+def is_recruiter(user: User) -> bool:
+    return is_admin(user) or user.email.lower() in RECRUITER_EMAILS
+
+
+def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    if not is_admin(user):
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return user
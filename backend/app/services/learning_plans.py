@@ -0,0 +1,159 @@
+# learning_plans.py
+
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from app.services.career_catalog import CareerCatalog
+from app.services.skill_canonicalizer import canonical_skill
+
+
+DEFAULT_FOCUS = "Structured learning required"
+
+# skill -> (difficulty, estimated time); everything else is "High"
+SKILL_DIFFICULTY = {
+    "communication": ("Low", "1-2 Months"),
+    "general knowledge": ("Low", "1-2 Months"),
+    "python": ("Medium", "2-3 Months"),
+    "statistics": ("Medium", "2-3 Months"),
+    "analysis": ("Medium", "2-3 Months"),
+}
+DEFAULT_DIFFICULTY = ("High", "3-4 Months")
+
+DIFFICULTY_ORDER = {"High": 1, "Medium": 2, "Low": 3}
+
+PHASE_1 = "Phase 1 (Month 1-2)"
+PHASE_2 = "Phase 2 (Month 3-5)"
+PHASE_3 = "Phase 3 (Month 6-9)"
+PHASE_4 = "Phase 4 (Month 10-12)"
+
+FINAL_PHASE_STEPS = (
+    "Build portfolio projects",
+    "Apply for internships / real-world opportunities",
+    "Optimize resume & LinkedIn"
+)
+
+MEMO_SIZE = 65536
+
+
+# ----------------------------
+# Immutable Building Blocks
+# ----------------------------
+
+class LearningStep(NamedTuple):
+    skill_to_learn: str
+    recommended_focus: str
+    difficulty_level: str
+    estimated_timeline: str
+
+
+Roadmap = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def build_learning_step(skill: str, learning_paths: Dict[str, str]) -> LearningStep:
+    difficulty, estimated_time = SKILL_DIFFICULTY.get(skill, DEFAULT_DIFFICULTY)
+
+    return LearningStep(
+        skill_to_learn=skill,
+        recommended_focus=learning_paths.get(skill, DEFAULT_FOCUS),
+        difficulty_level=difficulty,
+        estimated_timeline=estimated_time
+    )
+
+
+def sort_steps(steps: Sequence[LearningStep]) -> Tuple[LearningStep, ...]:
+    # High difficulty first, stable within a level
+    return tuple(sorted(steps, key=lambda step: DIFFICULTY_ORDER[step.difficulty_level]))
+
+
+def build_roadmap(skills: Sequence[str]) -> Roadmap:
+
+    if not skills:
+        return (
+            (PHASE_1, ("Strengthen core fundamentals",)),
+            (PHASE_2, ("Build intermediate projects",)),
+            (PHASE_3, ("Develop specialization & advanced projects",)),
+            (PHASE_4, FINAL_PHASE_STEPS),
+        )
+
+    return (
+        (PHASE_1, tuple(f"Learn fundamentals of {skill}" for skill in skills)),
+        (PHASE_2, tuple(f"Build practical projects using {skill}" for skill in skills)),
+        (PHASE_3, tuple(f"Advanced specialization & optimization in {skill}" for skill in skills)),
+        (PHASE_4, FINAL_PHASE_STEPS),
+    )
+
+
+def plan_to_list(plan: Sequence[LearningStep]) -> List[Dict]:
+    return [step._asdict() for step in plan]
+
+
+def roadmap_to_dict(roadmap: Roadmap) -> Dict[str, List[str]]:
+    return {phase: list(steps) for phase, steps in roadmap}
+
+
+# ----------------------------
+# Memo Table
+# ----------------------------
+
+class LearningPlanMemo:
+    """
+    Skill gap plans and roadmaps memoized per (career ID, missing-skill mask).
+
+    Bit i of the mask is the i-th distinct required skill ID of the
+    career. The memoized plans are tuples of LearningStep and are shared
+    between requests; callers get fresh lists/dicts from lookup().
+    """
+
+    def __init__(self, catalog: CareerCatalog, max_entries: int = MEMO_SIZE):
+        self.catalog = catalog
+
+        self.career_steps = lru_cache(maxsize=max_entries)(self._career_steps)
+        self.plan = lru_cache(maxsize=max_entries)(self._plan)
+
+    def _career_steps(self, career_id: int) -> Tuple[Tuple[int, ...], Tuple[LearningStep, ...]]:
+        career = self.catalog[career_id]
+        learning_paths = career.learning_paths
+        vocabulary = self.catalog.skills
+
+        skill_ids = tuple(dict.fromkeys(int(value) for value in career.skill_ids))
+        steps = tuple(
+            build_learning_step(vocabulary.name(skill_id), learning_paths)
+            for skill_id in skill_ids
+        )
+
+        return skill_ids, steps
+
+    def missing_mask(self, career_id: int, user_skills: Sequence[str]) -> int:
+        skill_ids, _ = self.career_steps(career_id)
+
+        vocabulary = self.catalog.skills
+        user_ids = {vocabulary.get(canonical_skill(skill)) for skill in user_skills}
+
+        mask = 0
+        for bit, skill_id in enumerate(skill_ids):
+            if skill_id not in user_ids:
+                mask |= 1 << bit
+
+        return mask
+
+    def _plan(self, career_id: int, mask: int) -> Tuple[Tuple[LearningStep, ...], Roadmap]:
+        _, steps = self.career_steps(career_id)
+
+        plan = sort_steps([step for bit, step in enumerate(steps) if mask >> bit & 1])
+        roadmap = build_roadmap([step.skill_to_learn for step in plan])
+
+        return plan, roadmap
+
+    def lookup(self, career_id: int, user_skills: Sequence[str]) -> Tuple[List[Dict], Dict[str, List[str]]]:
+        plan, roadmap = self.plan(career_id, self.missing_mask(career_id, user_skills))
+        return plan_to_list(plan), roadmap_to_dict(roadmap)
+
+    def stats(self) -> Dict:
+        info = self.plan.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "entries": info.currsize,
+            "max_entries": info.maxsize,
+        }
+
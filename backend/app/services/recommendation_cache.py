@@ -0,0 +1,230 @@
+# recommendation_cache.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.services.skill_canonicalizer import canonical_skills
+
+
+CACHE_SIZE = int(os.getenv("RECOMMENDATION_CACHE_SIZE", "4096"))
+CACHE_TTL_SECONDS = float(os.getenv("RECOMMENDATION_CACHE_TTL", "3600"))
+
+# Optional shared backend, e.g. "recommendation_cache.sqlite3"
+CACHE_SQLITE_PATH = os.getenv("RECOMMENDATION_CACHE_SQLITE")
+
+
+# ----------------------------
+# Canonical Input
+# ----------------------------
+
+def canonical_input(user_input: Dict) -> Dict:
+    """
+    The form the scorer sees: canonical (alias-resolved) skills, as the
+    catalog stores them, and deduplicated, sorted interests. Both are
+    matched as sets, so neither step changes a score. Interests, mode and
+    risk are otherwise passed through as given, since the scorer compares
+    them verbatim.
+    """
+
+    return {
+        "skills": canonical_skills(user_input["skills"]),
+        "interests": sorted(set(user_input["interests"])),
+        "career_mode": user_input["career_mode"],
+        "risk_preference": user_input["risk_preference"],
+    }
+
+
+def cache_key(canonical: Dict, top_k: int, version: str) -> str:
+    # Built from exactly what gets scored, so equal keys mean equal results
+    return json.dumps([version, canonical, top_k], sort_keys=True, separators=(",", ":"))
+
+
+# ----------------------------
+# Shared Backend
+# ----------------------------
+
+class SQLiteCacheBackend:
+    """
+    Cache shared between processes through a local SQLite file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS recommendation_cache ("
+            " key TEXT PRIMARY KEY,"
+            " version TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, key: str, version: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value, expires_at FROM recommendation_cache"
+                " WHERE key = ? AND version = ?",
+                (key, version)
+            ).fetchone()
+
+        if row is None or row[1] < time.time():
+            return None
+
+        return json.loads(row[0])
+
+    def set(self, key: str, version: str, value: Dict, expires_at: float) -> None:
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO recommendation_cache"
+                " (key, version, value, expires_at) VALUES (?, ?, ?, ?)",
+                (key, version, json.dumps(value), expires_at)
+            )
+            self.connection.commit()
+
+    def purge(self) -> None:
+        # Only expired rows: workers still serving an older catalog keep
+        # reading theirs until the reload reaches them
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM recommendation_cache WHERE expires_at < ?",
+                (time.time(),)
+            )
+            self.connection.commit()
+
+
+# ----------------------------
+# LRU + TTL Cache
+# ----------------------------
+
+class RecommendationCache:
+    """
+    In-process LRU cache with per-entry TTL, optionally backed by a shared
+    store. Keys carry the catalog version, so a reload needs no purge:
+    entries for the old catalog stop being hit and age out of the LRU.
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_SIZE,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        backend: SQLiteCacheBackend = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+
+        self.entries = OrderedDict()
+        self.version = None
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.version_changes = 0
+        self.shared_hits = 0
+
+    def _check_version(self, version: str) -> bool:
+        # True the first time a new catalog version is seen
+        if version == self.version:
+            return False
+
+        if self.version is not None:
+            self.version_changes += 1
+
+        self.version = version
+        return True
+
+    def get(self, key: str, version: str) -> Optional[Dict]:
+        now = time.time()
+
+        with self.lock:
+            changed = self._check_version(version)
+
+        if changed and self.backend is not None:
+            self.backend.purge()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+
+                if expires_at >= now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self.entries[key]
+                self.expirations += 1
+
+        if self.backend is not None:
+            value = self.backend.get(key, version)
+
+            if value is not None:
+                with self.lock:
+                    self.hits += 1
+                    self.shared_hits += 1
+                    self._store(key, value, now + self.ttl_seconds)
+                return value
+
+        with self.lock:
+            self.misses += 1
+
+        return None
+
+    def set(self, key: str, version: str, value: Dict) -> None:
+        expires_at = time.time() + self.ttl_seconds
+
+        with self.lock:
+            self._check_version(version)
+            self._store(key, value, expires_at)
+
+        if self.backend is not None:
+            self.backend.set(key, version, value, expires_at)
+
+    def _store(self, key: str, value: Dict, expires_at: float) -> None:
+        self.entries[key] = (expires_at, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "catalog_version": self.version,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "version_changes": self.version_changes,
+                "shared_backend": self.backend.path if self.backend else None,
+                "shared_hits": self.shared_hits,
+            }
+
+
+recommendation_cache = RecommendationCache(
+    backend=SQLiteCacheBackend(CACHE_SQLITE_PATH) if CACHE_SQLITE_PATH else None
+)
@@ -0,0 +1,332 @@
+# resume_jobs.py
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.database import SessionLocal
+from app.models import ResumeJob
+from app.services.candidate_store import save_candidate
+from app.services.resume_parser import timing
+from app.services.resume_parser.parse_cache import PARSER_VERSION
+from app.services.resume_parser.parse_pool import PoolBusy
+from app.services.resume_parser.resume_service import process_resume
+from app.services.skill_canonicalizer import canonical_skills
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+TERMINAL_STATES = (DONE, FAILED)
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("RESUME_JOB_WORKERS", "2"))
+
+# Seconds a worker sleeps when idle or when the parser pool is full
+JOB_POLL_SECONDS = float(os.getenv("RESUME_JOB_POLL", "1.0"))
+
+# Seconds between heartbeats from the worker running a job
+JOB_HEARTBEAT_SECONDS = float(os.getenv("RESUME_JOB_HEARTBEAT", "10"))
+
+# A running job without a heartbeat for this long lost its worker (the
+# process died) and is queued again. Time spent waiting for the parser
+# pool counts as alive, since the heartbeat keeps going meanwhile
+JOB_STALE_SECONDS = float(os.getenv("RESUME_JOB_STALE", "60"))
+
+# Seconds between checks for such jobs while the worker is idle
+REQUEUE_CHECK_SECONDS = 30.0
+
+
+def dedupe_key(digest: str, pdf_backend: Optional[str], job_skills: List[str], user_id: int) -> str:
+    # Per user: a coalesced job is only ever handed back to its owner.
+    # Per parser version: results from an older parser are not reused
+    return json.dumps(
+        [PARSER_VERSION, user_id, digest, pdf_backend, canonical_skills(job_skills)],
+        separators=(",", ":")
+    )
+
+
+def job_to_dict(job: ResumeJob) -> Dict:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+# ----------------------------
+# Submission
+# ----------------------------
+
+def submit_job(
+    content: bytes,
+    digest: str,
+    job_skills: List[str],
+    pdf_backend: Optional[str],
+    user_id: int
+) -> Tuple[ResumeJob, bool]:
+    """
+    Queues a parse of content. Returns (job, coalesced); coalesced is True
+    when an identical submission that has not failed already exists.
+    """
+
+    key = dedupe_key(digest, pdf_backend, job_skills, user_id)
+    db = SessionLocal()
+
+    try:
+        existing = (
+            db.query(ResumeJob)
+            .filter(ResumeJob.dedupe_key == key, ResumeJob.status != FAILED)
+            .order_by(ResumeJob.created_at.desc())
+            .first()
+        )
+
+        if existing is not None:
+            db.expunge(existing)
+            return existing, True
+
+        job = ResumeJob(
+            id=uuid.uuid4().hex,
+            status=QUEUED,
+            dedupe_key=key,
+            content_hash=digest,
+            pdf_backend=pdf_backend,
+            job_skills=json.dumps(job_skills),
+            content=content,
+            user_id=user_id
+        )
+
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        db.expunge(job)
+    finally:
+        db.close()
+
+    job_worker.notify()
+    return job, False
+
+
+def get_job(job_id: str) -> Optional[ResumeJob]:
+    db = SessionLocal()
+
+    try:
+        job = db.query(ResumeJob).filter(ResumeJob.id == job_id).first()
+        if job is not None:
+            db.expunge(job)
+        return job
+    finally:
+        db.close()
+
+
+# ----------------------------
+# Worker
+# ----------------------------
+
+class ResumeJobWorker:
+    """
+    Background threads that drain queued jobs from the database.
+
+    Jobs are claimed with a conditional UPDATE, so several threads (or
+    processes) never run the same job. While a job runs its worker
+    refreshes heartbeat_at; a running job whose heartbeat is older than
+    stale_seconds was left behind by a process that died, and idle
+    workers queue it again. Jobs other live processes are running are
+    left alone.
+    """
+
+    def __init__(
+        self,
+        threads: int = JOB_WORKERS,
+        poll_seconds: float = JOB_POLL_SECONDS,
+        stale_seconds: float = JOB_STALE_SECONDS,
+        heartbeat_seconds: float = JOB_HEARTBEAT_SECONDS
+    ):
+        self.threads = threads
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.last_requeue = 0.0
+
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.workers: List[threading.Thread] = []
+
+    def notify(self) -> None:
+        self.wakeup.set()
+
+    def start(self) -> None:
+        if self.workers:
+            return
+
+        self.requeue_stale()
+        self.stopping.clear()
+
+        for index in range(self.threads):
+            worker = threading.Thread(target=self.run, name=f"resume-job-{index}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def stop(self) -> None:
+        self.stopping.set()
+        self.wakeup.set()
+        self.workers = []
+
+    def requeue_stale(self) -> int:
+        self.last_requeue = time.monotonic()
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+        db = SessionLocal()
+
+        try:
+            requeued = db.query(ResumeJob).filter(
+                ResumeJob.status == RUNNING,
+                ResumeJob.heartbeat_at < cutoff
+            ).update(
+                {"status": QUEUED, "started_at": None, "heartbeat_at": None},
+                synchronize_session=False
+            )
+            db.commit()
+            return requeued
+        finally:
+            db.close()
+
+    def claim(self) -> Optional[str]:
+        db = SessionLocal()
+
+        try:
+            candidates = (
+                db.query(ResumeJob.id)
+                .filter(ResumeJob.status == QUEUED)
+                .order_by(ResumeJob.created_at)
+                .limit(self.threads * 2)
+                .all()
+            )
+
+            for (job_id,) in candidates:
+                now = datetime.utcnow()
+                claimed = (
+                    db.query(ResumeJob)
+                    .filter(ResumeJob.id == job_id, ResumeJob.status == QUEUED)
+                    .update(
+                        {"status": RUNNING, "started_at": now, "heartbeat_at": now},
+                        synchronize_session=False
+                    )
+                )
+                db.commit()
+
+                if claimed:
+                    return job_id
+
+            return None
+        finally:
+            db.close()
+
+    def run(self) -> None:
+        while not self.stopping.is_set():
+            job_id = self.claim()
+
+            if job_id is None:
+                if time.monotonic() - self.last_requeue >= REQUEUE_CHECK_SECONDS:
+                    self.requeue_stale()
+
+                self.wakeup.wait(self.poll_seconds)
+                self.wakeup.clear()
+                continue
+
+            if not self.process(job_id):
+                # Parser pool is full; give it a moment
+                self.stopping.wait(self.poll_seconds)
+
+    @contextmanager
+    def heartbeat(self, job_id: str):
+        # Refreshes the job's heartbeat_at from a side thread until exit
+        finished = threading.Event()
+
+        def beat():
+            while not finished.wait(self.heartbeat_seconds):
+                db = SessionLocal()
+                try:
+                    db.query(ResumeJob).filter(
+                        ResumeJob.id == job_id,
+                        ResumeJob.status == RUNNING
+                    ).update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+                    db.commit()
+                finally:
+                    db.close()
+
+        thread = threading.Thread(target=beat, name=f"resume-job-heartbeat-{job_id}", daemon=True)
+        thread.start()
+
+        try:
+            yield
+        finally:
+            finished.set()
+            thread.join()
+
+    def process(self, job_id: str) -> bool:
+        """
+        Runs one claimed job. Returns False if it was put back in the queue.
+        """
+
+        db = SessionLocal()
+
+        try:
+            job = db.query(ResumeJob).filter(ResumeJob.id == job_id).first()
+
+            # Deleted after it was claimed
+            if job is None:
+                return True
+
+            try:
+                with self.heartbeat(job_id), timing.collect() as timer:
+                    result = process_resume(
+                        job.content,
+                        json.loads(job.job_skills or "[]"),
+                        job.pdf_backend,
+                        job.content_hash
+                    )
+                timing.timing_metrics.record(timer)
+            except PoolBusy:
+                job.status = QUEUED
+                job.started_at = None
+                job.heartbeat_at = None
+                db.commit()
+                return False
+            except Exception as error:
+                job.status = FAILED
+                job.error = str(error) or type(error).__name__
+            else:
+                job.status = DONE
+                job.result = json.dumps(result)
+
+            job.content = None
+            job.finished_at = datetime.utcnow()
+            db.commit()
+
+            if job.status == DONE:
+                # The parse succeeded either way; a store error only costs
+                # the candidate its place in search
+                try:
+                    save_candidate(result, job.content_hash, job.user_id)
+                except Exception:
+                    logger.exception("Could not store candidate for resume job %s", job_id)
+
+            return True
+        finally:
+            db.close()
+
+
+job_worker = ResumeJobWorker()
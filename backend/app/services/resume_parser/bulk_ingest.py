@@ -0,0 +1,478 @@
+# bulk_ingest.py
+#
+# python -m app.services.resume_parser.bulk_ingest resumes/ drive.zip \
+#     --output parsed.jsonl [--format parquet] [--workers 4] [--timeout 30]
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from app.services.resume_parser.parse_cache import content_hash
+from app.services.resume_parser.parse_pool import PARSE_TIMEOUT_SECONDS, PARSE_WORKERS, ParsePool
+from app.services.resume_parser.pdf_backends import BACKENDS, DEFAULT_BACKEND
+
+
+# Separates an archive path from the member name in a source id
+ZIP_SEPARATOR = "!"
+
+# Records per Parquet part file
+PARQUET_BATCH = 500
+
+PROGRESS_SECONDS = 5.0
+
+# Failure stages, in pipeline order
+READ = "read"
+PARSE = "parse"
+STORE = "store"
+WRITE = "write"
+
+
+class ResumeSource(NamedTuple):
+    source_id: str
+    path: str
+    member: Optional[str]
+
+
+# ----------------------------
+# Discovery
+# ----------------------------
+
+def is_pdf(name: str) -> bool:
+    return name.lower().endswith(".pdf")
+
+
+def archive_sources(path: str) -> Iterator[ResumeSource]:
+    with zipfile.ZipFile(path) as archive:
+        for member in sorted(archive.namelist()):
+            if is_pdf(member) and not member.endswith("/"):
+                yield ResumeSource(f"{path}{ZIP_SEPARATOR}{member}", path, member)
+
+
+def discover(paths: List[str]) -> Iterator[ResumeSource]:
+    """
+    Every PDF under paths, in a stable order. Directories are walked
+    recursively and zip archives are read member by member.
+    """
+
+    for path in paths:
+        path = os.path.abspath(path)
+
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    full_path = os.path.join(root, name)
+
+                    if is_pdf(name):
+                        yield ResumeSource(full_path, full_path, None)
+                    elif zipfile.is_zipfile(full_path):
+                        yield from archive_sources(full_path)
+
+        elif zipfile.is_zipfile(path):
+            yield from archive_sources(path)
+
+        else:
+            yield ResumeSource(path, path, None)
+
+
+def read_source(source: ResumeSource) -> bytes:
+    if source.member is None:
+        with open(source.path, "rb") as handle:
+            return handle.read()
+
+    with zipfile.ZipFile(source.path) as archive:
+        return archive.read(source.member)
+
+
+# ----------------------------
+# Parsing
+# ----------------------------
+
+def ingest_one(
+    source: ResumeSource,
+    job_skills: List[str],
+    pdf_backend: Optional[str],
+    pool: ParsePool
+) -> Tuple[ResumeSource, Optional[str], object]:
+    """
+    (source, None, record) on success, (source, stage, error) on failure.
+    A parse that runs past the pool's timeout has its worker killed and
+    fails with ParseTimeout.
+    """
+
+    from app.services.resume_parser.resume_service import process_resume
+
+    try:
+        content = read_source(source)
+    except Exception as error:
+        return source, READ, f"{type(error).__name__}: {error}"
+
+    digest = content_hash(content)
+
+    try:
+        result = process_resume(content, job_skills, pdf_backend, digest, pool=pool)
+    except Exception as error:
+        return source, PARSE, f"{type(error).__name__}: {error}"
+
+    return source, None, {"source": source.source_id, "content_hash": digest, **result}
+
+
+# ----------------------------
+# Checkpoint
+# ----------------------------
+
+class Checkpoint:
+    """
+    Append-only log of finished sources, one JSON line each. A source is
+    logged only after its record reached the output, so a rerun skips
+    exactly the work that is already on disk. Records a crash left in
+    the output but not in the log are caught up with recover().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        self.failed: Dict[str, Tuple[str, str]] = {}
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn last line from an interrupted run
+                        continue
+
+                    if entry["stage"] is None:
+                        self.done.add(entry["source"])
+                        self.failed.pop(entry["source"], None)
+                    else:
+                        self.failed[entry["source"]] = (entry["stage"], entry["error"])
+
+        self.handle = open(path, "a", encoding="utf-8")
+
+    def should_skip(self, source_id: str, retry_failed: bool) -> bool:
+        return source_id in self.done or (not retry_failed and source_id in self.failed)
+
+    def recover(self, written: Set[str]) -> int:
+        # Sources in the output that were never logged as done
+        missing = sorted(written - self.done)
+
+        for source_id in missing:
+            self.record(source_id)
+            self.done.add(source_id)
+            self.failed.pop(source_id, None)
+
+        return len(missing)
+
+    def record(self, source_id: str, stage: Optional[str] = None, error: str = None) -> None:
+        self.handle.write(json.dumps({"source": source_id, "stage": stage, "error": error}) + "\n")
+        self.handle.flush()
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+# ----------------------------
+# Output
+# ----------------------------
+
+class JsonlWriter:
+
+    def __init__(self, path: str):
+        # Sources already in the file from earlier runs
+        self.existing: Set[str] = set()
+
+        if os.path.exists(path):
+            with open(path, "rb+") as handle:
+                end = 0
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    end += len(line)
+                    self.existing.add(json.loads(line)["source"])
+
+                # Drop a torn last record so the next one starts on its own line
+                handle.truncate(end)
+
+        self.handle = open(path, "a", encoding="utf-8")
+
+    def write(self, record: Dict) -> List[str]:
+        # Returns the sources now safely on disk
+        self.handle.write(json.dumps(record) + "\n")
+        self.handle.flush()
+        return [record["source"]]
+
+    def close(self) -> List[str]:
+        self.handle.close()
+        return []
+
+
+class ParquetWriter:
+    """
+    Buffers records and writes each batch as its own part file in a
+    directory, so a resumed run only ever adds files.
+    """
+
+    def __init__(self, directory: str, batch_size: int = PARQUET_BATCH):
+        from pandas.io.parquet import get_engine
+
+        # Fail before any parsing if neither pyarrow nor fastparquet is installed
+        get_engine("auto")
+
+        self.directory = directory
+        self.batch_size = batch_size
+        self.buffer: List[Dict] = []
+
+        os.makedirs(directory, exist_ok=True)
+        parts = sorted(name for name in os.listdir(directory) if name.endswith(".parquet"))
+        self.part = len(parts)
+
+        # Sources already in part files from earlier runs
+        self.existing: Set[str] = set()
+        if parts:
+            import pandas as pd
+
+            for name in parts:
+                frame = pd.read_parquet(os.path.join(directory, name), columns=["source"])
+                self.existing.update(frame["source"])
+
+    def write(self, record: Dict) -> List[str]:
+        self.buffer.append(record)
+
+        if len(self.buffer) >= self.batch_size:
+            return self.flush()
+
+        return []
+
+    def flush(self) -> List[str]:
+        import pandas as pd
+
+        if not self.buffer:
+            return []
+
+        # Nested dicts vary in shape between resumes; store them as JSON
+        rows = [
+            {
+                key: json.dumps(value) if isinstance(value, dict) else value
+                for key, value in record.items()
+            }
+            for record in self.buffer
+        ]
+
+        path = os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+        pd.DataFrame(rows).to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+        self.part += 1
+        written = [record["source"] for record in self.buffer]
+        self.buffer = []
+
+        return written
+
+    def close(self) -> List[str]:
+        return self.flush()
+
+
+def open_writer(path: str, output_format: str):
+    if output_format == "parquet":
+        return ParquetWriter(path)
+
+    return JsonlWriter(path)
+
+
+# ----------------------------
+# Run
+# ----------------------------
+
+class IngestStats:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.discovered = 0
+        self.skipped = 0
+        self.succeeded = 0
+        self.failures: Counter = Counter()
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + sum(self.failures.values())
+
+    def files_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.processed / elapsed if elapsed else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            "discovered": self.discovered,
+            "skipped": self.skipped,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": dict(self.failures),
+            "elapsed_seconds": round(time.perf_counter() - self.started, 2),
+            "files_per_second": round(self.files_per_second(), 2),
+        }
+
+
+def run_results(sources: List[ResumeSource], args):
+    """
+    ingest_one for every source, in completion order. Parses run on a
+    ParsePool of args.workers processes, so a hung PDF is killed after
+    args.timeout instead of stalling the run; reading and hashing happen
+    on threads here, one job ahead of each worker.
+    """
+
+    threads = args.workers * 2
+
+    # More slots than threads: a slot is freed just after its parse
+    # returns, so a thread may submit again before the release
+    pool = ParsePool(workers=args.workers, queue_size=threads, timeout=args.timeout)
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="bulk-ingest")
+    remaining = iter(sources)
+    in_flight = set()
+
+    try:
+        while True:
+            for source in remaining:
+                in_flight.add(executor.submit(ingest_one, source, args.job_skills, args.pdf_backend, pool))
+                if len(in_flight) >= threads:
+                    break
+
+            if not in_flight:
+                return
+
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        pool.close()
+
+
+def ingest(args) -> IngestStats:
+    if args.store:
+        # Connects to DATABASE_URL, so only imported when asked to store
+        from app.services.candidate_store import save_candidate
+
+    stats = IngestStats()
+    checkpoint = Checkpoint(args.checkpoint or f"{args.output}.checkpoint")
+    writer = open_writer(args.output, args.format)
+
+    # Output written just before a crash, whose checkpoint line was lost;
+    # logging it now keeps it from being parsed and written twice
+    checkpoint.recover(writer.existing)
+
+    sources = []
+    for source in discover(args.paths):
+        stats.discovered += 1
+
+        if checkpoint.should_skip(source.source_id, args.retry_failed):
+            stats.skipped += 1
+        else:
+            sources.append(source)
+
+    last_progress = time.perf_counter()
+
+    try:
+        for source, stage, payload in run_results(sources, args):
+            if stage is not None:
+                stats.failures[stage] += 1
+                checkpoint.record(source.source_id, stage, payload)
+                if args.verbose:
+                    print(f"[{stage}] {source.source_id}: {payload}", file=sys.stderr)
+            else:
+                if args.store:
+                    try:
+                        save_candidate(payload, payload["content_hash"])
+                    except Exception as error:
+                        stats.failures[STORE] += 1
+                        checkpoint.record(source.source_id, STORE, f"{type(error).__name__}: {error}")
+                        continue
+
+                try:
+                    written = writer.write(payload)
+                except Exception as error:
+                    stats.failures[WRITE] += 1
+                    checkpoint.record(source.source_id, WRITE, f"{type(error).__name__}: {error}")
+                    continue
+
+                stats.succeeded += 1
+                for source_id in written:
+                    checkpoint.record(source_id)
+
+            now = time.perf_counter()
+            if now - last_progress >= PROGRESS_SECONDS:
+                last_progress = now
+                print(
+                    f"{stats.processed}/{len(sources)} files, "
+                    f"{stats.files_per_second():.1f} files/sec, "
+                    f"{sum(stats.failures.values())} failed",
+                    file=sys.stderr
+                )
+    finally:
+        # Whatever made it to the output is checkpointed, even on Ctrl-C
+        for source_id in writer.close():
+            checkpoint.record(source_id)
+        checkpoint.close()
+
+    return stats
+
+
+def parse_args(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        description="Parse directories or zip archives of resume PDFs in bulk."
+    )
+    parser.add_argument("paths", nargs="+", help="PDF files, directories or zip archives")
+    parser.add_argument("--output", required=True,
+                        help="JSONL file, or a directory of part files for --format parquet")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--checkpoint", help="Defaults to <output>.checkpoint")
+    parser.add_argument("--workers", type=int, default=max(PARSE_WORKERS, 1),
+                        help="Parser processes")
+    parser.add_argument("--timeout", type=float, default=PARSE_TIMEOUT_SECONDS,
+                        help="Seconds a single file may take to parse before it is recorded as failed")
+    parser.add_argument("--pdf-backend", choices=sorted(BACKENDS), default=DEFAULT_BACKEND)
+    parser.add_argument("--job-skills", default="",
+                        help="Comma-separated skills to compute job_match against")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Parse sources that failed in a previous run again")
+    parser.add_argument("--store", action="store_true",
+                        help="Also save every parsed resume to the candidate database")
+    parser.add_argument("--verbose", action="store_true", help="Print every failure")
+
+    args = parser.parse_args(argv)
+
+    # Only a worker process can be killed when a parse hangs
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.timeout <= 0:
+        parser.error("--timeout must be positive")
+
+    args.job_skills = [skill.strip() for skill in args.job_skills.split(",") if skill.strip()]
+
+    return args
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    try:
+        stats = ingest(args)
+    except ImportError as error:
+        print(f"Cannot write {args.format}: {error}", file=sys.stderr)
+        return 2
+
+    summary = stats.summary()
+    print(json.dumps(summary, indent=2))
+
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,40 @@
 import re
-import spacy
+import threading
 
+from app.services.skill_canonicalizer import canonical_skill, skill_canonicalizer
+from app.services.resume_parser.sections import SectionIndex, segment
+from app.services.resume_parser.skill_matcher import SkillMatcher
+from app.services.resume_parser.timing import stage
 
-nlp = spacy.load("en_core_web_sm")
+
+SPACY_MODEL = "en_core_web_sm"
+
+# Name extraction only uses NER; these pipes are never loaded
+SPACY_EXCLUDED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter"]
+
+# The NER fallback only looks at the top of the resume
+NAME_WINDOW = 500
+NAME_BATCH_SIZE = 32
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    The spaCy pipeline, imported and loaded on first use. Resumes whose
+    name is found by the rule-based path never pay for it.
+    """
+
+    global _nlp
+
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy
+                _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
+
+    return _nlp
 
 
 SKILLS = [
@@ -38,41 +70,27 @@ SKILLS = [
 ]
 
 
-SECTION_HEADERS = [
-    "education", "academic background", "academics", "qualifications",
-    "experience", "work experience", "professional experience",
-    "employment", "internship", "internships",
-    "skills", "technical skills", "skill set",
-    "projects", "project experience",
-    "certifications", "achievements",
-    "research", "publications",
-    "summary", "profile", "objective",
-    "interests", "hobbies"
-]
+# Every surface form to look for -> canonical skill name
+SKILL_SURFACES = {skill: canonical_skill(skill) for skill in SKILLS}
+SKILL_SURFACES.update(skill_canonicalizer.surface_forms())
 
-EDUCATION_HEADERS = [
-    "education", "academic background", "academics", "qualifications","EDUCATION"
-]
+# Aliases this short ("ai", "ml", "k8s") only count as whole tokens
+SHORT_ALIAS_LENGTH = 3
 
-PROJECT_HEADERS = [
-    "projects",
-    "project",
-    "academic projects",
-    "personal projects",
-    "key projects",
-    "project experience"
-]
+skill_matcher = SkillMatcher(
+    SKILL_SURFACES,
+    whole_tokens=[
+        surface for surface in skill_canonicalizer.surface_forms()
+        if len(surface) <= SHORT_ALIAS_LENGTH and surface not in SKILLS
+    ]
+)
 
-EXPERIENCE_HEADERS = [
-    "experience", "work experience", "professional experience",
-    "employment", "internship", "internships"
-]
 
-def normalize_line(line: str) -> str:
-    return re.sub(r'[^a-z ]', '', line.lower()).strip()
+# Project sections list titles; longer lines are descriptions
+MAX_PROJECT_TITLE_WORDS = 6
 
 
-def extract_name(text: str):
+def rule_based_name(text: str):
 
     lines = text.split("\n")
 
@@ -87,8 +105,10 @@ def extract_name(text: str):
         if len(words) == 2 and all(w.istitle() for w in words):
             return f"{words[0]} {words[1]}"
 
-    # fallback to spaCy
-    doc = nlp(text[:500])
+    return None
+
+
+def entity_name(doc):
 
     for ent in doc.ents:
         if ent.label_ == "PERSON":
@@ -97,176 +117,129 @@ def extract_name(text: str):
 
     return None
 
-def extract_email(text: str):
-
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-
-    matches = re.findall(email_pattern, text)
-
-    return matches[0] if matches else None
-
-
-def extract_phone(text: str):
-
-    phone_pattern = r'\b\d{10}\b'
-
-    match = re.search(phone_pattern, text)
 
-    return match.group(0) if match else None
-
-
-def extract_skills(text: str):
-    text = text.lower()
-    found = set()
-
-    for skill in SKILLS:
-        if re.search(rf"\b{re.escape(skill)}\b", text):
-            found.add(skill)
-
-    return list(found)
-
-
-
-def extract_section(text: str, target_headers: list):
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    content = []
-    capture = False
-
-    for line in lines:
-        normalized = re.sub(r'[^a-z ]', '', line.lower()).strip()
+def extract_name(text: str):
 
-        
-        if not capture and any(h in normalized for h in target_headers):
-            capture = True
-            continue
+    with stage("name_rules"):
+        name = rule_based_name(text)
 
-        
-        if capture and any(
-            h in normalized
-            for h in SECTION_HEADERS
-            if h not in target_headers
-        ):
-            break
+    if name is not None:
+        return name
 
-        if capture:
-            content.append(line)
+    # fallback to spaCy
+    with stage("name_spacy"):
+        return entity_name(get_nlp()(text[:NAME_WINDOW]))
 
-    return content
 
+def extract_names(texts: list, batch_size: int = NAME_BATCH_SIZE) -> list:
+    """
+    extract_name for many resumes; the spaCy fallbacks run together
+    through nlp.pipe.
+    """
 
+    names = [rule_based_name(text) for text in texts]
+    pending = [index for index, name in enumerate(names) if name is None]
 
-def extract_education(text: str):
-    text = text.lower()
+    if pending:
+        docs = get_nlp().pipe(
+            (texts[index][:NAME_WINDOW] for index in pending),
+            batch_size=batch_size
+        )
 
-    pattern = re.compile(
-        r'education(.*?)(skills|projects|experience|certification|objective|$)',
-        re.DOTALL
-    )
+        for index, doc in zip(pending, docs):
+            names[index] = entity_name(doc)
 
-    match = pattern.search(text)
-    if not match:
-        return []
+    return names
 
-    edu_block = match.group(1)
+def extract_email(text: str):
 
-    # Clean and split
-    lines = [line.strip() for line in edu_block.split("\n") if line.strip()]
-    return lines
+    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
 
+    matches = re.findall(email_pattern, text)
 
-def extract_experience(text: str):
-    text = text.lower()
+    return matches[0] if matches else None
 
-    pattern = re.compile(
-        r'(experience|work experience|internship)(.*?)(education|skills|projects|certification|objective|$)',
-        re.DOTALL
-    )
 
-    match = pattern.search(text)
-    if not match:
-        return []
+def extract_phone(text: str):
 
-    exp_block = match.group(2)
+    phone_pattern = r'\b\d{10}\b'
 
-    lines = [line.strip() for line in exp_block.split("\n") if line.strip()]
-    return lines
+    match = re.search(phone_pattern, text)
 
-def extract_projects(text: str):
+    return match.group(0) if match else None
 
-    lines = text.split("\n")
 
-    projects = []
-    capture = False
+def find_skills(text: str) -> dict:
+    # canonical skill -> SkillMatch(skill, count, offsets), one pass over text
+    return skill_matcher.find(text)
 
-    for line in lines:
 
-        normalized = line.lower().strip()
+def extract_skills(text: str):
+    return list(find_skills(text))
 
-        # detect project section
-        if "project" in normalized:
-            capture = True
-            continue
 
-        if capture:
 
-            # stop when next section appears
-            if any(
-                header in normalized
-                for header in SECTION_HEADERS
-                if "project" not in header
-            ):
-                break
+def extract_education(text: str, sections: SectionIndex = None):
+    sections = sections or segment(text)
+    return sections.lines("education")
 
-            if line.strip():
-                projects.append(line.strip())
 
-    return projects
+def extract_experience(text: str, sections: SectionIndex = None):
+    sections = sections or segment(text)
+    return sections.lines("experience")
 
-def extract_projects(text: str):
 
-    projects = []
+def extract_projects(text: str, sections: SectionIndex = None):
+    sections = sections or segment(text)
 
-    # find PROJECT / PROJECTS section
-    pattern = re.compile(
-        r'(project|projects)(.*?)(education|experience|skills|certification|objective|$)',
-        re.IGNORECASE | re.DOTALL
+    titles = (
+        line for line in sections.lines("projects")
+        if len(line.split()) <= MAX_PROJECT_TITLE_WORDS
     )
 
-    match = pattern.search(text)
-
-    if not match:
-        return []
+    # Deduplicated, in document order
+    return list(dict.fromkeys(titles))
 
-    project_block = match.group(2)
 
-    lines = project_block.split("\n")
+def parse_fields(text: str) -> dict:
+    # Everything parse_resume extracts except the name; the text is
+    # segmented once and every section extractor reads the same index
+    with stage("sections"):
+        sections = segment(text)
 
-    for line in lines:
+    with stage("email"):
+        email = extract_email(text)
 
-        line = line.strip()
+    with stage("phone"):
+        phone = extract_phone(text)
 
-        # ignore empty lines
-        if not line:
-            continue
+    with stage("skills"):
+        skills = extract_skills(text)
 
-        # ignore long description lines
-        if len(line.split()) <= 6:
-            projects.append(line)
+    return {
+        "email": email,
+        "phone": phone,
+        "skills": skills,
+        "education": extract_education(text, sections),
+        "experience": extract_experience(text, sections),
+        "projects": extract_projects(text, sections)
+    }
 
-    return list(set(projects))
 
 def parse_resume(text: str) -> dict:
     text = text.replace("\xa0", " ")
 
-    return {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "skills": extract_skills(text),
-        "education": extract_education(text),
-        "experience": extract_experience(text),
-        "projects": extract_projects(text)   # NEW
-    }
+    return {"name": extract_name(text), **parse_fields(text)}
+
+
+def parse_resumes(texts: list) -> list:
+    # Names are extracted in one batch so spaCy runs once per chunk
+    texts = [text.replace("\xa0", " ") for text in texts]
+
+    return [
+        {"name": name, **parse_fields(text)}
+        for text, name in zip(texts, extract_names(texts))
+    ]
 
 def calculate_resume_score(data: dict):
 
@@ -334,8 +307,9 @@ def generate_candidate_summary(data: dict):
 
 def match_job_description(candidate_skills, job_skills):
 
-    candidate_set = set([s.lower() for s in candidate_skills])
-    job_set = set([s.lower().strip() for s in job_skills])
+    candidate_set = set([canonical_skill(s) for s in candidate_skills])
+    job_set = set([canonical_skill(s) for s in job_skills])
+    job_set.discard("")
 
     matched = list(candidate_set.intersection(job_set))
     missing = list(job_set - candidate_set)
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.services.skill_canonicalizer import skill_canonicalizer
+
+
+# Bump whenever extraction, scoring or summary logic changes output
+PARSER_VERSION = "2"
+
+PARSE_CACHE_SIZE = int(os.getenv("RESUME_CACHE_SIZE", "1024"))
+
+# Optional SQLite file shared by workers, e.g. "/var/cache/app/resume_parse_cache.sqlite3".
+# It holds parsed resumes (names, emails, phones), so it is off unless set
+PARSE_CACHE_SQLITE_PATH = os.getenv("RESUME_CACHE_SQLITE")
+
+# Stored parses older than this are ignored and deleted
+PARSE_CACHE_TTL_SECONDS = float(os.getenv("RESUME_CACHE_TTL", str(7 * 24 * 3600)))
+
+# Oldest rows beyond this are deleted
+PARSE_CACHE_MAX_ROWS = int(os.getenv("RESUME_CACHE_MAX_ROWS", "10000"))
+
+# Writes between eviction passes
+EVICT_EVERY = 100
+
+HASH_CHUNK = 1 << 20
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(file_path: str) -> str:
+    digest = hashlib.sha256()
+
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def parse_key(digest: str, pdf_backend: str, max_pages: Optional[int]) -> str:
+    # Skill aliases change extracted skills, so they are part of the version
+    return f"{PARSER_VERSION}.{skill_canonicalizer.version}:{pdf_backend}:{max_pages}:{digest}"
+
+
+class SQLiteParseStore:
+    """
+    Parsed resumes kept across restarts and shared between processes,
+    for at most ttl_seconds and max_rows rows. The file is opened on
+    first use, not at import.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = PARSE_CACHE_TTL_SECONDS,
+        max_rows: int = PARSE_CACHE_MAX_ROWS
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+
+        self._connection = None
+        self.writes = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Callers hold self.lock
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS resume_parse_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS resume_parse_cache_created"
+                " ON resume_parse_cache (created_at)"
+            )
+            connection.commit()
+
+            self._connection = connection
+            self._evict()
+
+        return self._connection
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM resume_parse_cache WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict) -> None:
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO resume_parse_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
+            self.connection.commit()
+
+            self.writes += 1
+            if self.writes % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Expired rows, then the oldest ones beyond max_rows
+        self._connection.execute(
+            "DELETE FROM resume_parse_cache WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        self._connection.execute(
+            "DELETE FROM resume_parse_cache WHERE key IN ("
+            " SELECT key FROM resume_parse_cache"
+            " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,)
+        )
+        self._connection.commit()
+
+
+class ParseCache:
+    """
+    In-process LRU of parsed resumes keyed by content hash and parser
+    version, in front of an optional SQLite store. In-process entries
+    never expire: the same bytes always parse the same way under one
+    parser version. The store drops rows by age and count.
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = PARSE_CACHE_SIZE, store: SQLiteParseStore = None):
+        self.max_entries = max_entries
+        self.store = store
+
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stored_hits = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            value = self.entries.get(key)
+
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self.store is not None:
+            value = self.store.get(key)
+
+            if value is not None:
+                with self.lock:
+                    self.hits += 1
+                    self.stored_hits += 1
+                    self._remember(key, value)
+                return value
+
+        with self.lock:
+            self.misses += 1
+
+        return None
+
+    def set(self, key: str, value: Dict) -> None:
+        with self.lock:
+            self._remember(key, value)
+
+        if self.store is not None:
+            self.store.set(key, value)
+
+    def _remember(self, key: str, value: Dict) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "parser_version": PARSER_VERSION,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "stored_hits": self.stored_hits,
+                "evictions": self.evictions,
+                "store": self.store.path if self.store else None,
+            }
+
+
+parse_cache = ParseCache(
+    store=SQLiteParseStore(PARSE_CACHE_SQLITE_PATH) if PARSE_CACHE_SQLITE_PATH else None
+)
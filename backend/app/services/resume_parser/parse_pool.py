@@ -0,0 +1,314 @@
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from anyio import to_thread
+
+from app.services.resume_parser import timing
+from app.services.resume_parser.pdf_backends import PdfSource
+
+
+# 0 parses in the calling thread instead of a worker process
+PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+# Jobs allowed to wait for a worker before new ones are turned away
+PARSE_QUEUE_SIZE = int(os.getenv("RESUME_PARSE_QUEUE", str(max(PARSE_WORKERS, 1) * 4)))
+
+PARSE_TIMEOUT_SECONDS = float(os.getenv("RESUME_PARSE_TIMEOUT", "30"))
+RETRY_AFTER_SECONDS = int(os.getenv("RESUME_PARSE_RETRY_AFTER", "5"))
+
+# Fresh interpreters: forking a server with live threads is not safe
+START_METHOD = "spawn"
+
+# How often a job waiting for a worker checks whether any are left
+IDLE_CHECK_SECONDS = 1.0
+
+# PDFium is not thread-safe, so inline parses (no workers) run one at a time
+INLINE_PARSE_LOCK = threading.Lock()
+
+
+class PoolBusy(Exception):
+    pass
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+class ParseFailed(Exception):
+    pass
+
+
+# ----------------------------
+# Worker Process
+# ----------------------------
+
+def worker_main(connection) -> None:
+    from app.services.resume_parser import extractor, pdf_reader
+    from app.services.resume_parser.resume_service import parse_resume_file
+
+    # Documents are already spread across workers; no nested page pools
+    pdf_reader.PARALLEL_MIN_PAGES = float("inf")
+
+    try:
+        extractor.get_nlp()
+    except OSError:
+        # Model not installed; the rule-based name path still works
+        pass
+
+    while True:
+        try:
+            source, pdf_backend = connection.recv()
+        except EOFError:
+            return
+
+        # Stage timings travel back with the result, to the caller's timer
+        with timing.collect() as timer:
+            try:
+                result = parse_resume_file(source, pdf_backend)
+            except Exception as error:
+                connection.send(("error", f"{type(error).__name__}: {error}", None))
+                continue
+
+        connection.send(("ok", result, timer.export() if timer else None))
+
+
+class ParseWorker:
+
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=worker_main,
+            args=(child,),
+            name="resume-parser",
+            daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def parse(self, source: PdfSource, pdf_backend: str, timeout: float) -> Dict:
+        self.connection.send((source, pdf_backend))
+
+        if not self.connection.poll(timeout):
+            raise ParseTimeout(f"Resume parsing took longer than {timeout:g}s")
+
+        status, payload, timings = self.connection.recv()
+        if status != "ok":
+            raise ParseFailed(payload)
+
+        timing.merge(timings)
+        return payload
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+# ----------------------------
+# Pool
+# ----------------------------
+
+class ParsePool:
+    """
+    Fixed set of parser processes, each with spaCy preloaded.
+
+    At most workers + queue_size jobs are admitted at once; beyond that
+    submissions raise PoolBusy right away. Admitted jobs wait for a worker
+    on the pool's own threads, one per worker process, so callers that
+    await parse_async() hold no threadpool thread meanwhile. A job that
+    runs past its timeout gets its worker killed and replaced, so a
+    runaway PDF cannot hold a slot forever. If a replacement cannot be
+    started the pool carries on with one live worker fewer.
+    """
+
+    def __init__(
+        self,
+        workers: int = PARSE_WORKERS,
+        queue_size: int = PARSE_QUEUE_SIZE,
+        timeout: float = PARSE_TIMEOUT_SECONDS
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+
+        self.context = multiprocessing.get_context(START_METHOD)
+        self.idle: "queue.Queue[ParseWorker]" = queue.Queue()
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.lock = threading.Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.started = False
+
+        self.live = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.restarts = 0
+
+    def start(self) -> None:
+        with self.lock:
+            if self.started or self.workers <= 0:
+                return
+
+            for _ in range(self.workers):
+                self.idle.put(ParseWorker(self.context))
+            self.live = self.workers
+
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="resume-parse")
+            self.started = True
+
+    def submit(self, source: PdfSource, pdf_backend: str = None, timeout: Optional[float] = None) -> Future:
+        """
+        Queues parse_resume_file(source, pdf_backend) for a worker and
+        returns its future. Raises PoolBusy when no slot is free.
+        """
+
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.rejected += 1
+            raise PoolBusy("Resume parser is at capacity")
+
+        try:
+            self.start()
+
+            # Stage timings merge into the submitter's timer
+            context = contextvars.copy_context()
+            future = self.executor.submit(
+                context.run, self._run, source, pdf_backend, timeout or self.timeout, time.perf_counter()
+            )
+        except BaseException:
+            self.slots.release()
+            raise
+
+        # Also fires for jobs cancelled before they ran
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def parse(self, source: PdfSource, pdf_backend: str = None, timeout: Optional[float] = None) -> Dict:
+        """
+        parse_resume_file(source, pdf_backend) on a worker. Blocks the
+        calling thread until the result is back.
+        """
+
+        if self.workers <= 0:
+            from app.services.resume_parser.resume_service import parse_resume_file
+            with INLINE_PARSE_LOCK:
+                return parse_resume_file(source, pdf_backend)
+
+        return self.submit(source, pdf_backend, timeout).result()
+
+    async def parse_async(self, source: PdfSource, pdf_backend: str = None, timeout: Optional[float] = None) -> Dict:
+        # Same as parse(), but the event loop awaits the worker directly
+        if self.workers <= 0:
+            return await to_thread.run_sync(self.parse, source, pdf_backend, timeout)
+
+        return await asyncio.wrap_future(self.submit(source, pdf_backend, timeout))
+
+    def _run(self, source: PdfSource, pdf_backend: str, timeout: float, submitted: float) -> Dict:
+        worker = self._take()
+        timing.merge({"stages": {"pool_wait": time.perf_counter() - submitted}, "tags": {}})
+
+        with self.lock:
+            self.active += 1
+
+        try:
+            result = worker.parse(source, pdf_backend, timeout)
+        except ParseTimeout:
+            worker = self._replace(worker)
+            with self.lock:
+                self.timeouts += 1
+            raise
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            # The worker died mid-job (e.g. crashed inside a PDF library)
+            worker = self._replace(worker)
+            with self.lock:
+                self.failures += 1
+            raise ParseFailed("Resume parser worker exited unexpectedly")
+        except ParseFailed:
+            with self.lock:
+                self.failures += 1
+            raise
+        finally:
+            with self.lock:
+                self.active -= 1
+            if worker is not None:
+                self.idle.put(worker)
+
+        with self.lock:
+            self.completed += 1
+
+        return result
+
+    def _take(self) -> ParseWorker:
+        # Waits for an idle worker, respawning one if all have been lost
+        while True:
+            try:
+                return self.idle.get(timeout=IDLE_CHECK_SECONDS)
+            except queue.Empty:
+                pass
+
+            with self.lock:
+                if self.live > 0:
+                    continue
+                self.live += 1
+
+            try:
+                return ParseWorker(self.context)
+            except Exception as error:
+                with self.lock:
+                    self.live -= 1
+                raise ParseFailed(f"No resume parser worker available: {error}")
+
+    def _replace(self, worker: ParseWorker) -> Optional[ParseWorker]:
+        # None when no replacement could be started; the pool shrinks
+        worker.kill()
+
+        with self.lock:
+            self.restarts += 1
+
+        try:
+            return ParseWorker(self.context)
+        except Exception:
+            with self.lock:
+                self.live -= 1
+            return None
+
+    def close(self) -> None:
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+            while True:
+                try:
+                    self.idle.get_nowait().kill()
+                except queue.Empty:
+                    break
+            self.live = 0
+            self.started = False
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "live_workers": self.live,
+                "queue_size": self.queue_size,
+                "timeout_seconds": self.timeout,
+                "active": self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "failures": self.failures,
+                "restarts": self.restarts,
+            }
+
+
+parse_pool = ParsePool()
@@ -1,10 +1,123 @@
-import pdfplumber
-
-def extract_text_from_pdf(pdf_path: str) -> str:
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-    return text
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional
+
+from app.services.resume_parser.pdf_backends import PdfSource, get_backend
+
+
+# Upper bound on pages read per document; 0 reads everything
+MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "0")) or None
+
+# Documents with at least this many pages are split across processes
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+PAGES_PER_TASK = 8
+PAGE_WORKERS = int(os.getenv("PDF_PAGE_WORKERS", "0")) or None
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+
+    if _page_pool is None:
+        with _page_pool_lock:
+            if _page_pool is None:
+                _page_pool = ProcessPoolExecutor(max_workers=PAGE_WORKERS)
+
+    return _page_pool
+
+
+def page_limit(total: int, max_pages: Optional[int]) -> int:
+    return total if max_pages is None else min(total, max_pages)
+
+
+def iter_pages(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PAGES,
+    start: int = 0,
+    backend: str = None
+) -> Iterator[str]:
+    """
+    Yields the text of each page ("" for pages without text) as it is
+    extracted. Stopping early closes the document without reading the rest.
+    """
+
+    pdf_backend = get_backend(backend)
+    end = page_limit(pdf_backend.page_count(source), max_pages)
+
+    yield from pdf_backend.pages(source, start, end)
+
+
+def extract_page_range(source: PdfSource, start: int, end: int, backend: str = None) -> List[str]:
+    # Runs in a worker process
+    return list(get_backend(backend).pages(source, start, end))
+
+
+def iter_pages_parallel(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PAGES,
+    pages_per_task: int = PAGES_PER_TASK,
+    executor: ProcessPoolExecutor = None,
+    backend: str = None
+) -> Iterator[str]:
+    """
+    iter_pages with page ranges extracted in worker processes. Pages are
+    still yielded in order, each range as soon as it and all earlier ones
+    are done.
+    """
+
+    total = page_limit(get_backend(backend).page_count(source), max_pages)
+    executor = executor or get_page_pool()
+
+    futures = [
+        executor.submit(extract_page_range, source, start, min(start + pages_per_task, total), backend)
+        for start in range(0, total, pages_per_task)
+    ]
+
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        # The consumer stopped early; skip ranges nobody started yet
+        for future in futures:
+            future.cancel()
+
+
+def read_pages(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PAGES,
+    parallel: Optional[bool] = None,
+    backend: str = None
+) -> Iterator[str]:
+    """
+    Page iterator for source (file path or PDF bytes). parallel=None uses
+    the process pool only for documents with at least PARALLEL_MIN_PAGES
+    pages.
+    """
+
+    pdf_backend = get_backend(backend)
+
+    if parallel is None:
+        total = page_limit(pdf_backend.page_count(source), max_pages)
+        parallel = total >= PARALLEL_MIN_PAGES
+
+    if parallel:
+        return iter_pages_parallel(source, max_pages, backend=pdf_backend.name)
+
+    return iter_pages(source, max_pages, backend=pdf_backend.name)
+
+
+def join_pages(pages: Iterable[str]) -> str:
+    # Each non-empty page followed by a newline
+    return "".join(f"{page}\n" for page in pages if page)
+
+
+def extract_text_from_pdf(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PAGES,
+    parallel: Optional[bool] = None,
+    backend: str = None
+) -> str:
+    return join_pages(read_pages(source, max_pages, parallel, backend))
@@ -1,5 +1,11 @@
-from .pdf_reader import extract_text_from_pdf
-from .text_cleaner import clean_text
+from anyio import to_thread
+
+from .pdf_backends import PdfSource, get_backend
+from .pdf_reader import MAX_PAGES, read_pages
+from .parse_cache import content_hash, file_hash, parse_cache, parse_key
+from .parse_pool import ParsePool, parse_pool
+from .text_cleaner import clean_lines
+from .timing import stage, tag
 from .extractor import (
     parse_resume,
     calculate_resume_score,
@@ -7,21 +13,41 @@ from .extractor import (
     match_job_description
 )
 
-def process_resume(file_path: str, job_skills: list = None):
 
-    raw_text = extract_text_from_pdf(file_path)
-    cleaned_text = clean_text(raw_text)
+def parse_resume_file(source: PdfSource, pdf_backend: str = None) -> dict:
+    # Everything process_resume returns except job_match
 
-    parsed_data = parse_resume(cleaned_text)
+    # Each page is cleaned as soon as it is extracted, so only the cleaned
+    # lines are kept, never the whole raw text
+    with stage("pdf_text"):
+        pages = read_pages(source, backend=pdf_backend)
 
-    score, breakdown = calculate_resume_score(parsed_data)
+    page_count = 0
+    lines = []
 
-    summary = generate_candidate_summary(parsed_data)
+    while True:
+        with stage("pdf_text"):
+            page = next(pages, None)
 
-    job_match = None
+        if page is None:
+            break
 
-    if job_skills:
-        job_match = match_job_description(parsed_data["skills"], job_skills)
+        page_count += 1
+
+        with stage("clean_text"):
+            lines.extend(clean_lines(page))
+
+    cleaned_text = "\n".join(lines)
+
+    tag(pages=page_count, text_chars=len(cleaned_text))
+
+    parsed_data = parse_resume(cleaned_text)
+
+    with stage("score"):
+        score, breakdown = calculate_resume_score(parsed_data)
+
+    with stage("summary"):
+        summary = generate_candidate_summary(parsed_data)
 
     return {
         "name": parsed_data.get("name"),
@@ -34,7 +60,84 @@ def process_resume(file_path: str, job_skills: list = None):
 
         "resume_score": score,
         "score_breakdown": breakdown,
-        "candidate_summary": summary,
+        "candidate_summary": summary
+    }
+
+
+def resume_key(source: PdfSource, pdf_backend: str = None, digest: str = None) -> tuple:
+    # (parse cache key, resolved backend name)
+    if digest is None:
+        digest = content_hash(source) if isinstance(source, bytes) else file_hash(source)
+
+    # Same bytes, same parse: the content is looked up by hash first
+    pdf_backend = get_backend(pdf_backend).name
+    tag(content_hash=digest, pdf_backend=pdf_backend)
+
+    return parse_key(digest, pdf_backend, MAX_PAGES), pdf_backend
+
+
+def cached_parse(key: str):
+    with stage("cache_lookup"):
+        parsed = parse_cache.get(key)
+
+    tag(cache_hit=parsed is not None)
+    return parsed
+
+
+def with_job_match(parsed: dict, job_skills: list = None) -> dict:
+    job_match = None
+
+    # Depends on the request, so never cached
+    if job_skills:
+        with stage("job_match"):
+            job_match = match_job_description(parsed["skills"], job_skills)
+
+    return {**parsed, "job_match": job_match}
+
+
+def process_resume(
+    source: PdfSource,
+    job_skills: list = None,
+    pdf_backend: str = None,
+    digest: str = None,
+    pool: ParsePool = None
+):
+    """
+    source is a file path or the PDF bytes; pass digest when the caller
+    already hashed the content. Cache misses are parsed on pool (default
+    parse_pool), which may raise PoolBusy, ParseTimeout or ParseFailed.
+    """
+
+    key, pdf_backend = resume_key(source, pdf_backend, digest)
+    parsed = cached_parse(key)
+
+    if parsed is None:
+        # Includes waiting for a worker and the round trip to it
+        with stage("parse"):
+            parsed = (pool or parse_pool).parse(source, pdf_backend)
+        parse_cache.set(key, parsed)
+
+    return with_job_match(parsed, job_skills)
+
+
+async def process_resume_async(
+    source: PdfSource,
+    job_skills: list = None,
+    pdf_backend: str = None,
+    digest: str = None
+):
+    """
+    process_resume for request handlers: cache access runs on the
+    threadpool, but the parse itself is awaited, so no threadpool thread
+    sits waiting on a worker process.
+    """
+
+    key, pdf_backend = await to_thread.run_sync(resume_key, source, pdf_backend, digest)
+    parsed = await to_thread.run_sync(cached_parse, key)
+
+    if parsed is None:
+        with stage("parse"):
+            parsed = await parse_pool.parse_async(source, pdf_backend)
+        await to_thread.run_sync(parse_cache.set, key, parsed)
 
-        "job_match": job_match
-    }
\ No newline at end of file
+    return with_job_match(parsed, job_skills)
@@ -0,0 +1,142 @@
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+PREAMBLE = "preamble"
+
+# Canonical section -> header spellings, compared after normalize_header
+SECTION_HEADERS = {
+    "education": [
+        "education", "academic background", "academics", "qualifications",
+        "educational qualifications", "academic qualifications"
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience",
+        "employment", "employment history", "work history",
+        "internship", "internships"
+    ],
+    "projects": [
+        "projects", "project", "academic projects", "personal projects",
+        "key projects", "project experience"
+    ],
+    "skills": ["skills", "technical skills", "skill set", "key skills", "core skills"],
+    "certifications": ["certifications", "certification", "certificates"],
+    "achievements": ["achievements", "awards"],
+    "research": ["research", "publications"],
+    "summary": ["summary", "profile", "objective", "professional summary", "career objective"],
+    "interests": ["interests", "hobbies"],
+}
+
+# Longer lines are content even if they contain a header word
+MAX_HEADER_WORDS = 4
+
+_NON_LETTERS = re.compile(r"[^a-z ]+")
+_SPACES = re.compile(r" +")
+_LINES = re.compile(r"[^\n]+")
+
+# Between a header and content on the same line: "Skills: ..." or
+# "Experience - ..." / "Experience | ..."
+_SEPARATOR = re.compile(r":|\s[-\u2013\u2014|]\s")
+
+
+def normalize_header(line: str) -> str:
+    return _SPACES.sub(" ", _NON_LETTERS.sub(" ", line.lower())).strip()
+
+
+HEADER_LOOKUP: Dict[str, str] = {
+    normalize_header(header): section
+    for section, headers in SECTION_HEADERS.items()
+    for header in headers
+}
+
+
+def header_parts(line: str) -> Tuple[str, str]:
+    # (head, inline content), split at the first separator
+    parts = _SEPARATOR.split(line, maxsplit=1)
+    return parts[0], parts[1].strip() if len(parts) > 1 else ""
+
+
+def match_header(line: str) -> Optional[Tuple[str, str]]:
+    """
+    (section, inline content) when line is a header, e.g.
+    "SKILLS" -> ("skills", ""), "Skills: Python" -> ("skills", "Python")
+    or "Experience - Intern at X" -> ("experience", "Intern at X").
+    """
+
+    head, rest = header_parts(line)
+    key = normalize_header(head)
+
+    if key in HEADER_LOOKUP and len(key.split()) <= MAX_HEADER_WORDS:
+        return HEADER_LOOKUP[key], rest
+
+    return None
+
+
+class Section(NamedTuple):
+    name: str
+    header: str
+    # Offsets into the segmented text: header line start, end of last line
+    start: int
+    end: int
+    lines: List[str]
+
+
+class SectionIndex:
+    """
+    Sections of one resume in document order. Text before the first
+    header is the "preamble" section.
+    """
+
+    def __init__(self, text: str, sections: List[Section]):
+        self.text = text
+        self.sections = sections
+
+        self.by_name: Dict[str, List[Section]] = {}
+        for section in sections:
+            self.by_name.setdefault(section.name, []).append(section)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.by_name
+
+    def get(self, name: str) -> List[Section]:
+        return self.by_name.get(name, [])
+
+    def lines(self, name: str) -> List[str]:
+        # Content lines of every section with this name, in order
+        return [line for section in self.get(name) for line in section.lines]
+
+    def spans(self) -> List[Tuple[str, int, int]]:
+        return [(section.name, section.start, section.end) for section in self.sections]
+
+
+def segment(text: str) -> SectionIndex:
+    """
+    Splits text into sections in a single pass over its lines.
+    """
+
+    sections = []
+    name, header, start, end, lines = PREAMBLE, "", 0, 0, []
+
+    for match in _LINES.finditer(text):
+        line = match.group().strip()
+        if not line:
+            continue
+
+        found = match_header(line)
+
+        if found is None:
+            lines.append(line)
+            end = match.end()
+            continue
+
+        if lines or name != PREAMBLE:
+            sections.append(Section(name, header, start, end, lines))
+
+        (name, inline), header = found, line
+        start, end = match.start(), match.end()
+        lines = [inline] if inline else []
+
+    if lines or name != PREAMBLE:
+        sections.append(Section(name, header, start, end, lines))
+
+    return SectionIndex(text, sections)
@@ -0,0 +1,172 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+# Whole-token surfaces sit between these (or whitespace / the text's
+# ends); EDGE_PUNCTUATION may also cling to either side of the token
+TOKEN_SEPARATORS = set(",;/|()[]{}")
+EDGE_PUNCTUATION = set(".:!?'\"")
+
+
+class SkillMatch(NamedTuple):
+    skill: str
+    count: int
+    offsets: List[Tuple[int, int]]
+
+
+def is_word_char(char: str) -> bool:
+    # Same definition as \w in Python's re for str patterns
+    return char.isalnum() or char == "_"
+
+
+def token_edge(text: str, index: int, step: int) -> bool:
+    # True if walking from index by step over edge punctuation reaches a
+    # separator, whitespace or the end of the text
+    while 0 <= index < len(text) and text[index] in EDGE_PUNCTUATION:
+        index += step
+
+    return not 0 <= index < len(text) or text[index].isspace() or text[index] in TOKEN_SEPARATORS
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill surface form.
+
+    One pass over the text finds all occurrences of all surfaces, with the
+    same word-boundary rule as re.search(rf"\\b{surface}\\b", text): each end
+    of a match must sit between a word and a non-word character. As with \\b,
+    a surface ending in a symbol (c++, c#) only matches when a word
+    character follows it.
+
+    Surfaces in whole_tokens (short, loose aliases such as "ai") must
+    instead be an entire token: "AI/ML" and "(AI)," match, "ai-driven"
+    and "ai.js" do not.
+    """
+
+    def __init__(self, surfaces: Dict[str, str], whole_tokens: Iterable[str] = ()):
+        # surface form -> canonical skill
+        self.patterns = list(surfaces)
+        self.skills = [surfaces[pattern] for pattern in self.patterns]
+        self.lengths = [len(pattern) for pattern in self.patterns]
+        self.word_edges = [
+            (is_word_char(pattern[0]), is_word_char(pattern[-1]))
+            for pattern in self.patterns
+        ]
+
+        whole_tokens = set(whole_tokens)
+        self.whole_tokens = [pattern in whole_tokens for pattern in self.patterns]
+
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if pattern:
+                self._insert(pattern, pattern_id)
+
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+                self.goto[state][char] = next_state
+
+            state = next_state
+
+        self.output[state] += (pattern_id,)
+
+    def _link(self) -> None:
+        # Breadth-first, so every fail target is final before it is used
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for char, child in self.goto[state].items():
+                queue.append(child)
+
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] += self.output[self.fail[child]]
+
+    def scan(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yields (start, end, pattern id) for every bounded occurrence,
+        ordered by end offset. Text should already be lowercased.
+        """
+
+        goto, fail, output = self.goto, self.fail, self.output
+        lengths, word_edges, whole_tokens = self.lengths, self.word_edges, self.whole_tokens
+        size = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = index + 1
+            after = end < size and is_word_char(text[end])
+
+            for pattern_id in output[state]:
+                if whole_tokens[pattern_id]:
+                    start = end - lengths[pattern_id]
+                    if token_edge(text, start - 1, -1) and token_edge(text, end, 1):
+                        yield start, end, pattern_id
+                    continue
+
+                starts_word, ends_word = word_edges[pattern_id]
+
+                if ends_word == after:
+                    continue
+
+                start = end - lengths[pattern_id]
+                before = start > 0 and is_word_char(text[start - 1])
+
+                if starts_word != before:
+                    yield start, end, pattern_id
+
+    def find(self, text: str) -> Dict[str, SkillMatch]:
+        """
+        Canonical skill -> occurrence count and (start, end) offsets, in
+        order of first occurrence. Offsets index into text.lower().
+
+        Overlapping surfaces of the same skill ("data structures" inside
+        "data structures and algorithms") count once.
+        """
+
+        spans: Dict[str, List[Tuple[int, int]]] = {}
+        for start, end, pattern_id in self.scan(text.lower()):
+            spans.setdefault(self.skills[pattern_id], []).append((start, -end))
+
+        matches = {}
+        for skill, found in sorted(spans.items(), key=lambda item: min(item[1])):
+            offsets = []
+            covered = -1
+
+            for start, negative_end in sorted(found):
+                if start >= covered:
+                    offsets.append((start, -negative_end))
+                    covered = -negative_end
+
+            matches[skill] = SkillMatch(skill, len(offsets), offsets)
+
+        return matches
@@ -1,6 +1,33 @@
 import re
+from typing import Iterator
+
+from .sections import header_parts, match_header
+
+
+_DISALLOWED = re.compile(r'[^a-zA-Z0-9@., ]')
+_SPACES = re.compile(r' +')
+
+
+def clean_line(line: str) -> str:
+    return _SPACES.sub(' ', _DISALLOWED.sub(' ', line)).strip()
+
+
+def clean_lines(text: str) -> Iterator[str]:
+    # Line by line, so section headers stay on their own lines. Headers
+    # are matched before cleaning strips their separator, and come out
+    # as "Header: content" for segment() to split again
+    for line in text.splitlines():
+        found = match_header(line)
+
+        if found is not None and found[1]:
+            head, inline = header_parts(line)
+            line = f"{clean_line(head)}: {clean_line(inline)}".rstrip(": ")
+        else:
+            line = clean_line(line)
+
+        if line:
+            yield line
+
 
 def clean_text(text: str) -> str:
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^a-zA-Z0-9@., ]', ' ', text)
-    return text.strip()
+    return "\n".join(clean_lines(text))
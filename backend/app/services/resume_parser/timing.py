@@ -0,0 +1,243 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+
+# 0 turns every stage() into a shared no-op
+TIMING_ENABLED = os.getenv("RESUME_TIMING", "1") != "0"
+
+# Histogram bucket upper bounds, milliseconds
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Document size tags: upper bounds of each bucket
+PAGE_BUCKETS = [1, 2, 4, 8, 16]
+TEXT_BUCKETS = [2000, 8000, 32000, 128000]
+
+# Slowest parses kept for inspection
+SLOW_LOG_SIZE = 20
+
+
+# ----------------------------
+# Per-Request Timer
+# ----------------------------
+
+class StageTimer:
+    """
+    Seconds spent per stage for one request, plus document tags
+    (pages, text_chars, ...). Repeated stages accumulate. Stages nest
+    ("parse" includes the worker's own stages), so their sum overstates
+    the request; wall_seconds() is the time actually taken.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.tags: Dict[str, object] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def wall_seconds(self) -> float:
+        # Until collect() exits, the time so far
+        return (self.finished or time.perf_counter()) - self.started
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def merge(self, exported: Dict) -> None:
+        for name, seconds in exported["stages"].items():
+            self.add(name, seconds)
+        self.tags.update(exported["tags"])
+
+    def export(self) -> Dict:
+        # Picklable form, sent back from parser worker processes
+        return {"stages": dict(self.stages), "tags": dict(self.tags)}
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.2f}"
+            for name, seconds in self.stages.items()
+        )
+
+
+_current: ContextVar[Optional[StageTimer]] = ContextVar("resume_stage_timer", default=None)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("timer", "name", "started")
+
+    def __init__(self, timer: StageTimer, name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def stage(name: str):
+    """
+    with stage("pdf_text"): ... records into the active timer, if any.
+    Without one (or with timing disabled) it is a shared no-op.
+    """
+
+    if not TIMING_ENABLED:
+        return NULL_STAGE
+
+    timer = _current.get()
+    if timer is None:
+        return NULL_STAGE
+
+    return _Stage(timer, name)
+
+
+def tag(**tags) -> None:
+    timer = _current.get() if TIMING_ENABLED else None
+    if timer is not None:
+        timer.tags.update(tags)
+
+
+def merge(exported: Optional[Dict]) -> None:
+    timer = _current.get() if TIMING_ENABLED else None
+    if timer is not None and exported:
+        timer.merge(exported)
+
+
+@contextmanager
+def collect() -> Iterator[Optional[StageTimer]]:
+    """
+    Makes a fresh timer active for the enclosed code; yields None when
+    timing is disabled.
+    """
+
+    if not TIMING_ENABLED:
+        yield None
+        return
+
+    timer = StageTimer()
+    token = _current.set(timer)
+
+    try:
+        yield timer
+    finally:
+        timer.finished = time.perf_counter()
+        _current.reset(token)
+
+
+# ----------------------------
+# Aggregated Histograms
+# ----------------------------
+
+def size_bucket(value: Optional[int], bounds: List[int]) -> str:
+    if value is None:
+        return "unknown"
+
+    index = bisect_left(bounds, value)
+    if index == len(bounds):
+        return f">{bounds[-1]}"
+
+    return f"<={bounds[index]}"
+
+
+class Histogram:
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def to_dict(self) -> Dict:
+        buckets = {f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class TimingMetrics:
+    """
+    Stage latency histograms keyed by (stage, page bucket, text bucket),
+    and the slowest parses seen so far, by wall time.
+    """
+
+    def __init__(self, slow_log_size: int = SLOW_LOG_SIZE):
+        self.slow_log_size = slow_log_size
+        self.histograms: Dict[tuple, Histogram] = {}
+        self.slowest: List[Dict] = []
+        self.lock = threading.Lock()
+
+    def record(self, timer: Optional[StageTimer]) -> None:
+        if timer is None or not timer.stages:
+            return
+
+        pages = size_bucket(timer.tags.get("pages"), PAGE_BUCKETS)
+        text = size_bucket(timer.tags.get("text_chars"), TEXT_BUCKETS)
+        wall_ms = timer.wall_seconds() * 1000
+
+        with self.lock:
+            for name, seconds in timer.stages.items():
+                key = (name, pages, text)
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram()
+                histogram.observe(seconds * 1000)
+
+            if len(self.slowest) < self.slow_log_size or wall_ms > self.slowest[-1]["wall_ms"]:
+                self.slowest.append({
+                    "wall_ms": round(wall_ms, 3),
+                    "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in timer.stages.items()},
+                    "tags": dict(timer.tags),
+                })
+                self.slowest.sort(key=lambda entry: entry["wall_ms"], reverse=True)
+                del self.slowest[self.slow_log_size:]
+
+    def reset(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+            self.slowest = []
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "enabled": TIMING_ENABLED,
+                "histograms": [
+                    {"stage": name, "pages": pages, "text_chars": text, **histogram.to_dict()}
+                    for (name, pages, text), histogram in sorted(self.histograms.items())
+                ],
+                "slowest": list(self.slowest),
+            }
+
+
+timing_metrics = TimingMetrics()
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+from app.services.resume_parser.pdf_backends import PdfSource
+
+
+MAX_UPLOAD_BYTES = int(os.getenv("RESUME_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Uploads up to this size stay in memory; bigger ones go to a temp file
+SPOOL_THRESHOLD = int(os.getenv("RESUME_SPOOL_BYTES", str(2 * 1024 * 1024)))
+
+UPLOAD_CHUNK = 64 * 1024
+
+# Room for multipart boundaries and the other form fields on top of the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def check_content_length(content_length: Optional[str], max_bytes: int = MAX_UPLOAD_BYTES) -> None:
+    """
+    Raises UploadTooLarge when a request's declared Content-Length cannot
+    fit an upload of max_bytes, before any of the body is read. Missing
+    or malformed headers pass; the chunked read still enforces the limit.
+    """
+
+    try:
+        length = int(content_length)
+    except (TypeError, ValueError):
+        return
+
+    if length > max_bytes + MULTIPART_OVERHEAD:
+        raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+
+
+class SpooledUpload:
+    """
+    An upload read in chunks, hashed on the way in and kept in memory up
+    to SPOOL_THRESHOLD. Past that it is written to a uniquely named temp
+    file, which close() removes.
+    """
+
+    def __init__(self, max_bytes: int = MAX_UPLOAD_BYTES, threshold: int = SPOOL_THRESHOLD):
+        self.max_bytes = max_bytes
+        self.threshold = threshold
+
+        self.size = 0
+        self.buffer = bytearray()
+        self.data = b""
+        self.temp_path: Optional[str] = None
+        self._temp_file = None
+        self._digest = hashlib.sha256()
+
+    @property
+    def digest(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def on_disk(self) -> bool:
+        return self._temp_file is not None
+
+    @property
+    def source(self) -> PdfSource:
+        return self.temp_path if self.temp_path else self.data
+
+    def getvalue(self) -> bytes:
+        if self.temp_path is None:
+            return self.data
+
+        with open(self.temp_path, "rb") as handle:
+            return handle.read()
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {self.max_bytes} bytes")
+
+        self._digest.update(chunk)
+
+        if self._temp_file is None and self.size > self.threshold:
+            self._temp_file = tempfile.NamedTemporaryFile(prefix="resume-", suffix=".pdf", delete=False)
+            self.temp_path = self._temp_file.name
+            self._temp_file.write(self.buffer)
+            self.buffer = bytearray()
+
+        if self._temp_file is not None:
+            self._temp_file.write(chunk)
+        else:
+            self.buffer += chunk
+
+    def finish(self) -> None:
+        if self._temp_file is not None:
+            self._temp_file.close()
+        else:
+            self.data = bytes(self.buffer)
+            self.buffer = bytearray()
+
+    def close(self) -> None:
+        if self._temp_file is not None:
+            self._temp_file.close()
+            self._temp_file = None
+
+        if self.temp_path is not None:
+            try:
+                os.unlink(self.temp_path)
+            except FileNotFoundError:
+                pass
+            self.temp_path = None
+
+        self.buffer = bytearray()
+        self.data = b""
+
+
+@asynccontextmanager
+async def receive_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> AsyncIterator[SpooledUpload]:
+    """
+    Reads file chunk by chunk without blocking the event loop: once the
+    upload spills past the spool threshold, temp file writes run on the
+    threadpool. Raises UploadTooLarge as soon as max_bytes is passed; any
+    temp file is gone when the block exits.
+    """
+
+    upload = SpooledUpload(max_bytes=max_bytes)
+
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK)
+            if not chunk:
+                break
+
+            if upload.on_disk or upload.size + len(chunk) > upload.threshold:
+                await run_in_threadpool(upload.write, chunk)
+            else:
+                upload.write(chunk)
+
+        await run_in_threadpool(upload.finish)
+        yield upload
+    finally:
+        await run_in_threadpool(upload.close)
+        await file.close()
@@ -0,0 +1,166 @@
+# skill_canonicalizer.py
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+
+# ----------------------------
+# Alias Table
+# ----------------------------
+# canonical skill -> other surface forms. Matching is case and
+# whitespace insensitive, so only spelling variants need listing. No job
+# titles ("data analyst"): in resume text they name a role, not a skill.
+
+SKILL_ALIASES = {
+    "machine learning": ["ml", "machine-learning"],
+    "deep learning": ["deep-learning"],
+    "artificial intelligence": ["ai"],
+    "nlp": ["natural language processing"],
+    "data science": ["data-science"],
+    "math": ["mathematics", "maths"],
+    "statistics": ["stats", "statistical analysis"],
+    "programming": ["coding", "software programming"],
+    "data structures": ["dsa", "data structure", "data structures and algorithms"],
+    "algorithms": ["algorithm"],
+    "object oriented programming": ["oop", "oops", "object-oriented programming"],
+    "database management systems": ["dbms"],
+    "operating systems": ["operating system"],
+    "computer networks": ["computer networking"],
+    "security fundamentals": ["cybersecurity", "cyber security", "information security"],
+    "seo": ["search engine optimization", "search engine optimisation"],
+    "analytics": ["data analytics", "web analytics"],
+    "market analysis": ["market research"],
+
+    "javascript": ["java script", "ecmascript"],
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    "go": ["golang"],
+    "node.js": ["nodejs", "node js"],
+    "express.js": ["expressjs", "express js"],
+    "react": ["reactjs", "react.js", "react js"],
+    "vue": ["vuejs", "vue.js", "vue js"],
+    "angular": ["angularjs", "angular.js"],
+
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "hugging face": ["huggingface"],
+    "power bi": ["powerbi"],
+    "excel": ["ms excel", "microsoft excel"],
+
+    "postgresql": ["postgres"],
+    "mongodb": ["mongo"],
+    "kubernetes": ["k8s"],
+    "google cloud": ["gcp", "google cloud platform"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "ci/cd": ["cicd", "ci cd"],
+    "rest api": ["rest apis", "restful api", "restful apis"],
+}
+
+
+def normalize_skill(surface: str) -> str:
+    return " ".join(surface.lower().split())
+
+
+# ----------------------------
+# Trie
+# ----------------------------
+
+_END = ""
+
+
+class SkillTrie:
+    """
+    Character trie over normalized surface forms; lookups are O(length).
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, key: str, value: int) -> None:
+        node = self.root
+
+        for char in key:
+            node = node.setdefault(char, {})
+
+        node[_END] = value
+
+    def get(self, key: str) -> Optional[int]:
+        node = self.root
+
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+
+        return node.get(_END)
+
+
+# ----------------------------
+# Canonicalizer
+# ----------------------------
+
+class SkillCanonicalizer:
+    """
+    Maps any known surface form of a skill to its canonical ID and name.
+    Unknown skills pass through in normalized form.
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        self.aliases = aliases
+        self.names = []
+        self.trie = SkillTrie()
+
+        for canonical, surfaces in aliases.items():
+            canonical = normalize_skill(canonical)
+            skill_id = len(self.names)
+            self.names.append(canonical)
+
+            self.trie.insert(canonical, skill_id)
+            for surface in surfaces:
+                self.trie.insert(normalize_skill(surface), skill_id)
+
+        payload = json.dumps(aliases, sort_keys=True).encode("utf-8")
+        self.version = hashlib.sha256(payload).hexdigest()[:12]
+
+    def skill_id(self, surface: str) -> Optional[int]:
+        return self.trie.get(normalize_skill(surface))
+
+    def canonical(self, surface: str) -> str:
+        normalized = normalize_skill(surface)
+        skill_id = self.trie.get(normalized)
+
+        if skill_id is None:
+            return normalized
+
+        return self.names[skill_id]
+
+    def canonical_set(self, surfaces: Iterable[str]) -> List[str]:
+        # Sorted and deduplicated; empty strings dropped
+        return sorted({
+            skill for skill in map(self.canonical, surfaces) if skill
+        })
+
+    def surface_forms(self) -> Dict[str, str]:
+        """
+        Every alias (not the canonical names themselves) -> canonical name.
+        """
+
+        return {
+            normalize_skill(surface): normalize_skill(canonical)
+            for canonical, surfaces in self.aliases.items()
+            for surface in surfaces
+        }
+
+
+skill_canonicalizer = SkillCanonicalizer(SKILL_ALIASES)
+
+
+def canonical_skill(surface: str) -> str:
+    return skill_canonicalizer.canonical(surface)
+
+
+def canonical_skills(surfaces: Iterable[str]) -> List[str]:
+    return skill_canonicalizer.canonical_set(surfaces)
@@ -0,0 +1,146 @@
+# job_match_bench.py
+#
+# python -m benchmarks.job_match_bench --resumes 50000 --jobs 1000 \
+#     --output results.json [--baseline baseline.json]
+
+import argparse
+import random
+import sys
+from typing import Dict, List
+
+from app.services.job_matching import DEFAULT_CHUNK_SIZE, DEFAULT_TOP_K, JobMatchMatrix
+from app.services.resume_parser.extractor import match_job_description
+from benchmarks.measure import (
+    DEFAULT_TOLERANCE,
+    build_report,
+    compare,
+    load_report,
+    peak_memory,
+    print_regressions,
+    print_results,
+    save_report,
+    summarize,
+    time_each
+)
+from benchmarks.synthetic import synthetic_catalog, synthetic_profiles
+
+
+CASES = ["matrix_build", "top_jobs", "top_candidates", "pairwise_loop"]
+
+
+def check_scores(matrix: JobMatchMatrix, resumes: List[List[str]], jobs: List[List[str]], samples: int, seed: int) -> int:
+    """
+    Number of sampled (resume, job) pairs whose matrix score differs
+    from match_job_description.
+    """
+
+    rng = random.Random(seed)
+    mismatches = 0
+
+    for _ in range(samples):
+        row, column = rng.randrange(len(resumes)), rng.randrange(len(jobs))
+        expected = match_job_description(resumes[row], jobs[column])["match_score"]
+        mismatches += int(matrix.scores[row, column]) != expected
+
+    return mismatches
+
+
+def bench(args: argparse.Namespace) -> List[Dict]:
+    resumes = [profile["skills"] for profile in synthetic_profiles(args.resumes, skills=args.skills, seed=args.seed)]
+    jobs = [career["required_skills"] for career in synthetic_catalog(args.jobs, skills=args.skills, seed=args.seed + 1)]
+
+    params = {"resumes": args.resumes, "jobs": args.jobs, "skills": args.skills, "top_k": args.top_k}
+    built = {}
+
+    def measured(case: str, fn) -> Dict:
+        latencies = time_each(lambda _: fn(), range(args.repeat))
+        peak = peak_memory(fn) if args.memory else None
+        return summarize(case, params, latencies, peak)
+
+    def build():
+        built["matrix"] = JobMatchMatrix(resumes, jobs, chunk_size=args.chunk_size)
+
+    results = []
+
+    if "matrix_build" in args.cases:
+        results.append(measured("matrix_build", build))
+
+    if "matrix" not in built:
+        build()
+
+    matrix = built["matrix"]
+
+    if "top_jobs" in args.cases:
+        results.append(measured("top_jobs", lambda: matrix.top_jobs(args.top_k)))
+
+    if "top_candidates" in args.cases:
+        results.append(measured("top_candidates", lambda: matrix.top_candidates(args.top_k)))
+
+    if "pairwise_loop" in args.cases:
+        # The per-pair Python path, on a sample: latency is per pair
+        rng = random.Random(args.seed)
+        pairs = [
+            (rng.randrange(len(resumes)), rng.randrange(len(jobs)))
+            for _ in range(args.samples)
+        ]
+        latencies = time_each(lambda pair: match_job_description(resumes[pair[0]], jobs[pair[1]]), pairs)
+        results.append(summarize("pairwise_loop", params, latencies, None))
+
+    mismatches = check_scores(matrix, resumes, jobs, args.samples, args.seed)
+    for result in results:
+        result["score_mismatches"] = mismatches
+
+    return results
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark resume x job match-score matrices.")
+    parser.add_argument("--resumes", type=int, default=50000)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--samples", type=int, default=20000,
+                        help="(resume, job) pairs checked against match_job_description")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-memory", dest="memory", action="store_false")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    results = bench(args)
+
+    print_results(results)
+    mismatches = results[0]["score_mismatches"] if results else 0
+    print(f"score mismatches vs match_job_description: {mismatches}/{args.samples}")
+
+    config = {
+        name: value for name, value in vars(args).items()
+        if name not in ("output", "baseline")
+    }
+    report = build_report("job_match", config, results)
+
+    if args.output:
+        save_report(report, args.output)
+
+    if mismatches:
+        return 1
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.tolerance)
+        print_regressions(regressions)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+# measure.py
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# A result regresses when p50, p99 or peak memory grows by more than this
+DEFAULT_TOLERANCE = 0.25
+
+
+# ----------------------------
+# Timing
+# ----------------------------
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    return float(np.percentile(samples, q))
+
+
+def time_each(fn: Callable, items: Iterable) -> List[float]:
+    """
+    Seconds spent in fn(item), per item.
+    """
+
+    latencies = []
+    clock = time.perf_counter
+
+    for item in items:
+        start = clock()
+        fn(item)
+        latencies.append(clock() - start)
+
+    return latencies
+
+
+def time_stream(stream: Iterable) -> List[float]:
+    """
+    Seconds between consecutive items of a generator, for batch paths
+    where work happens as results are pulled.
+    """
+
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+
+    for _ in stream:
+        now = clock()
+        latencies.append(now - start)
+        start = now
+
+    return latencies
+
+
+def peak_memory(fn: Callable) -> int:
+    """
+    Peak bytes allocated by Python and NumPy while fn() runs.
+    """
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+# ----------------------------
+# Results
+# ----------------------------
+
+def summarize(case: str, params: Dict, latencies: List[float], peak_bytes: Optional[int]) -> Dict:
+    total = sum(latencies)
+
+    return {
+        "case": case,
+        "params": params,
+        "samples": len(latencies),
+        "total_seconds": round(total, 6),
+        "throughput_per_second": round(len(latencies) / total, 2) if total > 0 else None,
+        "mean_ms": round(total / len(latencies) * 1000, 4) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "peak_memory_bytes": peak_bytes,
+    }
+
+
+def result_key(result: Dict) -> str:
+    params = ",".join(f"{name}={value}" for name, value in sorted(result["params"].items()))
+    return f"{result['case']}[{params}]"
+
+
+def environment() -> Dict:
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def build_report(suite: str, config: Dict, results: List[Dict]) -> Dict:
+    return {
+        "suite": suite,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "config": config,
+        "results": results,
+    }
+
+
+def save_report(report: Dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+
+
+def load_report(path: str) -> Dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+# ----------------------------
+# Baseline Comparison
+# ----------------------------
+
+def compare(report: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """
+    Results that got slower or bigger than the baseline by more than
+    tolerance. Cases missing from either side are ignored.
+    """
+
+    previous = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+
+    for result in report["results"]:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+
+        for metric in ("p50_ms", "p99_ms", "peak_memory_bytes"):
+            before, after = old.get(metric), result.get(metric)
+
+            if not before or after is None:
+                continue
+
+            ratio = after / before
+            if ratio > 1 + tolerance:
+                regressions.append({
+                    "case": result_key(result),
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": round(ratio, 3),
+                })
+
+    return regressions
+
+
+def print_results(results: List[Dict]) -> None:
+    width = max([len(result_key(result)) for result in results] + [4])
+    print(f"{'case':<{width}} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'peak MiB':>10}")
+
+    for result in results:
+        peak = result["peak_memory_bytes"]
+        peak = f"{peak / 2 ** 20:.2f}" if peak is not None else "-"
+        throughput = result["throughput_per_second"]
+
+        print(
+            f"{result_key(result):<{width}} "
+            f"{throughput if throughput is not None else '-':>12} "
+            f"{result['p50_ms']:>10} {result['p99_ms']:>10} {peak:>10}"
+        )
+
+
+def print_regressions(regressions: List[Dict]) -> None:
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['case']} {regression['metric']}: "
+            f"{regression['baseline']} -> {regression['current']} (x{regression['ratio']})"
+        )
@@ -0,0 +1,239 @@
+# parser_bench.py
+#
+# python -m benchmarks.parser_bench corpus/ [--backends pdfium pdfplumber] \
+#     --output results.json [--baseline baseline.json]
+#
+# python -m benchmarks.parser_bench --generate 100 --pages 1 2 4
+#
+# Per-stage throughput of parse_resume_file on a synthetic corpus, with
+# extraction accuracy checked against the generator's ground truth.
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from app.services.resume_parser import timing
+from app.services.resume_parser.pdf_backends import BACKENDS
+from app.services.resume_parser.resume_service import parse_resume_file
+from benchmarks.measure import (
+    DEFAULT_TOLERANCE,
+    build_report,
+    compare,
+    load_report,
+    peak_memory,
+    print_regressions,
+    print_results,
+    save_report,
+    summarize
+)
+from benchmarks.resume_corpus import MANIFEST_FILE, generate_corpus, load_manifest
+
+
+EXACT_FIELDS = ["name", "email", "phone", "education", "experience", "projects"]
+
+# Any accuracy metric dropping by more than this is a regression
+DEFAULT_ACCURACY_TOLERANCE = 0.001
+
+# Stages faster than this are timer noise; their latencies are not compared
+NOISE_FLOOR_MS = 0.05
+
+
+# ----------------------------
+# Accuracy
+# ----------------------------
+
+def score_accuracy(pairs: List[tuple]) -> Dict:
+    """
+    (parsed, truth) pairs -> per-field exact-match rates, skill
+    precision / recall and the rate of resumes with every field right.
+    """
+
+    exact = defaultdict(int)
+    found = expected = correct = 0
+    perfect = 0
+
+    for parsed, truth in pairs:
+        fields_right = True
+
+        for field in EXACT_FIELDS:
+            same = parsed.get(field) == truth[field]
+            exact[field] += same
+            fields_right = fields_right and same
+
+        parsed_skills, true_skills = set(parsed.get("skills", [])), set(truth["skills"])
+        found += len(parsed_skills)
+        expected += len(true_skills)
+        correct += len(parsed_skills & true_skills)
+
+        perfect += fields_right and parsed_skills == true_skills
+
+    total = len(pairs) or 1
+    accuracy = {f"{field}_exact": round(exact[field] / total, 4) for field in EXACT_FIELDS}
+    accuracy["skill_precision"] = round(correct / found, 4) if found else 1.0
+    accuracy["skill_recall"] = round(correct / expected, 4) if expected else 1.0
+    accuracy["all_fields_exact"] = round(perfect / total, 4)
+
+    return accuracy
+
+
+def compare_accuracy(report: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    previous = {
+        result["params"]["backend"]: result["accuracy"]
+        for result in baseline["results"]
+        if "accuracy" in result
+    }
+    regressions = []
+
+    for result in report["results"]:
+        old = previous.get(result["params"].get("backend")) if "accuracy" in result else None
+        if old is None:
+            continue
+
+        for metric, before in old.items():
+            after = result["accuracy"].get(metric)
+            if after is not None and before - after > tolerance:
+                regressions.append({
+                    "case": f"accuracy[{result['params']['backend']}]",
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": round(after / before, 3) if before else 0.0,
+                })
+
+    return regressions
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+
+def bench_backend(backend: str, corpus: str, manifest: List[Dict], args: argparse.Namespace) -> List[Dict]:
+    paths = [os.path.join(corpus, entry["file"]) for entry in manifest]
+    pages = sum(entry["pages"] for entry in manifest)
+
+    latencies = []
+    stage_latencies = defaultdict(list)
+    parsed = {}
+
+    started = time.perf_counter()
+
+    for _ in range(args.repeat):
+        for path in paths:
+            clock = time.perf_counter()
+
+            with timing.collect() as timer:
+                parsed[path] = parse_resume_file(path, backend)
+
+            latencies.append(time.perf_counter() - clock)
+
+            if timer is not None:
+                for name, seconds in timer.stages.items():
+                    stage_latencies[name].append(seconds)
+
+    elapsed = time.perf_counter() - started
+
+    peak = None
+    if args.memory:
+        peak = peak_memory(lambda: [parse_resume_file(path, backend) for path in paths])
+
+    params = {"backend": backend, "resumes": len(paths), "pages": pages}
+
+    result = summarize("parse_resume_file", params, latencies, peak)
+    result["resumes_per_second"] = round(len(latencies) / elapsed, 2) if elapsed else None
+    result["pages_per_second"] = round(pages * args.repeat / elapsed, 2) if elapsed else None
+    result["accuracy"] = score_accuracy([(parsed[path], entry) for path, entry in zip(paths, manifest)])
+
+    results = [result]
+    total = sum(latencies)
+
+    for name, samples in stage_latencies.items():
+        stage_result = summarize(f"stage.{name}", params, samples, None)
+        stage_result["share_of_parse"] = round(sum(samples) / total, 4) if total else None
+        stage_result["pages_per_second"] = round(pages * args.repeat / sum(samples), 2) if sum(samples) else None
+        results.append(stage_result)
+
+    return results
+
+
+def prepare_corpus(args: argparse.Namespace) -> str:
+    corpus = args.corpus
+
+    if corpus and os.path.exists(os.path.join(corpus, MANIFEST_FILE)):
+        return corpus
+
+    corpus = corpus or tempfile.mkdtemp(prefix="resume_corpus_")
+    generate_corpus(corpus, args.generate, args.pages, args.ordering, tuple(args.skill_density), args.seed)
+
+    return corpus
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the resume parser on a synthetic corpus.")
+    parser.add_argument("corpus", nargs="?",
+                        help="directory with manifest.jsonl; generated here if it has none")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-memory", dest="memory", action="store_false")
+
+    # Corpus generation, when needed
+    parser.add_argument("--generate", type=int, default=50, help="resumes to generate")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--ordering", choices=["standard", "shuffled"], default="shuffled")
+    parser.add_argument("--skill-density", type=float, nargs=2, default=[0.05, 0.25], metavar=("MIN", "MAX"))
+    parser.add_argument("--seed", type=int, default=7)
+
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--accuracy-tolerance", type=float, default=DEFAULT_ACCURACY_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    corpus = prepare_corpus(args)
+    manifest = load_manifest(corpus)
+
+    results = []
+    for backend in args.backends:
+        results.extend(bench_backend(backend, corpus, manifest, args))
+
+    print_results(results)
+    for result in results:
+        if "accuracy" in result:
+            print(
+                f"{result['params']['backend']:<12} resumes/s={result['resumes_per_second']} "
+                f"pages/s={result['pages_per_second']} accuracy: {result['accuracy']}"
+            )
+
+    config = {
+        name: value for name, value in vars(args).items()
+        if name not in ("output", "baseline")
+    }
+    report = build_report("parser", config, results)
+
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        baseline = load_report(args.baseline)
+        regressions = [
+            regression for regression in compare(report, baseline, args.tolerance)
+            if regression["metric"] == "peak_memory_bytes" or regression["baseline"] >= NOISE_FLOOR_MS
+        ]
+        regressions += compare_accuracy(report, baseline, args.accuracy_tolerance)
+        print_regressions(regressions)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
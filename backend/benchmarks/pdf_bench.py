@@ -0,0 +1,172 @@
+# pdf_bench.py
+#
+# python -m benchmarks.pdf_bench uploaded_resumes/ more.pdf \
+#     --output results.json [--baseline baseline.json]
+
+import argparse
+import difflib
+import os
+import sys
+from typing import Dict, List
+
+from app.services.resume_parser.extractor import extract_skills
+from app.services.resume_parser.pdf_backends import BACKENDS, get_backend
+from app.services.resume_parser.pdf_reader import join_pages, page_limit
+from benchmarks.measure import (
+    DEFAULT_TOLERANCE,
+    build_report,
+    compare,
+    load_report,
+    peak_memory,
+    print_regressions,
+    print_results,
+    save_report,
+    summarize,
+    time_each
+)
+
+
+REFERENCE_BACKEND = "pdfplumber"
+
+
+def find_pdfs(paths: List[str]) -> List[str]:
+    found = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                found.extend(
+                    os.path.join(root, name)
+                    for name in sorted(files)
+                    if name.lower().endswith(".pdf")
+                )
+        else:
+            found.append(path)
+
+    return found
+
+
+def read_document(backend: str, pdf_path: str, max_pages: int) -> List[str]:
+    pdf_backend = get_backend(backend)
+    end = page_limit(pdf_backend.page_count(pdf_path), max_pages)
+    return list(pdf_backend.pages(pdf_path, 0, end))
+
+
+# ----------------------------
+# Equivalence
+# ----------------------------
+
+def equivalence(pages: List[str], reference: List[str]) -> Dict:
+    """
+    How close a backend's output is to the reference backend's: exact
+    page matches, word-sequence similarity and extracted skills.
+    """
+
+    text, reference_text = join_pages(pages), join_pages(reference)
+
+    return {
+        "exact_pages": sum(page == expected for page, expected in zip(pages, reference)),
+        "word_similarity": difflib.SequenceMatcher(
+            None, text.split(), reference_text.split(), autojunk=False
+        ).ratio(),
+        "same_skills": set(extract_skills(text)) == set(extract_skills(reference_text)),
+    }
+
+
+def summarize_equivalence(checks: List[Dict], pages: int) -> Dict:
+    return {
+        "exact_page_rate": round(sum(check["exact_pages"] for check in checks) / pages, 4) if pages else None,
+        "mean_word_similarity": round(sum(check["word_similarity"] for check in checks) / len(checks), 4),
+        "same_skills_rate": round(sum(check["same_skills"] for check in checks) / len(checks), 4),
+    }
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+
+def bench_backend(backend: str, files: List[str], args: argparse.Namespace, reference: Dict[str, List[str]]) -> Dict:
+    outputs = {}
+
+    def read(pdf_path):
+        outputs[pdf_path] = read_document(backend, pdf_path, args.max_pages)
+
+    latencies = []
+    for _ in range(args.repeat):
+        latencies.extend(time_each(read, files))
+
+    peak = None
+    if args.memory:
+        peak = peak_memory(lambda: [read(pdf_path) for pdf_path in files])
+
+    pages = sum(len(outputs[pdf_path]) for pdf_path in files)
+    params = {"backend": backend, "files": len(files), "pages": pages, "max_pages": args.max_pages}
+
+    result = summarize("pdf_text", params, latencies, peak)
+    result["pages_per_second"] = round(pages * args.repeat / result["total_seconds"], 2) if result["total_seconds"] else None
+    result["equivalence"] = summarize_equivalence(
+        [equivalence(outputs[pdf_path], reference[pdf_path]) for pdf_path in files],
+        pages
+    )
+
+    return result
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare PDF text backends on the same files.")
+    parser.add_argument("paths", nargs="+", help="PDF files or directories")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--reference", choices=sorted(BACKENDS), default=REFERENCE_BACKEND,
+                        help="backend whose output counts as correct")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-pages", type=int, default=None)
+    parser.add_argument("--no-memory", dest="memory", action="store_false")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    files = find_pdfs(args.paths)
+    if not files:
+        print("no PDF files found")
+        return 1
+
+    reference = {
+        pdf_path: read_document(args.reference, pdf_path, args.max_pages)
+        for pdf_path in files
+    }
+
+    results = [bench_backend(backend, files, args, reference) for backend in args.backends]
+
+    print_results(results)
+    for result in results:
+        print(
+            f"{result['params']['backend']:<12} pages/s={result['pages_per_second']} "
+            f"vs {args.reference}: {result['equivalence']}"
+        )
+
+    config = {
+        name: value for name, value in vars(args).items()
+        if name not in ("output", "baseline")
+    }
+    report = build_report("pdf", config, results)
+
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.tolerance)
+        print_regressions(regressions)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
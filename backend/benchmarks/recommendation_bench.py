@@ -0,0 +1,228 @@
+# recommendation_bench.py
+#
+# python -m benchmarks.recommendation_bench --careers 10 1000 100000 \
+#     --output results.json [--baseline baseline.json]
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterable, List
+
+from app.services.career_catalog import CareerCatalog
+from app.services.catalog_snapshot import CatalogSnapshot, snapshot_holder
+from app.services.recommendation_cache import canonical_input, recommendation_cache
+from app.services.recommendation_engine import (
+    DEFAULT_BATCH_CHUNK,
+    DEFAULT_TOP_K,
+    analyze_career,
+    recommend_careers,
+    recommend_careers_batch,
+    score_career
+)
+from benchmarks.measure import (
+    DEFAULT_TOLERANCE,
+    build_report,
+    compare,
+    load_report,
+    peak_memory,
+    print_regressions,
+    print_results,
+    save_report,
+    summarize,
+    time_each,
+    time_stream
+)
+from benchmarks.synthetic import synthetic_catalog, synthetic_profiles
+
+
+CASES = [
+    "snapshot_build",
+    "score_career",
+    "analyze_career",
+    "recommend_single",
+    "recommend_cached",
+    "recommend_batch",
+    "top_k_index",
+    "top_k_bruteforce",
+]
+
+# Careers scored per profile in the score_career case
+SCORE_SAMPLE = 20
+
+
+# ----------------------------
+# Case Runners
+# ----------------------------
+
+def run_each(case: str, params: Dict, fn: Callable, items: List, memory: bool) -> Dict:
+    latencies = time_each(fn, items)
+
+    peak = None
+    if memory:
+        def run_all():
+            for item in items:
+                fn(item)
+        peak = peak_memory(run_all)
+
+    return summarize(case, params, latencies, peak)
+
+
+def run_stream(case: str, params: Dict, make_stream: Callable[[], Iterable], memory: bool) -> Dict:
+    latencies = time_stream(make_stream())
+
+    peak = None
+    if memory:
+        def drain():
+            for _ in make_stream():
+                pass
+        peak = peak_memory(drain)
+
+    return summarize(case, params, latencies, peak)
+
+
+def bench_catalog(size: int, args: argparse.Namespace) -> List[Dict]:
+    records = synthetic_catalog(size, skills=args.skills, interests=args.interests, seed=args.seed)
+    profiles = synthetic_profiles(args.profiles, skills=args.skills, interests=args.interests, seed=args.seed + 1)
+    canonical = [canonical_input(profile) for profile in profiles]
+
+    cases = set(args.cases)
+    results = []
+    base = {"careers": size, "skills": args.skills, "profiles": args.profiles}
+
+    def build():
+        return CatalogSnapshot(CareerCatalog.from_records(records), source="synthetic")
+
+    if "snapshot_build" in cases:
+        start = time.perf_counter()
+        snapshot = build()
+        elapsed = time.perf_counter() - start
+        peak = peak_memory(build) if args.memory else None
+        results.append(summarize("snapshot_build", {"careers": size, "skills": args.skills}, [elapsed], peak))
+    else:
+        snapshot = build()
+
+    # recommend_careers and the batch path read the published snapshot
+    snapshot_holder.publish(snapshot)
+
+    if "score_career" in cases:
+        rng = random.Random(args.seed)
+        pairs = [
+            (profile, records[rng.randrange(size)])
+            for profile in profiles
+            for _ in range(min(SCORE_SAMPLE, size))
+        ]
+        results.append(run_each(
+            "score_career", base,
+            lambda pair: score_career(*pair),
+            pairs, args.memory
+        ))
+
+    if "analyze_career" in cases:
+        best = [
+            (user_input, snapshot.catalog[snapshot.index.top_k(user_input, 1)[0]])
+            for user_input in canonical
+        ]
+        results.append(run_each(
+            "analyze_career", base,
+            lambda pair: analyze_career(*pair, plans=snapshot.plans),
+            best, args.memory
+        ))
+
+    for top_k in args.top_k:
+        params = dict(base, top_k=top_k)
+
+        if "recommend_single" in cases:
+            def uncached(profile, top_k=top_k):
+                recommendation_cache.clear()
+                return recommend_careers(profile, top_k)
+
+            results.append(run_each("recommend_single", params, uncached, profiles, args.memory))
+
+        if "recommend_cached" in cases:
+            for profile in profiles:
+                recommend_careers(profile, top_k)
+
+            results.append(run_each(
+                "recommend_cached", params,
+                lambda profile, top_k=top_k: recommend_careers(profile, top_k),
+                profiles, args.memory
+            ))
+
+        if "recommend_batch" in cases:
+            results.append(run_stream(
+                "recommend_batch", dict(params, chunk_size=args.chunk_size),
+                lambda top_k=top_k: recommend_careers_batch(profiles, top_k, args.chunk_size),
+                args.memory
+            ))
+
+        if "top_k_index" in cases:
+            results.append(run_each(
+                "top_k_index", params,
+                lambda user_input, top_k=top_k: snapshot.index.top_k(user_input, top_k),
+                canonical, args.memory
+            ))
+
+        if "top_k_bruteforce" in cases:
+            results.append(run_each(
+                "top_k_bruteforce", params,
+                lambda user_input, top_k=top_k: snapshot.matrix.top_k(user_input, top_k),
+                canonical, args.memory
+            ))
+
+    recommendation_cache.clear()
+    return results
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the recommendation engine on synthetic catalogs.")
+    parser.add_argument("--careers", type=int, nargs="+", default=[10, 1000, 10000, 100000])
+    parser.add_argument("--skills", type=int, default=2000, help="skill vocabulary size")
+    parser.add_argument("--interests", type=int, default=200, help="interest vocabulary size")
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--top-k", type=int, nargs="+", default=[DEFAULT_TOP_K, 10])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_BATCH_CHUNK)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc pass (halves run time)")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    results = []
+    for size in args.careers:
+        results.extend(bench_catalog(size, args))
+
+    config = {
+        name: value for name, value in vars(args).items()
+        if name not in ("output", "baseline")
+    }
+    report = build_report("recommendation", config, results)
+
+    print_results(results)
+
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.tolerance)
+        print_regressions(regressions)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# synthetic.py
+
+import random
+from typing import Dict, List
+
+
+CATEGORIES = [
+    "Technology", "Finance", "Healthcare", "Government",
+    "Design", "Business", "Education", "Engineering"
+]
+
+# Skill and interest popularity follows a Zipf-like curve, like real catalogs
+ZIPF_EXPONENT = 1.1
+
+
+def vocabulary(prefix: str, size: int) -> List[str]:
+    return [f"{prefix} {index}" for index in range(size)]
+
+
+def zipf_weights(size: int, exponent: float = ZIPF_EXPONENT) -> List[float]:
+    return [1.0 / (rank + 1) ** exponent for rank in range(size)]
+
+
+def sample_distinct(rng: random.Random, values: List[str], weights: List[float], count: int) -> List[str]:
+    count = min(count, len(values))
+    picked = {}
+
+    while len(picked) < count:
+        for value in rng.choices(values, weights=weights, k=count - len(picked)):
+            picked.setdefault(value, None)
+
+    return list(picked)
+
+
+# ----------------------------
+# Synthetic Catalog
+# ----------------------------
+
+def synthetic_catalog(
+    careers: int,
+    skills: int = 2000,
+    interests: int = 200,
+    seed: int = 7
+) -> List[Dict]:
+    """
+    Career dicts with the same schema as CAREER_DATABASE.
+    """
+
+    rng = random.Random(seed)
+
+    skill_names = vocabulary("skill", skills)
+    interest_names = vocabulary("interest", interests)
+    skill_weights = zipf_weights(skills)
+    interest_weights = zipf_weights(interests)
+
+    catalog = []
+    for index in range(careers):
+        required_skills = sample_distinct(rng, skill_names, skill_weights, rng.randint(3, 8))
+        related_interests = sample_distinct(rng, interest_names, interest_weights, rng.randint(2, 4))
+
+        catalog.append({
+            "name": f"Career {index}",
+            "category": rng.choice(CATEGORIES),
+            "required_skills": required_skills,
+            "core_strengths": ["problem solving", "communication"],
+            "related_interests": related_interests,
+
+            "growth_score": rng.randint(1, 10),
+            "stability_score": rng.randint(1, 10),
+            "market_demand": rng.randint(1, 10),
+            "risk_level": rng.randint(1, 10),
+            "average_salary_lpa": rng.randint(3, 40),
+
+            "future_scope": "Synthetic career used for benchmarking.",
+            "work_style": "Mixed",
+            "industry_trend": "Stable",
+
+            "learning_paths": {
+                skill: f"Course on {skill}"
+                for skill in required_skills[:2]
+            }
+        })
+
+    return catalog
+
+
+# ----------------------------
+# Synthetic Profiles
+# ----------------------------
+
+def synthetic_profiles(
+    count: int,
+    skills: int = 2000,
+    interests: int = 200,
+    seed: int = 11
+) -> List[Dict]:
+    """
+    recommend_careers inputs drawn from the same vocabularies as
+    synthetic_catalog.
+    """
+
+    rng = random.Random(seed)
+
+    skill_names = vocabulary("skill", skills)
+    interest_names = vocabulary("interest", interests)
+    skill_weights = zipf_weights(skills)
+    interest_weights = zipf_weights(interests)
+
+    return [
+        {
+            "skills": sample_distinct(rng, skill_names, skill_weights, rng.randint(2, 12)),
+            "interests": sample_distinct(rng, interest_names, interest_weights, rng.randint(1, 4)),
+            "career_mode": rng.choice(["growth", "stability"]),
+            "risk_preference": rng.choice(["low", "medium", "high"]),
+        }
+        for _ in range(count)
+    ]
@@ -0,0 +1,8 @@
+# Puts backend/ on sys.path, so tests import app and benchmarks when
+# pytest runs from here
+
+import os
+
+# app.database builds its engine from DATABASE_URL at import; tests that
+# touch the database bind their own sessions
+os.environ.setdefault("DATABASE_URL", "sqlite://")
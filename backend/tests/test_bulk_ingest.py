@@ -0,0 +1,104 @@
+import json
+import uuid
+
+import pytest
+
+from app.services.resume_parser import bulk_ingest
+from app.services.resume_parser.bulk_ingest import Checkpoint, JsonlWriter, ingest, parse_args
+from app.services.resume_parser.parse_pool import ParseTimeout
+
+
+class FakePool:
+    # Stands in for ParsePool: files containing "hang" time out
+    parsed = []
+
+    def __init__(self, workers, queue_size, timeout):
+        self.timeout = timeout
+
+    def parse(self, source, pdf_backend=None):
+        FakePool.parsed.append(source)
+        if b"hang" in source:
+            raise ParseTimeout(f"Resume parsing took longer than {self.timeout:g}s")
+        return {"skills": [], "text": source.decode()}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    FakePool.parsed = []
+    monkeypatch.setattr(bulk_ingest, "ParsePool", FakePool)
+
+    # Unique contents, so the in-memory parse cache never answers
+    run = uuid.uuid4().hex
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    for name in ["a", "b", "c"]:
+        (resumes / f"{name}.pdf").write_bytes(f"{name} {run}".encode())
+    (resumes / "hung.pdf").write_bytes(f"hang {run}".encode())
+
+    return resumes, tmp_path / "parsed.jsonl"
+
+
+def run(resumes, output, *extra):
+    return ingest(parse_args([str(resumes), "--output", str(output), "--workers", "2", *extra]))
+
+
+def sources_in(output):
+    return sorted(json.loads(line)["source"].rsplit("/", 1)[1] for line in output.read_text().splitlines())
+
+
+def test_a_hung_file_fails_without_stalling_the_run(corpus):
+    resumes, output = corpus
+
+    summary = run(resumes, output, "--timeout", "5").summary()
+
+    assert (summary["succeeded"], summary["failed"]) == (3, {"parse": 1})
+    assert sources_in(output) == ["a.pdf", "b.pdf", "c.pdf"]
+    failed = Checkpoint(f"{output}.checkpoint").failed
+    assert [(stage, error.split(":")[0]) for stage, error in failed.values()] == [("parse", "ParseTimeout")]
+
+
+def test_reruns_skip_checkpointed_sources_unless_retrying_failures(corpus):
+    resumes, output = corpus
+    run(resumes, output)
+    FakePool.parsed = []
+
+    assert run(resumes, output).summary()["skipped"] == 4
+    assert FakePool.parsed == []
+
+    summary = run(resumes, output, "--retry-failed").summary()
+    assert (summary["skipped"], summary["failed"]) == (3, {"parse": 1})
+    assert len(FakePool.parsed) == 1
+
+
+def test_output_without_checkpoint_lines_is_not_ingested_twice(corpus):
+    resumes, output = corpus
+    first = json.dumps({"source": str(resumes / "a.pdf"), "skills": []})
+    # A crash after the write but before the checkpoint, mid-way through the next record
+    output.write_text(first + "\n" + '{"source": "torn')
+
+    summary = run(resumes, output).summary()
+
+    assert (summary["succeeded"], summary["skipped"]) == (2, 1)
+    assert sources_in(output) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert str(resumes / "a.pdf") in Checkpoint(f"{output}.checkpoint").done
+
+
+def test_jsonl_writer_drops_a_torn_last_line(tmp_path):
+    path = tmp_path / "parsed.jsonl"
+    path.write_text('{"source": "a"}\n{"source": "b"}\n{"sou')
+
+    writer = JsonlWriter(str(path))
+    writer.write({"source": "c"})
+    writer.close()
+
+    assert writer.existing == {"a", "b"}
+    assert [json.loads(line)["source"] for line in path.read_text().splitlines()] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("flags", [["--workers", "0"], ["--timeout", "0"]])
+def test_parsing_needs_a_killable_worker_and_a_timeout(flags):
+    with pytest.raises(SystemExit):
+        parse_args(["resumes", "--output", "parsed.jsonl", *flags])
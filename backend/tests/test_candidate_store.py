@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Candidate, User
+from app.services import candidate_store, jwt_dependency
+from app.services.candidate_store import CandidateQuery, save_candidate, search_candidates
+from app.services.jwt_dependency import is_recruiter
+
+
+SKILLS = ["python", "sql", "java", "docker", "react"]
+CONTACT_FIELDS = {"name", "email", "phone"}
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'candidates.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(candidate_store, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def resume(name, skills):
+    return {"name": name, "email": f"{name}@example.com", "phone": "555-0100", "skills": skills}
+
+
+def all_pages(query, owner, limit=3, **options):
+    found, cursor = [], None
+
+    while True:
+        page = search_candidates(query, owner, limit=limit, cursor=cursor, **options)
+        found.extend(page["candidates"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return found
+
+
+def test_each_user_owns_their_copy_of_a_resume(sessions):
+    first = save_candidate(resume("ada", ["python"]), "digest", user_id=1)
+    second = save_candidate(resume("ada", ["python"]), "digest", user_id=2)
+
+    # Same user, same file: updated in place
+    assert save_candidate(resume("ada", ["python", "sql"]), "digest", user_id=1) == first
+    assert first != second
+
+    db = sessions()
+    owners = sorted((row.user_id, row.id) for row in db.query(Candidate))
+    db.close()
+    assert owners == [(1, first), (2, second)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_search_only_returns_the_owners_candidates(sessions, seed):
+    rng = random.Random(seed)
+    expected = {1: {}, 2: {}}
+
+    for index in range(40):
+        owner = rng.choice([1, 2])
+        skills = rng.sample(SKILLS, rng.randint(0, 3))
+        expected[owner][save_candidate(resume(f"c{index}", skills), f"digest-{index}", owner)] = set(skills)
+
+    query = CandidateQuery.parse(["python"], [], ["java"], ["sql", "docker"])
+
+    for owner, candidates in expected.items():
+        found = all_pages(query, owner)
+        assert sorted(hit["candidate_id"] for hit in found) == sorted(
+            candidate_id for candidate_id, skills in candidates.items() if query.matches(skills)
+        )
+
+    everyone = {**expected[1], **expected[2]}
+    assert len(all_pages(CandidateQuery.parse([], [], [], []), None, limit=7)) == len(everyone)
+
+
+def test_contact_details_only_when_asked_for(sessions):
+    save_candidate(resume("ada", ["python"]), "digest", user_id=1)
+    query = CandidateQuery.parse([], [], [], [])
+
+    hidden, = search_candidates(query, 1)["candidates"]
+    shown, = search_candidates(query, None, include_contact=True)["candidates"]
+
+    assert not CONTACT_FIELDS & set(hidden)
+    assert (shown["name"], shown["email"], shown["phone"]) == ("ada", "ada@example.com", "555-0100")
+
+
+def test_recruiters_and_admins_see_every_candidate(monkeypatch):
+    monkeypatch.setattr(jwt_dependency, "ADMIN_EMAILS", {"admin@example.com"})
+    monkeypatch.setattr(jwt_dependency, "RECRUITER_EMAILS", {"hr@example.com"})
+
+    assert is_recruiter(User(email="Admin@example.com"))
+    assert is_recruiter(User(email="hr@example.com"))
+    assert not is_recruiter(User(email="someone@example.com"))
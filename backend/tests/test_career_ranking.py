@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from app.services.career_database import CAREER_DATABASE
+from app.services.career_index import CareerIndex
+from app.services.career_matrix import CareerMatrix
+from app.services.recommendation_cache import canonical_input
+from app.services.recommendation_engine import score_career
+from benchmarks.synthetic import synthetic_catalog, synthetic_profiles
+
+
+RISKS = ["low", "medium", "high", "unknown"]
+MODES = ["growth", "stability", "other"]
+
+
+def reference_top_k(user_input, careers, k):
+    # score_career on every career, stable descending sort
+    totals = [score_career(user_input, career)["total_score"] for career in careers]
+    return sorted(range(len(careers)), key=lambda index: -totals[index])[:k]
+
+
+def builtin_profiles(count, seed=1):
+    rng = random.Random(seed)
+    skills = sorted({skill for career in CAREER_DATABASE for skill in career["required_skills"]})
+    interests = sorted({interest for career in CAREER_DATABASE for interest in career["related_interests"]})
+
+    return [
+        {
+            "skills": rng.sample(skills, rng.randint(0, 6)),
+            "interests": rng.sample(interests, rng.randint(0, 3)),
+            "career_mode": rng.choice(MODES),
+            "risk_preference": rng.choice(RISKS),
+        }
+        for _ in range(count)
+    ]
+
+
+def mixed_profiles(count, skills, interests, seed=3):
+    rng = random.Random(seed)
+    profiles = synthetic_profiles(count, skills=skills, interests=interests, seed=seed)
+
+    for profile in profiles:
+        profile["career_mode"] = rng.choice(MODES)
+        profile["risk_preference"] = rng.choice(RISKS)
+
+    return profiles
+
+
+@pytest.fixture(scope="module")
+def builtin():
+    matrix = CareerMatrix.from_careers(CAREER_DATABASE)
+    return matrix, CareerIndex(matrix)
+
+
+@pytest.fixture(scope="module")
+def synthetic():
+    careers = synthetic_catalog(1500, skills=250, interests=40)
+
+    # Duplicate skills must not count twice
+    for career in careers[:100]:
+        career["required_skills"] = career["required_skills"] + career["required_skills"][:1]
+
+    matrix = CareerMatrix.from_careers(careers)
+    return careers, matrix, CareerIndex(matrix)
+
+
+@pytest.mark.parametrize("profile", builtin_profiles(60))
+def test_breakdown_matches_score_career(builtin, profile):
+    matrix, _ = builtin
+    profile = canonical_input(profile)
+
+    for index, career in enumerate(CAREER_DATABASE):
+        breakdown = matrix.breakdown(profile, index)
+        expected = score_career(profile, career)
+
+        # Types too: 18 and 18.0 serialize differently
+        assert {key: (value, type(value)) for key, value in breakdown.items()} == {
+            key: (value, type(value)) for key, value in expected.items()
+        }
+
+
+@pytest.mark.parametrize("k", [1, 3, 10, len(CAREER_DATABASE)])
+def test_builtin_top_k_matches_score_career(builtin, k):
+    matrix, index = builtin
+
+    for profile in builtin_profiles(60, seed=k):
+        profile = canonical_input(profile)
+        expected = reference_top_k(profile, CAREER_DATABASE, k)
+
+        assert matrix.top_k(profile, k) == expected
+        assert index.top_k(profile, k) == expected
+
+
+@pytest.mark.parametrize("k", [1, 5, 10, 50])
+def test_synthetic_top_k_matches_score_career(synthetic, k):
+    careers, matrix, index = synthetic
+
+    for profile in mixed_profiles(25, skills=250, interests=40, seed=k):
+        profile = canonical_input(profile)
+        expected = reference_top_k(profile, careers, k)
+
+        assert matrix.top_k(profile, k) == expected
+        assert index.top_k(profile, k) == expected
+
+
+def test_empty_profile_ranks_by_static_score(synthetic):
+    careers, matrix, index = synthetic
+    profile = canonical_input({"skills": [], "interests": [], "career_mode": "growth", "risk_preference": "low"})
+
+    assert index.top_k(profile, 10) == reference_top_k(profile, careers, 10)
+    assert index.top_k(profile, 0) == []
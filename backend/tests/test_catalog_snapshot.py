@@ -0,0 +1,124 @@
+import json
+import os
+import time
+
+import pytest
+
+from app.services import catalog_snapshot
+from app.services.career_catalog import CATALOG_PATH_ENV
+from app.services.catalog_snapshot import (
+    CATALOG_ROOT_ENV,
+    STATE_DIR_ENV,
+    CatalogPathRejected,
+    SnapshotHolder,
+    get_snapshot,
+    pin_snapshot
+)
+from benchmarks.synthetic import synthetic_catalog
+
+
+def write_catalog(path, careers, version):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"version": version, "careers": synthetic_catalog(careers)}, handle)
+    return str(path)
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def holders():
+    created = []
+
+    def make():
+        holder = SnapshotHolder()
+        created.append(holder)
+        return holder
+
+    yield make
+
+    for holder in created:
+        holder.stop_watching()
+
+
+@pytest.fixture
+def catalogs(tmp_path, monkeypatch):
+    root = tmp_path / "catalogs"
+    root.mkdir()
+
+    default = write_catalog(root / "default.json", 20, "default")
+    other = write_catalog(root / "other.json", 30, "other")
+
+    monkeypatch.setenv(STATE_DIR_ENV, str(tmp_path / "state"))
+    monkeypatch.setenv(CATALOG_PATH_ENV, default)
+    monkeypatch.delenv(CATALOG_ROOT_ENV, raising=False)
+
+    return root, default, other
+
+
+def test_broadcast_reaches_other_workers(catalogs, holders):
+    _, _, other = catalogs
+    first, second = holders(), holders()
+    assert first.get().version == second.get().version == "default"
+
+    second.watch(0.02)
+    first.broadcast_reload(other)
+
+    assert wait_for(lambda: first.get().version == "other")
+    assert wait_for(lambda: second.get().version == "other")
+
+
+def test_restarted_worker_loads_broadcast_catalog(catalogs):
+    _, _, other = catalogs
+    SnapshotHolder().broadcast_reload(other)
+
+    restarted = SnapshotHolder()
+    assert restarted.get().version == "other"
+    assert restarted.source_path == other
+
+
+def test_paths_outside_catalog_root_are_rejected(catalogs, tmp_path):
+    outside = write_catalog(tmp_path / "outside.json", 5, "outside")
+    holder = SnapshotHolder()
+
+    with pytest.raises(CatalogPathRejected):
+        holder.broadcast_reload(outside)
+    with pytest.raises(CatalogPathRejected):
+        holder.reload(os.path.join(str(catalogs[0]), "..", "outside.json"))
+
+    assert catalog_snapshot.read_reload_request() is None
+
+
+def test_untrusted_request_file_is_ignored(catalogs):
+    _, _, other = catalogs
+    SnapshotHolder().broadcast_reload(other)
+
+    os.chmod(catalog_snapshot.reload_file(), 0o666)
+    assert catalog_snapshot.read_reload_request() is None
+    assert SnapshotHolder().get().version == "default"
+
+
+def test_source_change_reloads_and_pinned_requests_keep_their_snapshot(catalogs, holders):
+    _, default, _ = catalogs
+    holder = holders()
+    holder.watch(0.02)
+    before = holder.get()
+
+    catalog_snapshot.snapshot_holder, original = holder, catalog_snapshot.snapshot_holder
+    try:
+        with pin_snapshot() as pinned:
+            write_catalog(default, 25, "edited")
+            os.utime(default, (time.time() + 5, time.time() + 5))
+
+            assert wait_for(lambda: holder.get().version == "edited")
+            assert get_snapshot() is pinned is before
+
+        assert get_snapshot().version == "edited"
+    finally:
+        catalog_snapshot.snapshot_holder = original
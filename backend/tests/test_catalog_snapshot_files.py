@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+
+from app.services.career_catalog import (
+    SNAPSHOT_KEEP,
+    CareerCatalog,
+    load_snapshot,
+    save_snapshot,
+    snapshot_versions
+)
+from benchmarks.synthetic import synthetic_catalog
+
+
+def test_resave_leaves_mapped_snapshot_intact(tmp_path):
+    directory = str(tmp_path / "catalog")
+
+    first = CareerCatalog.from_records(synthetic_catalog(50, seed=1))
+    second = CareerCatalog.from_records(synthetic_catalog(80, seed=2))
+
+    save_snapshot(first, directory)
+    live = load_snapshot(directory)
+    before = np.array(live.numbers["market_demand"])
+
+    save_snapshot(second, directory)
+
+    # The mapped arrays still read the first version's files
+    assert len(live) == 50
+    assert np.array_equal(live.numbers["market_demand"], before)
+    assert load_snapshot(directory).version == second.version
+
+
+def test_old_versions_are_pruned(tmp_path):
+    directory = str(tmp_path / "catalog")
+    catalog = CareerCatalog.from_records(synthetic_catalog(10))
+
+    for _ in range(SNAPSHOT_KEEP + 3):
+        save_snapshot(catalog, directory)
+
+    assert os.path.islink(directory)
+    assert len(snapshot_versions(directory)) == SNAPSHOT_KEEP + 1
+
+
+def test_replaces_unversioned_snapshot_directory(tmp_path):
+    directory = str(tmp_path / "catalog")
+    os.makedirs(directory)
+
+    save_snapshot(CareerCatalog.from_records(synthetic_catalog(10)), directory)
+
+    assert os.path.islink(directory)
+    assert len(load_snapshot(directory)) == 10
@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.services import job_matching
+from app.services.job_matching import JobMatchMatrix, MatchTooLarge, check_match_size
+from app.services.resume_parser.extractor import SKILLS, match_job_description
+from app.services.skill_canonicalizer import skill_canonicalizer
+
+
+def skill_pool():
+    # Catalog skills, their aliases, case variants and a few unknowns
+    aliases = list(skill_canonicalizer.surface_forms())
+    return SKILLS + aliases + [skill.upper() for skill in SKILLS[:20]] + ["", "  ", "cobol", "fortran"]
+
+
+def random_groups(rng, count, pool, most):
+    return [rng.sample(pool, rng.randint(0, most)) for _ in range(count)]
+
+
+@pytest.fixture(scope="module")
+def groups():
+    rng = random.Random(5)
+    pool = skill_pool()
+
+    candidates = random_groups(rng, 150, pool, 15)
+    jobs = random_groups(rng, 40, pool, 10) + [[], [""], ["python", "Python", "python"]]
+
+    return candidates, jobs
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 2048])
+def test_scores_match_job_description(groups, chunk_size):
+    candidates, jobs = groups
+    matrix = JobMatchMatrix(candidates, jobs, chunk_size=chunk_size)
+
+    expected = np.array([
+        [match_job_description(candidate, job)["match_score"] for job in jobs]
+        for candidate in candidates
+    ])
+
+    assert matrix.shape == expected.shape
+    assert np.array_equal(matrix.scores, expected)
+
+
+def test_top_k_orders_by_score_then_index(groups):
+    candidates, jobs = groups
+    matrix = JobMatchMatrix(candidates, jobs)
+    k = 5
+
+    job_indexes, job_scores = matrix.top_jobs(k)
+    for row in range(len(candidates)):
+        expected = sorted(range(len(jobs)), key=lambda job: (-int(matrix.scores[row, job]), job))[:k]
+        assert job_indexes[row].tolist() == expected
+        assert job_scores[row].tolist() == matrix.scores[row, expected].tolist()
+
+    candidate_indexes, _ = matrix.top_candidates(k)
+    for column in range(len(jobs)):
+        expected = sorted(range(len(candidates)), key=lambda row: (-int(matrix.scores[row, column]), row))[:k]
+        assert candidate_indexes[column].tolist() == expected
+
+
+def test_details_match_job_description(groups):
+    candidates, jobs = groups
+    matrix = JobMatchMatrix(candidates, jobs)
+
+    details = matrix.details(3, 4)
+    expected = match_job_description(candidates[3], jobs[4])
+
+    assert details["match_score"] == expected["match_score"] == matrix.scores[3, 4]
+    assert sorted(details["matched_skills"]) == sorted(expected["matched_skills"])
+    assert sorted(details["missing_skills"]) == sorted(expected["missing_skills"])
+
+
+def test_match_size_caps(monkeypatch):
+    monkeypatch.setattr(job_matching, "MAX_MATCH_CANDIDATES", 100)
+    monkeypatch.setattr(job_matching, "MAX_MATCH_JOBS", 50)
+    monkeypatch.setattr(job_matching, "MAX_MATCH_PAIRS", 1000)
+
+    check_match_size(100, 10)
+    check_match_size(20, 50)
+
+    for candidates, jobs in [(101, 1), (1, 51), (40, 26)]:
+        with pytest.raises(MatchTooLarge):
+            check_match_size(candidates, jobs)
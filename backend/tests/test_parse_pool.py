@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.resume_parser import parse_pool as pool_module, resume_service
+from app.services.resume_parser.parse_pool import ParseFailed, ParsePool, ParseTimeout, PoolBusy
+
+
+class FakeWorker:
+    # Stands in for a worker process: "hang" times out, anything else parses
+    spawned = 0
+    spawn_error = None
+
+    def __init__(self, context):
+        if FakeWorker.spawn_error is not None:
+            raise FakeWorker.spawn_error
+        FakeWorker.spawned += 1
+        self.killed = False
+
+    def parse(self, source, pdf_backend, timeout):
+        if source == "hang":
+            raise ParseTimeout(f"Resume parsing took longer than {timeout:g}s")
+        if source == "slow":
+            time.sleep(0.2)
+        return {"source": source}
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeWorker.spawned = 0
+    FakeWorker.spawn_error = None
+    monkeypatch.setattr(pool_module, "ParseWorker", FakeWorker)
+    monkeypatch.setattr(pool_module, "IDLE_CHECK_SECONDS", 0.01)
+
+    pool = ParsePool(workers=2, queue_size=1, timeout=1)
+    yield pool
+    pool.close()
+
+
+def test_timeout_replaces_the_worker(pool):
+    with pytest.raises(ParseTimeout):
+        pool.parse("hang")
+
+    assert pool.parse("resume.pdf") == {"source": "resume.pdf"}
+    stats = pool.stats()
+    assert (stats["timeouts"], stats["restarts"], stats["live_workers"]) == (1, 1, 2)
+    assert FakeWorker.spawned == 3
+
+
+def test_failed_replacement_shrinks_the_pool(pool):
+    pool.start()
+    FakeWorker.spawn_error = OSError("out of memory")
+
+    with pytest.raises(ParseTimeout):
+        pool.parse("hang")
+
+    assert pool.stats()["live_workers"] == 1
+    assert pool.idle.qsize() == 1
+    assert pool.parse("resume.pdf") == {"source": "resume.pdf"}
+
+
+def test_pool_respawns_once_every_worker_is_lost(pool):
+    pool.start()
+    FakeWorker.spawn_error = OSError("out of memory")
+    for _ in range(2):
+        with pytest.raises(ParseTimeout):
+            pool.parse("hang")
+    assert pool.stats()["live_workers"] == 0
+
+    with pytest.raises(ParseFailed):
+        pool.parse("resume.pdf")
+
+    FakeWorker.spawn_error = None
+    assert pool.parse("resume.pdf") == {"source": "resume.pdf"}
+    assert pool.stats()["live_workers"] == 1
+
+
+def test_submissions_beyond_workers_and_queue_are_rejected(pool):
+    futures = [pool.submit("slow") for _ in range(3)]
+
+    with pytest.raises(PoolBusy):
+        pool.submit("slow")
+
+    assert [future.result()["source"] for future in futures] == ["slow"] * 3
+    assert pool.stats()["rejected"] == 1
+
+
+def test_inline_parses_run_one_at_a_time(monkeypatch):
+    running = []
+    overlap = threading.Event()
+
+    def parse_resume_file(source, pdf_backend=None):
+        running.append(source)
+        if len(running) > 1:
+            overlap.set()
+        time.sleep(0.05)
+        running.remove(source)
+        return {"source": source}
+
+    monkeypatch.setattr(resume_service, "parse_resume_file", parse_resume_file)
+    pool = ParsePool(workers=0)
+
+    async def parse_all():
+        return await asyncio.gather(*(pool.parse_async(f"{index}.pdf") for index in range(4)))
+
+    results = asyncio.run(parse_all())
+
+    assert [result["source"] for result in results] == [f"{index}.pdf" for index in range(4)]
+    assert not overlap.is_set()
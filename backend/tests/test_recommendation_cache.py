@@ -0,0 +1,89 @@
+from app.services import recommendation_cache as cache_module
+from app.services.recommendation_cache import (
+    RecommendationCache,
+    SQLiteCacheBackend,
+    cache_key,
+    canonical_input
+)
+
+
+def profile(skills, interests=("coding",), mode="growth", risk="medium"):
+    return {"skills": list(skills), "interests": list(interests), "career_mode": mode, "risk_preference": risk}
+
+
+class Clock:
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_equivalent_inputs_share_a_key():
+    first = canonical_input(profile(["ML", "Python", "python"], ["b", "a", "a"]))
+    second = canonical_input(profile(["python", "machine-learning"], ["a", "b"]))
+
+    assert cache_key(first, 5, "v1") == cache_key(second, 5, "v1")
+
+
+def test_key_depends_on_version_top_k_and_verbatim_fields():
+    base = canonical_input(profile(["python"]))
+
+    assert cache_key(base, 5, "v1") != cache_key(base, 5, "v2")
+    assert cache_key(base, 5, "v1") != cache_key(base, 6, "v1")
+    assert cache_key(base, 5, "v1") != cache_key(canonical_input(profile(["python"], risk="Medium")), 5, "v1")
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    cache = RecommendationCache(max_entries=2, ttl_seconds=10)
+
+    cache.set("a", "v1", {"value": "a"})
+    cache.set("b", "v1", {"value": "b"})
+    assert cache.get("a", "v1") == {"value": "a"}
+
+    # "b" is now least recently used
+    cache.set("c", "v1", {"value": "c"})
+    assert cache.get("b", "v1") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now += 11
+    assert cache.get("a", "v1") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_entries_are_scoped_to_their_catalog_version():
+    cache = RecommendationCache()
+    canonical = canonical_input(profile(["python"]))
+
+    cache.set(cache_key(canonical, 5, "v1"), "v1", {"value": 1})
+    assert cache.get(cache_key(canonical, 5, "v2"), "v2") is None
+
+    # Workers still on v1 keep their entries
+    assert cache.get(cache_key(canonical, 5, "v1"), "v1") == {"value": 1}
+    assert cache.stats()["version_changes"] == 2
+
+
+def test_shared_backend_between_processes(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    path = str(tmp_path / "cache.sqlite3")
+
+    writer = RecommendationCache(backend=SQLiteCacheBackend(path))
+    reader = RecommendationCache(backend=SQLiteCacheBackend(path))
+
+    writer.set("key", "v1", {"value": 1})
+    assert reader.get("key", "v1") == {"value": 1}
+    assert reader.stats()["shared_hits"] == 1
+
+    # A version change purges only expired rows, not other versions' live ones
+    writer.set("old", "v0", {"value": 0})
+    clock.now += 1
+    reader.get("other", "v2")
+    assert reader.backend.get("old", "v0") == {"value": 0}
+
+    clock.now += cache_module.CACHE_TTL_SECONDS + 1
+    reader.get("other", "v3")
+    assert reader.backend.get("old", "v0") is None
@@ -0,0 +1,126 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import ResumeJob
+from app.services import resume_jobs
+from app.services.resume_jobs import DONE, FAILED, QUEUED, RUNNING, ResumeJobWorker, dedupe_key
+from app.services.resume_parser.parse_pool import PoolBusy
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(resume_jobs, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def add_job(sessions, job_id="job", status=QUEUED, **fields):
+    db = sessions()
+    db.add(ResumeJob(id=job_id, status=status, content=b"%PDF", content_hash="digest", job_skills="[]", **fields))
+    db.commit()
+    db.close()
+
+
+def load_job(sessions, job_id="job"):
+    db = sessions()
+    job = db.query(ResumeJob).filter(ResumeJob.id == job_id).first()
+    db.close()
+    return job
+
+
+def test_a_job_is_claimed_once(sessions):
+    add_job(sessions)
+    first, second = ResumeJobWorker(threads=1), ResumeJobWorker(threads=1)
+
+    assert first.claim() == "job"
+    assert second.claim() is None
+
+    job = load_job(sessions)
+    assert job.status == RUNNING
+    assert job.heartbeat_at == job.started_at
+
+
+def test_requeue_follows_the_heartbeat_not_the_start(sessions):
+    long_ago = datetime.utcnow() - timedelta(minutes=10)
+    add_job(sessions, "waiting", status=RUNNING, started_at=long_ago, heartbeat_at=datetime.utcnow())
+    add_job(sessions, "orphaned", status=RUNNING, started_at=long_ago, heartbeat_at=long_ago)
+
+    assert ResumeJobWorker(stale_seconds=60).requeue_stale() == 1
+
+    assert load_job(sessions, "waiting").status == RUNNING
+    orphaned = load_job(sessions, "orphaned")
+    assert (orphaned.status, orphaned.started_at, orphaned.heartbeat_at) == (QUEUED, None, None)
+
+
+def test_heartbeat_advances_while_the_parse_waits(sessions, monkeypatch):
+    add_job(sessions)
+    worker = ResumeJobWorker(heartbeat_seconds=0.02)
+    worker.claim()
+    claimed_at = load_job(sessions).heartbeat_at
+
+    def process_resume(content, job_skills, pdf_backend, digest):
+        time.sleep(0.2)
+        return {"skills": []}
+
+    monkeypatch.setattr(resume_jobs, "process_resume", process_resume)
+    monkeypatch.setattr(resume_jobs, "save_candidate", lambda *args: None)
+
+    assert worker.process("job")
+    job = load_job(sessions)
+    assert job.status == DONE
+    assert job.heartbeat_at > claimed_at
+
+
+def test_candidate_store_errors_do_not_fail_the_job(sessions, monkeypatch):
+    add_job(sessions)
+    worker = ResumeJobWorker()
+    worker.claim()
+
+    def save_candidate(*args):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(resume_jobs, "process_resume", lambda *args: {"skills": ["python"]})
+    monkeypatch.setattr(resume_jobs, "save_candidate", save_candidate)
+
+    assert worker.process("job")
+    job = load_job(sessions)
+    assert (job.status, json.loads(job.result), job.content) == (DONE, {"skills": ["python"]}, None)
+
+
+def test_parse_errors_fail_the_job_and_busy_pools_requeue_it(sessions, monkeypatch):
+    add_job(sessions, "broken")
+    add_job(sessions, "busy")
+    worker = ResumeJobWorker(threads=1)
+
+    def process_resume(content, job_skills, pdf_backend, digest):
+        raise ValueError("not a PDF")
+
+    monkeypatch.setattr(resume_jobs, "process_resume", process_resume)
+    worker.claim()
+    assert worker.process("broken")
+    assert (load_job(sessions, "broken").status, load_job(sessions, "broken").error) == (FAILED, "not a PDF")
+
+    def busy(*args):
+        raise PoolBusy("Resume parser is at capacity")
+
+    monkeypatch.setattr(resume_jobs, "process_resume", busy)
+    worker.claim()
+    assert not worker.process("busy")
+    assert load_job(sessions, "busy").status == QUEUED
+
+
+def test_dedupe_key_changes_with_the_parser_version(monkeypatch):
+    key = dedupe_key("digest", None, ["Python"], 1)
+    assert key == dedupe_key("digest", None, ["python"], 1)
+
+    monkeypatch.setattr(resume_jobs, "PARSER_VERSION", "next")
+    assert dedupe_key("digest", None, ["python"], 1) != key
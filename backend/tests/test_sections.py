@@ -0,0 +1,89 @@
+import pytest
+
+from app.services.resume_parser.extractor import (
+    extract_education,
+    extract_experience,
+    extract_projects,
+    extract_skills
+)
+from app.services.resume_parser.sections import PREAMBLE, match_header, segment
+from app.services.resume_parser.text_cleaner import clean_lines, clean_text
+
+
+RESUME = """Priya Sharma
+priya.sharma@example.com | +91 98765 43210
+SUMMARY
+Curious builder who ships small tools
+Education - B.Tech in Electronics, Pune (2016-2020)
+Skills: Python, SQL; Docker
+Experience | Software Intern at Acme Labs, 2021
+Built internal reporting tools
+Work Experience:
+Junior Developer at Orbit Works, 2022
+PROJECTS
+Smart Attendance Tracker
+Built a tracker used by the operations team across three offices
+"""
+
+
+def sections_of(raw):
+    return [(section.name, section.lines) for section in segment(clean_text(raw)).sections]
+
+
+def test_segments_cleaned_resume():
+    assert sections_of(RESUME) == [
+        (PREAMBLE, ["Priya Sharma", "priya.sharma@example.com 91 98765 43210"]),
+        ("summary", ["Curious builder who ships small tools"]),
+        ("education", ["B.Tech in Electronics, Pune 2016 2020"]),
+        ("skills", ["Python, SQL Docker"]),
+        ("experience", ["Software Intern at Acme Labs, 2021", "Built internal reporting tools"]),
+        ("experience", ["Junior Developer at Orbit Works, 2022"]),
+        ("projects", [
+            "Smart Attendance Tracker",
+            "Built a tracker used by the operations team across three offices",
+        ]),
+    ]
+
+
+def test_extractors_read_cleaned_sections():
+    text = clean_text(RESUME)
+
+    assert extract_education(text) == ["B.Tech in Electronics, Pune 2016 2020"]
+    assert extract_experience(text) == [
+        "Software Intern at Acme Labs, 2021",
+        "Built internal reporting tools",
+        "Junior Developer at Orbit Works, 2022",
+    ]
+    assert extract_projects(text) == ["Smart Attendance Tracker"]
+    assert {"python", "sql", "docker"} <= set(extract_skills(text))
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Skills: Python", ("skills", "Python")),
+    ("Experience - Intern at X", ("experience", "Intern at X")),
+    ("Experience – Intern at X", ("experience", "Intern at X")),
+    ("EDUCATION", ("education", "")),
+    ("Technical Skills:", ("skills", "")),
+    ("  Projects  ", ("projects", "")),
+])
+def test_headers_survive_cleaning(raw, expected):
+    cleaned = list(clean_lines(raw))
+
+    assert len(cleaned) == 1
+    assert match_header(cleaned[0]) == expected
+
+
+@pytest.mark.parametrize("line", [
+    "Experience with cloud deployments and monitoring",
+    "Built the projects dashboard for the team",
+    "Python-based skills assessment tool",
+    "2019-2023",
+])
+def test_content_lines_are_not_headers(line):
+    assert all(match_header(cleaned) is None for cleaned in clean_lines(line))
+
+
+def test_cleaning_keeps_one_line_per_source_line():
+    raw = "Name\n\n  Education:   B.Sc\n*** \nSkills"
+
+    assert list(clean_lines(raw)) == ["Name", "Education: B.Sc", "Skills"]
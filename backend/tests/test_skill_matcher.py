@@ -0,0 +1,92 @@
+import random
+import re
+
+import pytest
+
+from app.services.resume_parser.extractor import SKILL_SURFACES, find_skills, skill_matcher
+from app.services.resume_parser.skill_matcher import SkillMatcher
+
+
+WHOLE_TOKENS = {
+    pattern for pattern, whole in zip(skill_matcher.patterns, skill_matcher.whole_tokens) if whole
+}
+
+
+FILLER = ["built", "a", "tool", "with", "team", "and", "the", "x", "data", "web", "2021"]
+SEPARATORS = [" ", ", ", ". ", "\n", " / ", "-", "_", "(", ")", ": ", "+", "#", ""]
+
+
+def regex_skills(text, surfaces=SKILL_SURFACES, whole_tokens=WHOLE_TOKENS):
+    # One re.search per surface, as extract_skills did before SkillMatcher;
+    # short aliases are compared against the text's tokens instead
+    text = text.lower()
+    tokens = {token.strip(".:!?'\"") for token in re.split(r"[\s,;/|()\[\]{}]+", text)}
+    return {
+        skill for surface, skill in surfaces.items()
+        if (surface in tokens if surface in whole_tokens else re.search(rf"\b{re.escape(surface)}\b", text))
+    }
+
+
+def random_text(rng, surfaces, tokens=40):
+    words = []
+
+    for _ in range(tokens):
+        word = rng.choice(surfaces) if rng.random() < 0.4 else rng.choice(FILLER)
+        if rng.random() < 0.3:
+            word = word.upper() if rng.random() < 0.5 else word.title()
+        words.append(word + rng.choice(SEPARATORS))
+
+    return "".join(words)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_regex_on_random_text(seed):
+    rng = random.Random(seed)
+    text = random_text(rng, sorted(SKILL_SURFACES))
+
+    assert set(find_skills(text)) == regex_skills(text)
+
+
+@pytest.mark.parametrize("text", [
+    "Languages: C++, C#, Java and JavaScript",
+    "node.js, react.js and next.js",
+    "python3 pythonic python_tools python",
+    "Machine Learning, deep learning and ML",
+    "SQL/NoSQL databases, MySQL",
+    "c++17 and c#.net",
+    "",
+])
+def test_matches_regex_on_edge_cases(text):
+    assert set(find_skills(text)) == regex_skills(text)
+
+
+def test_overlapping_surfaces_and_offsets():
+    surfaces = {"data": "data", "data structures": "data structures", "structures": "structures", "ds": "data structures"}
+    matcher = SkillMatcher(surfaces)
+    text = "Data Structures, data, DS and data structures"
+
+    found = matcher.find(text)
+
+    assert set(found) == regex_skills(text, surfaces, set())
+    assert found["data structures"].count == 3
+    assert found["data"].count == 3
+    for start, end in found["data structures"].offsets:
+        assert text.lower()[start:end] in surfaces
+
+
+def test_symbol_surfaces_follow_word_boundary_rule():
+    matcher = SkillMatcher({"c++": "c++", "go": "go"})
+
+    for text in ["c++ and go", "c++x", "gopher", "go!", "(go)", "c++"]:
+        assert set(matcher.find(text)) == regex_skills(text, {"c++": "c++", "go": "go"}, set())
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("AI/ML engineer", {"artificial intelligence", "machine learning"}),
+    ("Built (AI), shipped to k8s.", {"artificial intelligence", "kubernetes"}),
+    ("'ML' pipelines", {"machine learning"}),
+    ("ai-driven ml_ops via node.ai and main.cpp", set()),
+    ("Data Analyst at Acme", set()),
+])
+def test_short_aliases_match_whole_tokens_only(text, expected):
+    assert set(find_skills(text)) == expected
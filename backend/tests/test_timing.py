@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from app.services.resume_parser import timing
+from app.services.resume_parser.timing import TimingMetrics
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(timing, "TIMING_ENABLED", True)
+
+
+def test_slow_log_reports_wall_time_not_nested_stage_sums():
+    with timing.collect() as timer:
+        with timing.stage("parse"):
+            time.sleep(0.05)
+            # What a worker process sends back, nested inside "parse"
+            timing.merge({"stages": {"pdf_text": 0.03, "skills": 0.01}, "tags": {"pages": 1}})
+
+    metrics = TimingMetrics()
+    metrics.record(timer)
+    entry, = metrics.stats()["slowest"]
+
+    assert sum(entry["stages_ms"].values()) > entry["wall_ms"] + 30
+    assert entry["wall_ms"] >= 50
+    assert entry["wall_ms"] == round(timer.wall_seconds() * 1000, 3)
+
+
+def test_slow_log_keeps_the_slowest_by_wall_time():
+    metrics = TimingMetrics(slow_log_size=2)
+
+    for seconds in [0.01, 0.03, 0.02]:
+        with timing.collect() as timer:
+            with timing.stage("parse"):
+                time.sleep(seconds)
+        metrics.record(timer)
+
+    walls = [entry["wall_ms"] for entry in metrics.stats()["slowest"]]
+    assert len(walls) == 2 and walls[0] > walls[1] >= 20